@@ -0,0 +1,68 @@
+import os
+import sys
+import json
+import time
+import tempfile
+from src.game.state import GameState
+from src.utils.save_system import SaveSystem
+
+# Large-state benchmark for SaveSystem: full roster unlock flags plus a long
+# battle history, compared against the per-character cipher.
+
+def build_large_state(history_len):
+    state = GameState()
+    state.spirits_unlocked = [True] * 12
+    state.spirits_obtained = [True] * 12
+    state.char_unlocked = [True] * 6
+    state.char_party = [True] * 6
+    state.game_progress["roster_unlocked"] = [True] * len(state.digimon_database)
+    state.game_progress["history"] = [
+        {"enemy": i % 235, "win": i % 3 != 0, "level": 1 + i % 99, "steps": i * 100}
+        for i in range(history_len)
+    ]
+    return state
+
+def time_it(func, repeat):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best * 1000
+
+def main():
+    history_len = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    repeat = 5
+    state = build_large_state(history_len)
+    
+    fields = [json.dumps(v) for v in state.to_dict().values()]
+    payload = sum(len(f) for f in fields)
+    encrypted = [SaveSystem.encrypt_value(f) for f in fields]
+    
+    # Bit-compatibility check against the per-character cipher
+    for f, e in zip(fields, encrypted):
+        assert e == SaveSystem._encrypt_chars(f)
+        assert SaveSystem.decrypt_value(e) == SaveSystem._decrypt_chars(e) == f
+    
+    print(f"History entries: {history_len}, JSON payload: {payload} chars")
+    
+    old_enc = time_it(lambda: [SaveSystem._encrypt_chars(f) for f in fields], repeat)
+    new_enc = time_it(lambda: [SaveSystem.encrypt_value(f) for f in fields], repeat)
+    old_dec = time_it(lambda: [SaveSystem._decrypt_chars(e) for e in encrypted], repeat)
+    new_dec = time_it(lambda: [SaveSystem.decrypt_value(e) for e in encrypted], repeat)
+    print(f"encrypt: per-char {old_enc:8.2f} ms | bytes {new_enc:8.2f} ms | x{old_enc / new_enc:.1f}")
+    print(f"decrypt: per-char {old_dec:8.2f} ms | bytes {new_dec:8.2f} ms | x{old_dec / new_dec:.1f}")
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        SaveSystem.SAVE_FILE = os.path.join(tmp, "dtector_eu.dat")
+        save_ms = time_it(lambda: SaveSystem.save_game(state), repeat)
+        size = os.path.getsize(SaveSystem.SAVE_FILE)
+        load_ms = time_it(lambda: SaveSystem.load_game(GameState()), repeat)
+        legacy_ms = time_it(lambda: SaveSystem.save_game_legacy(state), repeat)
+        legacy_size = os.path.getsize(SaveSystem.SAVE_FILE)
+    print(f"save_game: {save_ms:8.2f} ms | load_game: {load_ms:8.2f} ms | file: {size} bytes")
+    print(f"legacy JSON save: {legacy_ms:8.2f} ms | file: {legacy_size} bytes")
+
+if __name__ == "__main__":
+    main()
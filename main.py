@@ -1,20 +1,64 @@
+import argparse
+import time
 import pygame
 import sys
 from src.engine.core import Engine
+from src.engine.resolution import NATIVE_SIZE
+from src.engine.recorder import InputRecorder, InputReplay
+
+def replay(path, fast):
+    """Plays back a recording: at recorded speed, or as fast as possible without rendering."""
+    recording = InputReplay(path)
+    if fast:
+        screen = pygame.Surface(NATIVE_SIZE)
+    else:
+        screen = pygame.display.set_mode(NATIVE_SIZE)
+    clock = pygame.time.Clock()
+    
+    # No autosave: a replay must not touch the save files
+    engine = Engine(screen, autosave=False)
+    recording.start_game(engine.game)
+    engine.apply_resolution() # The recording's config
+    
+    start = time.perf_counter()
+    ticks = 0
+    for delta_time, events in recording.frames():
+        if not fast:
+            clock.tick(60)
+            pygame.event.pump()
+        for event in events:
+            engine.handle_input(event)
+        engine.update(delta_time)
+        if not fast:
+            pygame.display.update(engine.draw())
+        ticks += 1
+    elapsed = time.perf_counter() - start
+    
+    result = "match" if recording.matches(engine.game) else "DIVERGED"
+    print(f"Replayed {ticks} ticks in {elapsed:.2f}s, final state: {result}")
+    engine.shutdown()
 
 def main():
+    parser = argparse.ArgumentParser(description="Digivice D-Tector Emulator")
+    parser.add_argument("--record", metavar="FILE", help="record the session's input to FILE")
+    parser.add_argument("--replay", metavar="FILE", help="play back a recorded session")
+    parser.add_argument("--fast", action="store_true", help="with --replay: max speed, no rendering")
+    args = parser.parse_args()
+    
     pygame.init()
     pygame.display.set_caption("Digivice D-Tector Emulator")
     
-    # Screen dimensions based on original or reasonable scale
-    # Original D-Tector screen is small (likely 30x32), we'll scale it up by 6
-    SCREEN_WIDTH = 180
-    SCREEN_HEIGHT = 192
+    if args.replay:
+        replay(args.replay, args.fast)
+        pygame.quit()
+        sys.exit()
     
-    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    # The engine resizes the window for config["resolution"]
+    screen = pygame.display.set_mode(NATIVE_SIZE)
     clock = pygame.time.Clock()
     
     engine = Engine(screen)
+    recorder = InputRecorder(engine.game) if args.record else None
     
     running = True
     while running:
@@ -24,13 +68,18 @@ def main():
             if event.type == pygame.QUIT:
                 running = False
             else:
+                if recorder:
+                    recorder.record_event(event)
                 engine.handle_input(event)
         
         engine.update(delta_time)
-        engine.draw()
-        
-        pygame.display.flip()
+        if recorder:
+            recorder.record_frame(delta_time)
+        pygame.display.update(engine.draw())
         
+    if recorder:
+        recorder.save(args.record, engine.game)
+    engine.shutdown()
     pygame.quit()
     sys.exit()
 
@@ -1,5 +1,6 @@
 import pygame
 import os
+from src.engine.lcd import to_indexed
 
 class AssetManager:
     def __init__(self, base_path):
@@ -20,13 +21,17 @@ class AssetManager:
             return None
             
         try:
-            image = pygame.image.load(path).convert_alpha()
+            image = self._load_image(path)
             self.sprites[name] = image
             return image
         except Exception as e:
             print(f"Error loading sprite {filename}: {e}")
             return None
 
+    def _load_image(self, path):
+        # Kept 8-bit (grey levels, see engine.lcd): the theme is applied when the screen is shown
+        return to_indexed(pygame.image.load(path).convert_alpha())
+
     def get_sprite(self, name):
         return self.sprites.get(name)
         
@@ -46,7 +51,7 @@ class AssetManager:
                 continue
                 
             try:
-                image = pygame.image.load(path).convert_alpha()
+                image = self._load_image(path)
                 frames.append(image)
             except Exception as e:
                 print(f"Error loading sprite {filename}: {e}")
@@ -116,7 +121,7 @@ class AssetManager:
         if os.path.exists(path):
             # Load as a single-frame animation for consistency with battle code
             try:
-                image = pygame.image.load(path).convert_alpha()
+                image = self._load_image(path)
                 self.sprites[f"digimon_{digimon_name}"] = [image]
             except Exception as e:
                 print(f"Error loading digimon sprite {filename}: {e}")
@@ -1,17 +1,101 @@
 import pygame
 from src.game.dtector import DtectorGame
+from src.engine.lcd import LcdDisplay
+from src.engine.resolution import NATIVE_SCALE, NATIVE_SIZE, SCALES, fit_scale, letterbox, window_size
+
+# Fast-forward speeds, cycled with TAB. INSTANT plays animations within a frame.
+INSTANT = 0
+TIME_SCALES = (1, 4, 16, INSTANT)
+TICK = 1 / 60 # One GML frame; alarms count these
+INSTANT_MAX_TICKS = 3600 # Per displayed frame
 
 class Engine:
-    def __init__(self, screen):
+    def __init__(self, screen, seed=None, autosave=True):
         self.screen = screen
-        self.game = DtectorGame()
+        self.lcd = LcdDisplay(NATIVE_SIZE, NATIVE_SCALE) # The game draws here, in grey levels
+        self.game = DtectorGame(seed=seed, autosave=autosave)
+        self.time_scale = 1
+        self.fullscreen = False
+        self.apply_resolution()
+        
+    def apply_resolution(self):
+        """
+        Sizes the output for config["resolution"], or to the largest scale
+        that fits the display when fullscreen (letterboxed). Only the final
+        upscale changes: sprites and the game's caches stay as they are.
+        """
+        scale = SCALES[self.game.state.config["resolution"] % len(SCALES)]
+        if self.screen is pygame.display.get_surface():
+            # Our own window (a headless replay draws to a plain surface)
+            if self.fullscreen:
+                self.screen = pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
+            else:
+                self.screen = pygame.display.set_mode(window_size(scale))
+        size = self.screen.get_size()
+        scale = fit_scale(size) if self.fullscreen else min(scale, fit_scale(size))
+        self.lcd.set_output(scale, letterbox(scale, size))
+        
+    def cycle_resolution(self):
+        state = self.game.state
+        state.config["resolution"] = (state.config["resolution"] + 1) % len(SCALES)
+        state.mark_dirty("config")
+        if self.game.autosave:
+            self.game.autosave.request()
+        self.apply_resolution()
+        print(f"Resolution: {window_size(SCALES[state.config['resolution']])}")
+        
+    def set_time_scale(self, scale):
+        self.time_scale = scale
+        print(f"Time scale: {'instant' if scale == INSTANT else f'{scale}x'}")
+        
+    def shutdown(self):
+        if self.game.autosave:
+            self.game.suspend()
+        self.game.shutdown()
         
     def handle_input(self, event):
+        if event.type == pygame.APP_WILLENTERBACKGROUND and self.game.autosave:
+            # Device going to sleep: keep the exact session (mid-battle included)
+            self.game.suspend()
+            return
+        if event.type == pygame.APP_DIDENTERFOREGROUND and self.game.autosave:
+            # Awake again: from now on the save and journal are newer than the suspend snapshot
+            self.game.discard_suspend()
+            return
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_TAB:
+            index = TIME_SCALES.index(self.time_scale)
+            self.set_time_scale(TIME_SCALES[(index + 1) % len(TIME_SCALES)])
+            return
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_F10:
+            self.cycle_resolution()
+            return
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_F11:
+            self.fullscreen = not self.fullscreen
+            self.apply_resolution()
+            return
         self.game.handle_input(event)
         
     def update(self, delta_time):
-        self.game.update(delta_time)
+        """
+        Runs the game at the current time scale. Faster speeds run several
+        normal-sized updates per displayed frame (so every alarm sequence
+        advances exactly as at 1x); only the last one gets drawn.
+        """
+        if self.time_scale == INSTANT:
+            # Whole animations in one frame, normal speed while waiting for input
+            ticks = 0
+            while self.game.is_animating() and ticks < INSTANT_MAX_TICKS:
+                self.game.update(TICK)
+                ticks += 1
+            if ticks == 0:
+                self.game.update(delta_time)
+            return
+            
+        for _ in range(self.time_scale):
+            self.game.update(delta_time)
         
     def draw(self):
-        self.screen.fill((0, 0, 0))  # Clear screen with black
-        self.game.draw(self.screen)
+        """Draws a frame. Returns the screen rects that changed, for pygame.display.update."""
+        dirty = self.game.draw(self.lcd.buffer)
+        return self.lcd.show(self.screen, self.game.lcd_theme(), dirty,
+                             grid=self.game.state.config["grid_enabled"])
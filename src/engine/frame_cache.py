@@ -0,0 +1,126 @@
+from collections import OrderedDict, deque
+import pygame
+from src.engine.lcd import blank_like
+
+_NOT_COMPOSED = object()
+
+# Ticks whose bounding box is more than this many times the area of their
+# sprites (e.g. spirits bursting to the screen edges) keep separate blits
+MAX_COMPOSITE_SPARSENESS = 2
+
+def _surface_bytes(surface):
+    return surface.get_width() * surface.get_height() * surface.get_bytesize()
+
+class CompositeSequence:
+    """
+    A bound timeline (see timeline.BoundTimeline) flattened to one surface
+    per tick. Ticks are composited the first time they are drawn (or ahead
+    of time by FrameCache.work); ticks with a single sprite reuse it, ticks
+    with identical draws share a surface and sparse ticks aren't merged.
+    """
+    def __init__(self, bound, cache):
+        self.ticks = bound.ticks
+        self.frames = [_NOT_COMPOSED] * len(self.ticks)
+        self.shared = {} # draws -> frame
+        self.next_tick = 0 # First tick not composited yet (for warming)
+        self.cache = cache # None once evicted
+        self.bytes = sum(_surface_bytes(surface) for surface in
+                         {id(s): s for draws in self.ticks for s, _, _ in draws}.values())
+
+    @property
+    def complete(self):
+        return self.next_tick >= len(self.ticks)
+
+    def _compose(self, counter):
+        # A frame is the (surface, x, y) blits left for the tick, usually one
+        frame = draws = self.ticks[counter]
+        if len(draws) > 1:
+            frame = self.shared.get(draws)
+            if frame is None:
+                frame = self.shared[draws] = self._composite(draws)
+        self.frames[counter] = frame
+        return frame
+
+    def _composite(self, draws):
+        left = min(x for _, x, _ in draws)
+        top = min(y for _, _, y in draws)
+        width = max(x + s.get_width() for s, x, _ in draws) - left
+        height = max(y + s.get_height() for s, _, y in draws) - top
+        if width * height > MAX_COMPOSITE_SPARSENESS * sum(s.get_width() * s.get_height() for s, _, _ in draws):
+            return draws
+        
+        surface = blank_like(draws[0][0], (width, height))
+        for s, x, y in draws:
+            surface.blit(s, (x - left, y - top))
+        size = _surface_bytes(surface)
+        self.bytes += size
+        if self.cache:
+            self.cache._grow(size)
+        return ((surface, left, top),)
+
+    def compose_next(self):
+        while self.next_tick < len(self.ticks) and self.frames[self.next_tick] is not _NOT_COMPOSED:
+            self.next_tick += 1
+        if self.next_tick < len(self.ticks):
+            self._compose(self.next_tick)
+            self.next_tick += 1
+
+    def draw(self, screen, counter, origin):
+        """Same as BoundTimeline.draw."""
+        if counter >= len(self.frames):
+            return
+        frame = self.frames[counter]
+        if frame is _NOT_COMPOSED:
+            frame = self._compose(counter)
+        ox, oy = origin
+        for surface, x, y in frame:
+            screen.blit(surface, (ox + x, oy + y))
+
+class FrameCache:
+    """
+    Composited animation sequences keyed by what makes a play look different
+    (enemy sprite, boss flag, spirit, character...). `build` callbacks return
+    a BoundTimeline, or None when the sprites aren't available. Least
+    recently used sequences are dropped once the cache holds max_bytes.
+    """
+    def __init__(self, max_bytes=32 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.sequences = OrderedDict() # key -> CompositeSequence or None
+        self.bytes = 0
+        self.pending = deque() # (key, build) to warm
+
+    def get(self, key, build):
+        if key in self.sequences:
+            self.sequences.move_to_end(key)
+            return self.sequences[key]
+        bound = build()
+        sequence = CompositeSequence(bound, self) if bound is not None else None
+        self.sequences[key] = sequence
+        if sequence:
+            self._grow(sequence.bytes)
+        return sequence
+
+    def warm(self, key, build):
+        """Queues a sequence to be composited by work()."""
+        if key not in self.sequences and all(key != k for k, _ in self.pending):
+            self.pending.append((key, build))
+
+    def work(self, budget=4):
+        """Composites up to `budget` queued frames. Call while the game is idle."""
+        while budget > 0 and self.pending:
+            key, build = self.pending[0]
+            sequence = self.get(key, build)
+            budget -= 1
+            if sequence is None or sequence.complete:
+                self.pending.popleft()
+            else:
+                sequence.compose_next()
+
+    def _grow(self, size):
+        self.bytes += size
+        # Drop least recently used sequences (never the newest one)
+        while self.bytes > self.max_bytes and len(self.sequences) > 1:
+            _, sequence = self.sequences.popitem(last=False)
+            if sequence:
+                self.bytes -= sequence.bytes
+                sequence.cache = None
@@ -1,4 +1,72 @@
 import pygame
+from operator import itemgetter
+from src.engine.lcd import blank_like
+
+# Draw layers for DrawBuffer, back to front
+LAYER_BACKGROUND = 0
+LAYER_SPRITES = 1
+LAYER_EFFECTS = 2
+LAYER_UI = 3
+
+class DrawBuffer:
+    """
+    Blits queued during a frame and submitted together with one
+    Surface.blits call, back to front by layer. Draws in the same layer
+    keep the order they were queued in.
+    The managers draw into it as if it were the screen: blit() takes the
+    same arguments as Surface.blit (plus a layer), fill() queues a solid
+    block on the background layer and the size getters are the screen's.
+    """
+    def __init__(self):
+        self.target = None # Screen of the frame being queued (see begin)
+        self.commands = []
+        self.fills = {} # (color, size) -> solid surface in the target's format
+        self.frame_commands = 0 # Blits submitted in the last frame
+        self.max_frame_commands = 0
+        
+    def begin(self, screen):
+        """Starts queueing a frame for `screen`."""
+        if self.target is None or self.target.get_bitsize() != screen.get_bitsize():
+            self.fills.clear()
+        self.target = screen
+        
+    def get_width(self):
+        return self.target.get_width()
+        
+    def get_height(self):
+        return self.target.get_height()
+        
+    def get_size(self):
+        return self.target.get_size()
+        
+    def get_rect(self, **kwargs):
+        return self.target.get_rect(**kwargs)
+        
+    def blit(self, surface, dest, area=None, special_flags=0, layer=LAYER_SPRITES):
+        self.commands.append((layer, surface, dest, area, special_flags))
+        
+    def fill(self, color, rect=None, layer=LAYER_BACKGROUND):
+        rect = pygame.Rect(rect) if rect is not None else self.target.get_rect()
+        key = (tuple(color), rect.size)
+        solid = self.fills.get(key)
+        if solid is None:
+            solid = pygame.Surface(rect.size, 0, self.target)
+            if self.target.get_bitsize() == 8:
+                solid.set_palette(self.target.get_palette())
+            solid.fill(color)
+            if len(self.fills) >= 16:
+                self.fills.clear()
+            self.fills[key] = solid
+        self.blit(solid, rect.topleft, layer=layer)
+        
+    def flush(self, screen):
+        commands = self.commands
+        if commands:
+            commands.sort(key=itemgetter(0)) # Stable: same-layer order is kept
+            screen.blits([command[1:] for command in commands], doreturn=False)
+        self.frame_commands = len(commands)
+        self.max_frame_commands = max(self.max_frame_commands, self.frame_commands)
+        self.commands = []
 
 class TextRenderer:
     def __init__(self, asset_manager):
@@ -17,20 +85,7 @@ class TextRenderer:
         current_x = x
         
         for char in text:
-            char_code = ord(char)
-            frame_index = -1
-            
-            # a-z: 97-122 -> 0-25
-            if 97 <= char_code <= 122:
-                frame_index = char_code - 97
-            # 0-9: 48-57 -> 26-35
-            elif 48 <= char_code <= 57:
-                frame_index = (char_code - 48) + 26
-            # Space: 32 -> skip
-            elif char_code == 32:
-                current_x += spacing * scale
-                continue
-                
+            frame_index = _font_glyph(char)
             if frame_index != -1 and frame_index < len(font_frames):
                 sprite = font_frames[frame_index]
                 if scale != 1:
@@ -41,6 +96,8 @@ import pygame
 class TextRenderer:
     def __init__(self, asset_manager):
         self.assets = asset_manager
+        self.numbers = {} # render_number cache
+        self.strips = {} # scrolling_text cache
         
     def draw_text(self, screen, text, x, y, scale=1, spacing=6):
         """
@@ -55,20 +112,7 @@ class TextRenderer:
         current_x = x
         
         for char in text:
-            char_code = ord(char)
-            frame_index = -1
-            
-            # a-z: 97-122 -> 0-25
-            if 97 <= char_code <= 122:
-                frame_index = char_code - 97
-            # 0-9: 48-57 -> 26-35
-            elif 48 <= char_code <= 57:
-                frame_index = (char_code - 48) + 26
-            # Space: 32 -> skip
-            elif char_code == 32:
-                current_x += spacing * scale
-                continue
-                
+            frame_index = _font_glyph(char)
             if frame_index != -1 and frame_index < len(font_frames):
                 sprite = font_frames[frame_index]
                 if scale != 1:
@@ -115,59 +159,96 @@ class TextRenderer:
                 # Handle non-digits if necessary (e.g. / or :)
                 pass
 
+    def render_number(self, number, sprite_name="numbers", scale=1, spacing=1):
+        """
+        draw_number onto a transparent surface of its own (cached), for
+        retained scenes. None if the digit sprites aren't loaded.
+        """
+        key = (number, sprite_name, scale, spacing)
+        if key not in self.numbers:
+            frames = self.assets.get_animation(sprite_name)
+            surface = None
+            if frames:
+                digit_width = max(frame.get_width() for frame in frames) * scale
+                digit_height = max(frame.get_height() for frame in frames) * scale
+                surface = blank_like(frames[0], (len(str(number)) * (digit_width + spacing * scale), digit_height))
+                self.draw_number(surface, number, 0, 0, sprite_name, scale, spacing)
+            self.numbers[key] = surface
+        return self.numbers[key]
+
     def draw_text_scrolling(self, screen, text, x, y, width, height, scroll_offset, scale=1, spacing=6):
         """
         Draws text with scrolling and clipping.
         x, y, width, height define the visible box.
         scroll_offset is the pixel amount to shift left.
         """
-        # Create a surface for the text box
-        box_surf = pygame.Surface((width, height), pygame.SRCALPHA)
-        
-        # Draw text onto the surface at -scroll_offset
-        # We use the existing draw_text logic but adapted for the surface
-        text = str(text).lower()
-        frames = self.assets.get_animation("font_dtector")
-        
-        if not frames:
-            return
+        strip = self.scrolling_text(text, scale, spacing)
+        if strip:
+            strip.draw(screen, x, y, width, height, scroll_offset)
 
-        char_width = 5 * scale # Approx width of font sprite (most are 5x7)
-        current_x = -scroll_offset
-        
-        # Mapping from char to frame index (same as draw_text)
-        # a-z: 0-25
-        # 0-9: 26-35
-        # space: -1 (skip)
-        # .: 36
-        # !: 37
+    def scrolling_text(self, text, scale=1, spacing=6):
+        """ScrollingText for `text` (cached). None if the font isn't loaded."""
+        key = (str(text), scale, spacing)
+        if key not in self.strips:
+            frames = self.assets.get_animation("font_dtector")
+            if not frames:
+                return None
+            if len(self.strips) >= 32:
+                self.strips.clear()
+            self.strips[key] = ScrollingText(text, frames, scale, spacing)
+        return self.strips[key]
+
+def _font_glyph(char):
+    """spr_font_dtector frame for a (lowercase) character, -1 for none (e.g. space)"""
+    code = ord(char)
+    if 97 <= code <= 122: # a-z: 0-25
+        return code - 97
+    elif 48 <= code <= 57: # 0-9: 26-35
+        return code - 48 + 26
+    elif char == ".":
+        return 36
+    elif char == "!":
+        return 37
+    return -1
+
+class ScrollingText:
+    """
+    A line of text rendered once into a strip surface. draw() blits the
+    window of it that a scrolling box shows, instead of rebuilding the box
+    glyph by glyph every frame.
+    """
+    def __init__(self, text, frames, scale=1, spacing=6):
+        text = str(text).lower()
+        stride = spacing * scale
+        self.width = len(text) * stride # Advance of the whole line
         
-        for char in text:
-            frame_idx = -1
-            code = ord(char)
-            
-            if 97 <= code <= 122: # a-z
-                frame_idx = code - 97
-            elif 48 <= code <= 57: # 0-9
-                frame_idx = code - 48 + 26
-            elif char == ".":
-                frame_idx = 36
-            elif char == "!":
-                frame_idx = 37
-            elif char == " ":
-                current_x += spacing * scale # Advance for space
-                continue
-                
+        glyphs = []
+        for i, char in enumerate(text):
+            frame_idx = _font_glyph(char)
             if frame_idx != -1 and frame_idx < len(frames):
                 sprite = frames[frame_idx]
-                scaled = pygame.transform.scale(sprite, 
-                    (int(sprite.get_width() * scale), int(sprite.get_height() * scale)))
-                
-                # Only draw if visible
-                if current_x + scaled.get_width() > 0 and current_x < width:
-                    box_surf.blit(scaled, (current_x, 0)) # y is 0 relative to box
-                
-            current_x += spacing * scale
-                
-        # Blit the box surface to the screen
-        screen.blit(box_surf, (x, y))
+                glyphs.append((pygame.transform.scale(sprite, 
+                    (int(sprite.get_width() * scale), int(sprite.get_height() * scale))), i * stride))
+        
+        strip_width = max([self.width] + [x + glyph.get_width() for glyph, x in glyphs])
+        strip_height = max([1] + [glyph.get_height() for glyph, _ in glyphs])
+        self.strip = blank_like(frames[0] if frames else None, (max(strip_width, 1), strip_height))
+        self.strip.blits([(glyph, (x, 0)) for glyph, x in glyphs], doreturn=False)
+
+    def draw(self, screen, x, y, width, height, scroll_offset):
+        """Same as TextRenderer.draw_text_scrolling, in one clipped blit."""
+        left = max(0, -int(scroll_offset)) # Box pixels before the text starts
+        if left < width:
+            screen.blit(self.strip, (x + left, y),
+                        pygame.Rect(max(0, int(scroll_offset)), 0, width - left, height))
+
+    def marquee(self, box_width, scroll=0, gap=0.5):
+        """
+        Drives a marquee over a box of box_width: the text comes in from the
+        right edge, leaves on the left and comes back gap * box_width later.
+        A generator: next() gives the scroll_offset at `scroll` pixels,
+        then send() the pixels moved since the last update for the next one.
+        """
+        limit = box_width + self.width + box_width * gap
+        while True:
+            scroll += (yield int(scroll) % limit - box_width)
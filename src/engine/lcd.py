@@ -0,0 +1,179 @@
+import numpy as np
+import pygame
+
+# Sprites and the frame buffer are 8-bit: indices 0-254 are grey levels
+# (black to white) and 255 is transparent. The D-Tector's colors are only
+# applied when the buffer is shown, by swapping in a theme palette.
+LEVELS = 255
+TRANSPARENT = 255
+BASE_PALETTE = [(round(i * 255 / (LEVELS - 1)),) * 3 for i in range(LEVELS)] + [(255, 0, 255)]
+
+# The ink color is dimmed to at most this fraction of the background's
+# luminance, so light device colors (Zoe, Tommy) stay readable
+MAX_INK_LUMINANCE = 0.35
+
+# Dot grid: the gaps between LCD pixels (their last row and column, 1 screen
+# pixel per 6 of scale) are shaded this far from the background to the ink.
+# Scales below MIN_GRID_SCALE are too small to show one.
+GRID_SHADE = 0.2
+MIN_GRID_SCALE = 3
+
+def gml_color(value):
+    """(r, g, b) of a GML color int (0xBBGGRR)."""
+    return (value & 0xFF, (value >> 8) & 0xFF, (value >> 16) & 0xFF)
+
+def _luminance(color):
+    r, g, b = color
+    return 0.299 * r + 0.587 * g + 0.114 * b
+
+def indexed_surface(size, transparent=True):
+    """Blank 8-bit surface with the grey level palette."""
+    surface = pygame.Surface(size, 0, 8)
+    surface.set_palette(BASE_PALETTE)
+    if transparent:
+        surface.fill(TRANSPARENT)
+        surface.set_colorkey(TRANSPARENT)
+    return surface
+
+def blank_like(sample, size):
+    """Transparent surface to composite `sample`-format sprites into (8-bit for indexed sprites)."""
+    if sample is not None and sample.get_bitsize() == 8:
+        return indexed_surface(size)
+    return pygame.Surface(size, pygame.SRCALPHA)
+
+def to_indexed(surface):
+    """
+    8-bit copy of a loaded sprite: each pixel becomes its grey level,
+    mostly transparent pixels become TRANSPARENT.
+    """
+    rgb = pygame.surfarray.array3d(surface).astype(np.float32)
+    indices = np.rint(rgb @ np.float32((0.299, 0.587, 0.114)) * ((LEVELS - 1) / 255)).astype(np.uint8)
+    if surface.get_flags() & pygame.SRCALPHA:
+        indices[pygame.surfarray.array_alpha(surface) < 128] = TRANSPARENT
+    indexed = indexed_surface(surface.get_size())
+    pygame.surfarray.blit_array(indexed, indices)
+    return indexed
+
+def theme_palette(colors, inverted=False):
+    """
+    Palette that shows the grey levels on a D-Tector's LCD. `colors` is its
+    config["colors"] entry: the LCD background, then the two device colors.
+    White shows the background and black the darker device color, with the
+    greys in between; `inverted` swaps them.
+    """
+    paper = gml_color(colors[0])
+    ink = min((gml_color(c) for c in colors[1:]), key=_luminance)
+    limit = MAX_INK_LUMINANCE * _luminance(paper)
+    if _luminance(ink) > limit:
+        ink = tuple(int(c * limit / _luminance(ink)) for c in ink)
+    if inverted:
+        paper, ink = ink, paper
+
+    palette = []
+    for level in range(LEVELS):
+        t = level / (LEVELS - 1)
+        palette.append(tuple(round(i + (p - i) * t) for i, p in zip(ink, paper)))
+    return palette + [BASE_PALETTE[TRANSPARENT]]
+
+def grid_overlay(size, scale, colors):
+    """
+    BLEND_MULT mask for a window of `size` showing LCD pixels of `scale`
+    screen pixels: white, with the dot grid's gaps tinted for the theme
+    `colors`. None if the scale is too small for a grid.
+    """
+    if scale < MIN_GRID_SCALE:
+        return None
+    palette = theme_palette(colors)
+    paper, ink = palette[LEVELS - 1], palette[0]
+    # Multiplying the background by this gives it shaded toward the ink
+    gap = tuple(min(255, round(255 * (p + (i - p) * GRID_SHADE) / max(p, 1))) for p, i in zip(paper, ink))
+    gap_width = max(1, scale // 6)
+
+    width, height = size
+    mask = pygame.Surface(size)
+    mask.fill((255, 255, 255))
+    for x in range(scale - gap_width, width, scale):
+        mask.fill(gap, (x, 0, gap_width, height))
+    for y in range(scale - gap_width, height, scale):
+        mask.fill(gap, (0, y, width, gap_width))
+    return mask
+
+class LcdDisplay:
+    """
+    The 8-bit frame buffer the game draws into, at `scale` screen pixels
+    per LCD pixel. show() scales it to the output rect (see set_output) in
+    a frame carrying the current theme's palette, so switching theme or
+    inverting the LCD is a palette swap, not a redraw, and changing the
+    output size leaves everything drawn into the buffer alone.
+    """
+    def __init__(self, size, scale):
+        self.buffer = indexed_surface(size, transparent=False)
+        self.scale = scale
+        self.palettes = {} # (colors, inverted) -> palette
+        self.grids = {} # (size, scale, colors) -> grid_overlay mask
+        self.output_scale = scale
+        self.output = self.buffer.get_rect() # Where the LCD is shown in the window
+        self.frame = None # The buffer at output size, in the theme's palette
+        self.frame_theme = None
+        self.shown = None # (theme, grid) of what the window shows
+
+    def set_output(self, scale, rect):
+        """
+        Shows LCD pixels as `scale` screen pixels (a multiple of the
+        buffer's) in the window rect `rect`; the rest of the window is black.
+        """
+        self.output_scale = scale
+        self.output = pygame.Rect(rect)
+        self.frame = None
+        self.shown = None
+
+    def show(self, window, theme, dirty=None, grid=False):
+        """
+        Copies the `dirty` rects of the buffer (None = all of it) to the
+        window as theme (colors, inverted), with the LCD dot grid over them
+        if `grid`. Returns the window rects updated.
+        """
+        full = dirty is None or (theme, grid) != self.shown
+        self.shown = (theme, grid)
+        if self.frame is None:
+            self.frame = pygame.Surface(self.output.size, 0, 8)
+            self.frame_theme = None
+        if theme != self.frame_theme:
+            palette = self.palettes.get(theme)
+            if palette is None:
+                palette = self.palettes[theme] = theme_palette(*theme)
+            self.frame.set_palette(palette)
+            self.frame_theme = theme
+
+        bounds = self.buffer.get_rect()
+        if full:
+            dirty = [bounds]
+            if self.output != window.get_rect():
+                window.fill((0, 0, 0)) # Letterbox
+        # Scaling copies the grey level indices, which the frame's palette shows in the theme
+        factor = self.output_scale // self.scale
+        areas = []
+        for rect in dirty:
+            rect = rect.clip(bounds)
+            if rect.width and rect.height:
+                area = pygame.Rect(rect.x * factor, rect.y * factor, rect.width * factor, rect.height * factor)
+                pygame.transform.scale(self.buffer.subsurface(rect), area.size, self.frame.subsurface(area))
+                areas.append(area)
+
+        ox, oy = self.output.topleft
+        mask = None
+        if grid:
+            key = (self.output.size, self.output_scale, theme[0])
+            if key not in self.grids:
+                self.grids[key] = grid_overlay(self.output.size, self.output_scale, theme[0])
+            mask = self.grids[key]
+        blits = []
+        for area in areas:
+            blits.append((self.frame, area.move(ox, oy), area))
+            if mask is not None:
+                # Right after its own copy, so overlapping rects aren't multiplied twice
+                blits.append((mask, area.move(ox, oy), area, pygame.BLEND_MULT))
+        window.blits(blits, doreturn=False)
+        if full:
+            return [window.get_rect()]
+        return [area.move(ox, oy) for area in areas]
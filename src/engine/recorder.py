@@ -0,0 +1,124 @@
+import json
+import struct
+import zlib
+from array import array
+import pygame
+from src.utils import snapshot
+
+# Recording file (little-endian):
+#   header : magic "DTRC", version (H), body length (I)
+#   body   : zlib of
+#            snapshot length (I) + snapshot.dumps() of the game at tick 0
+#            frame count (I) + one frame time per tick in ms (H)
+#            event count (I) + events: tick (I), type (H), key (i), mod (H)
+#            final state digest (I)
+# Version 1 digests covered the whole snapshot, version 2 all of it but
+# game_progress["journal_seq"] (both still readable).
+REC_MAGIC = b"DTRC"
+REC_VERSION = 3
+REC_HEADER = struct.Struct("<4sHI")
+COUNT = struct.Struct("<I")
+EVENT = struct.Struct("<IHiH")
+
+# Input events worth recording (the game only reacts to keys)
+RECORDED_EVENTS = (pygame.KEYDOWN, pygame.KEYUP)
+
+# Persistence bookkeeping rather than game state: replays run without a
+# journal, so these don't advance the way they did while recording
+DIGEST_SKIPPED_PROGRESS = ("journal_seq",)
+
+def state_digest(game_snapshot, version=REC_VERSION):
+    """
+    CRC32 of the gameplay state in a DtectorGame.snapshot(): progress, RNG
+    streams and the current screen. Equal digests = same game state. The
+    managers' own fields are left out, as drawing sets some of them (caches,
+    marquees) and a fast replay doesn't draw.
+    """
+    if version >= 2:
+        state = game_snapshot["state"]
+        progress = {k: v for k, v in state["game_progress"].items() if k not in DIGEST_SKIPPED_PROGRESS}
+        state = dict(state, game_progress=progress)
+        if version >= 3:
+            game_snapshot = {"state": state, "rng": game_snapshot["rng"],
+                             "screen": game_snapshot["game"]["current_state"]}
+        else:
+            game_snapshot = dict(game_snapshot, state=state)
+    return zlib.crc32(json.dumps(game_snapshot, sort_keys=True).encode("utf-8"))
+
+class InputRecorder:
+    """
+    Records a session as (tick, event) pairs plus each tick's frame time,
+    starting from a full snapshot of the game (RNG streams included), so a
+    replay doesn't depend on local save files.
+    """
+    def __init__(self, game):
+        self.start = game.snapshot()
+        self.frame_ms = array("H")
+        self.events = []
+
+    def record_event(self, event):
+        if event.type in RECORDED_EVENTS:
+            self.events.append((len(self.frame_ms), event.type, event.key, event.mod))
+
+    def record_frame(self, delta_time):
+        """Call once per frame, after that frame's events."""
+        self.frame_ms.append(min(int(round(delta_time * 1000)), 0xFFFF))
+
+    def save(self, path, game):
+        """Writes the recording; `game` is the game at the end of the session."""
+        start = snapshot.dumps(self.start)
+        parts = [COUNT.pack(len(start)), start,
+                 COUNT.pack(len(self.frame_ms)), self.frame_ms.tobytes(),
+                 COUNT.pack(len(self.events))]
+        parts.extend(EVENT.pack(*event) for event in self.events)
+        parts.append(COUNT.pack(state_digest(game.snapshot())))
+        body = zlib.compress(b"".join(parts), 9)
+        with open(path, "wb") as f:
+            f.write(REC_HEADER.pack(REC_MAGIC, REC_VERSION, len(body)) + body)
+
+class InputReplay:
+    """A recording loaded for playback (see InputRecorder)."""
+    def __init__(self, path):
+        with open(path, "rb") as f:
+            blob = f.read()
+        magic, version, length = REC_HEADER.unpack_from(blob)
+        if magic != REC_MAGIC or not 1 <= version <= REC_VERSION:
+            raise ValueError(f"Not a D-Tector input recording: {path}")
+        self.version = version
+        body = zlib.decompress(blob[REC_HEADER.size:REC_HEADER.size + length])
+
+        pos = 0
+        def take(size):
+            nonlocal pos
+            chunk = body[pos:pos + size]
+            pos += size
+            return chunk
+
+        start_len, = COUNT.unpack(take(COUNT.size))
+        self.start = snapshot.loads(take(start_len))
+        frame_count, = COUNT.unpack(take(COUNT.size))
+        self.frame_ms = array("H")
+        self.frame_ms.frombytes(take(frame_count * 2))
+        event_count, = COUNT.unpack(take(COUNT.size))
+        self.events = [EVENT.unpack(take(EVENT.size)) for _ in range(event_count)]
+        self.digest, = COUNT.unpack(take(COUNT.size))
+
+    def start_game(self, game):
+        """Puts the game in the recorded starting state."""
+        game.restore(self.start)
+
+    def frames(self):
+        """Yields (delta_time, events) per recorded tick."""
+        events = iter(self.events)
+        pending = next(events, None)
+        for tick, ms in enumerate(self.frame_ms):
+            frame_events = []
+            while pending is not None and pending[0] == tick:
+                _, ev_type, key, mod = pending
+                frame_events.append(pygame.event.Event(ev_type, key=key, mod=mod))
+                pending = next(events, None)
+            yield ms / 1000.0, frame_events
+
+    def matches(self, game):
+        """True if the game ended up exactly where the recorded session did."""
+        return state_digest(game.snapshot(), self.version) == self.digest
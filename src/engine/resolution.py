@@ -0,0 +1,28 @@
+import pygame
+
+# The D-Tector's LCD, in its own pixels
+LCD_WIDTH = 30
+LCD_HEIGHT = 32
+
+# The game draws every LCD pixel as NATIVE_SCALE screen pixels (menus place
+# text and numbers between LCD pixels), so output scales are multiples of it
+NATIVE_SCALE = 6
+NATIVE_SIZE = (LCD_WIDTH * NATIVE_SCALE, LCD_HEIGHT * NATIVE_SCALE)
+
+# config["resolution"] -> screen pixels per LCD pixel in a window
+SCALES = (6, 12, 18, 24)
+
+def window_size(scale):
+    """Size of a window showing the LCD at `scale`."""
+    return (LCD_WIDTH * scale, LCD_HEIGHT * scale)
+
+def fit_scale(size):
+    """Largest output scale that fits the LCD in a screen of `size` (NATIVE_SCALE at least)."""
+    fit = min(size[0] // LCD_WIDTH, size[1] // LCD_HEIGHT)
+    return max(NATIVE_SCALE, fit // NATIVE_SCALE * NATIVE_SCALE)
+
+def letterbox(scale, size):
+    """Rect of the LCD at `scale`, centered in a screen of `size`."""
+    rect = pygame.Rect((0, 0), window_size(scale))
+    rect.center = (size[0] // 2, size[1] // 2)
+    return rect
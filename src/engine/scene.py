@@ -0,0 +1,116 @@
+import pygame
+
+class SpriteNode:
+    """
+    One sprite in a Scene: frames[frame] at (x, y) screen pixels from the
+    scene origin, scaled by `scale` (None = the scene's) and flipped if
+    `flip`. Lower layers are drawn first.
+    """
+    def __init__(self, layer=0):
+        self.frames = None
+        self.frame = 0
+        self.x = 0
+        self.y = 0
+        self.flip = False
+        self.visible = False
+        self.layer = layer
+        self.scale = None
+        self.changed = True
+        self.drawn = None # Screen rect of the last render (None = not on screen)
+
+    def update(self, **fields):
+        for name, value in fields.items():
+            current = getattr(self, name)
+            if current is not value and current != value:
+                setattr(self, name, value)
+                self.changed = True
+
+class Scene:
+    """
+    Retained sprites for one screen. Each frame the owner calls begin(),
+    then place() for every sprite in draw order; placed sprites reuse the
+    nodes of the previous frame, so only nodes whose properties changed
+    get repainted. render() repaints those areas (background, then every
+    node overlapping them) and returns the screen rects that changed, for
+    pygame.display.update.
+    """
+    def __init__(self, scale=6, background=(255, 255, 255)):
+        self.scale = scale
+        self.background = background
+        self.origin = (0, 0)
+        self.nodes = []
+        self.cursor = 0
+        self.transforms = {} # (id(sprite), flip, scale) -> (sprite, transformed surface)
+        self.valid = False # The screen still shows the last render
+
+    def invalidate(self):
+        """Repaint everything on the next render (something else drew over the screen)."""
+        self.valid = False
+
+    def begin(self, origin):
+        if origin != self.origin:
+            self.origin = origin
+            self.valid = False
+        self.cursor = 0
+
+    def place(self, frames, frame, x, y, flip=False, layer=0, scale=None):
+        """Shows frames[frame] at (x, y) this frame."""
+        if self.cursor == len(self.nodes):
+            self.nodes.append(SpriteNode(layer))
+        node = self.nodes[self.cursor]
+        self.cursor += 1
+        node.update(frames=frames, frame=frame, x=x, y=y, flip=flip, visible=True, layer=layer, scale=scale)
+        return node
+
+    def _surface(self, node):
+        sprite = node.frames[node.frame]
+        scale = self.scale if node.scale is None else node.scale
+        key = (id(sprite), node.flip, scale)
+        cached = self.transforms.get(key)
+        if cached is None:
+            surface = pygame.transform.flip(sprite, True, False) if node.flip else sprite
+            if scale != 1:
+                surface = pygame.transform.scale(surface,
+                    (surface.get_width() * scale, surface.get_height() * scale))
+            cached = self.transforms[key] = (sprite, surface)
+        return cached[1]
+
+    def render(self, screen):
+        for node in self.nodes[self.cursor:]:
+            node.update(visible=False)
+
+        # (node, surface, position, rect) for every visible node, back to front
+        ox, oy = self.origin
+        shown = []
+        for node in sorted(self.nodes, key=lambda n: n.layer):
+            if node.visible:
+                surface = self._surface(node)
+                position = (ox + node.x, oy + node.y)
+                shown.append((node, surface, position, pygame.Rect(position, surface.get_size())))
+
+        if not self.valid:
+            screen.fill(self.background)
+            screen.blits([(surface, position) for _, surface, position, _ in shown], doreturn=False)
+            dirty = [screen.get_rect()]
+        else:
+            dirty = []
+            for node in self.nodes:
+                if node.changed and node.drawn:
+                    dirty.append(node.drawn)
+            dirty.extend(rect for node, _, _, rect in shown if node.changed)
+
+            clip = screen.get_clip()
+            for area in dirty:
+                screen.set_clip(area)
+                screen.fill(self.background, area)
+                screen.blits([(surface, position) for _, surface, position, rect in shown
+                              if rect.colliderect(area)], doreturn=False)
+            screen.set_clip(clip)
+
+        for node in self.nodes:
+            node.changed = False
+            node.drawn = None
+        for node, _, _, rect in shown:
+            node.drawn = rect
+        self.valid = True
+        return dirty
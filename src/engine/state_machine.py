@@ -0,0 +1,78 @@
+from enum import Enum
+
+class InvalidTransition(Exception):
+    """A state change that isn't in the owner's transition table."""
+    pass
+
+class StateEnum(str, Enum):
+    """
+    Base for state enums. Members are str subclasses equal to their name,
+    so a state stored on a manager is still plain data for snapshots.
+    """
+    def _generate_next_value_(name, start, count, last_values):
+        return name
+
+class StateHandler:
+    """Per-state behavior. Override what the state needs."""
+    def enter(self):
+        pass
+
+    def update(self, delta_time):
+        return None
+
+    def handle_input(self, event):
+        return None
+
+    def draw(self, screen):
+        pass
+
+    def is_animating(self):
+        return False
+
+    def scene(self):
+        """Retained Scene the state draws with (see DtectorGame.draw), or None."""
+        return None
+
+    def lcd_inverted(self):
+        """True while the state flashes the LCD inverted."""
+        return False
+
+class StateMachine:
+    """
+    Keeps `owner.<attr>` in one of a set of enum states and the matching
+    handler in `handler`, so the owner dispatches with a single call
+    instead of comparing strings. go() only allows the moves listed in
+    `transitions` (state -> states it may go to); anything else raises
+    InvalidTransition rather than leaving the owner in a dead state.
+    """
+    def __init__(self, owner, attr, handlers, transitions, initial):
+        incomplete = set(handlers) ^ set(transitions)
+        if incomplete:
+            raise InvalidTransition(f"States without a handler or transitions: {sorted(incomplete)}")
+        self.states = type(initial)
+        self.owner = owner
+        self.attr = attr
+        self.handlers = handlers
+        self.transitions = {state: frozenset(targets) for state, targets in transitions.items()}
+        self.reset(initial)
+
+    @property
+    def state(self):
+        return getattr(self.owner, self.attr)
+
+    def can_go(self, state):
+        return state in self.transitions[self.state]
+
+    def go(self, state):
+        current = self.state
+        if state not in self.transitions[current]:
+            raise InvalidTransition(f"{type(self.owner).__name__}: {current.name} -> {state.name}")
+        setattr(self.owner, self.attr, state)
+        self.handler = self.handlers[state]
+        self.handler.enter()
+
+    def reset(self, state):
+        """Jumps to `state` without checks or enter(), e.g. when restoring a snapshot."""
+        state = self.states(state) # Snapshots hold the plain string
+        setattr(self.owner, self.attr, state)
+        self.handler = self.handlers[state]
@@ -0,0 +1,84 @@
+from array import array
+from collections import namedtuple
+import pygame
+
+# One sprite drawn during a stage. x/y are GML pixels from the timeline's
+# origin on the stage's first tick; dx/dy move it each tick. parity 0/1 only
+# draws on even/odd counters (GML's `counter % 2` blinking), None on every
+# tick. flip mirrors the sprite around x, like a GML xscale of -1.
+Draw = namedtuple("Draw", "role frame x y dx dy parity flip", defaults=(0, 0, 0, 0, None, False))
+
+# `ticks` consecutive counter values, each held for `duration` GML frames
+Stage = namedtuple("Stage", "ticks duration draws", defaults=((),))
+
+class Timeline:
+    """
+    Keyframe animation compiled once into per-tick arrays: how long each
+    counter value is held and what it draws. Sprites are attached per
+    playback with bind(); the owner keeps counter/timer and calls step().
+    """
+    def __init__(self, stages):
+        self.durations = array("H")
+        ticks = []
+        for stage in stages:
+            for i in range(stage.ticks):
+                counter = len(self.durations)
+                self.durations.append(stage.duration)
+                ticks.append(tuple(
+                    (d.role, d.frame, d.x + d.dx * i, d.y + d.dy * i, d.flip)
+                    for d in stage.draws if d.parity is None or counter % 2 == d.parity
+                ))
+        self.ticks = tuple(ticks)
+        self.length = len(ticks)
+
+    def step(self, counter, timer, delta_time):
+        """
+        Runs the alarm for one update. Returns the new (counter, timer);
+        counter reaches self.length once the last tick has been held.
+        """
+        timer -= delta_time * 60
+        if timer <= 0:
+            counter += 1
+            timer = self.durations[counter] if counter < self.length else 0
+        return counter, timer
+
+    def bind(self, sprites, scale=6):
+        """sprites: role -> animation frames (None = role not drawn)."""
+        return BoundTimeline(self, sprites, scale)
+
+class BoundTimeline:
+    """A Timeline with every draw resolved to a scaled surface and offset."""
+    def __init__(self, timeline, sprites, scale):
+        surfaces = {}
+        def resolve(role, frame, flip):
+            key = (role, frame, flip)
+            if key not in surfaces:
+                frames = sprites.get(role)
+                surface = None
+                if frames:
+                    sprite = frames[frame % len(frames)]
+                    surface = pygame.transform.scale(sprite,
+                        (sprite.get_width() * scale, sprite.get_height() * scale))
+                    if flip:
+                        surface = pygame.transform.flip(surface, True, False)
+                surfaces[key] = surface
+            return surfaces[key]
+
+        ticks = []
+        for draws in timeline.ticks:
+            resolved = []
+            for role, frame, x, y, flip in draws:
+                surface = resolve(role, frame, flip)
+                if surface is not None:
+                    # Flipped sprites extend left of x
+                    resolved.append((surface, x * scale - (surface.get_width() if flip else 0), y * scale))
+            ticks.append(tuple(resolved))
+        self.ticks = tuple(ticks)
+
+    def draw(self, screen, counter, origin):
+        """Draws tick `counter` with the timeline's (0, 0) at `origin` (screen pixels)."""
+        if counter >= len(self.ticks):
+            return
+        ox, oy = origin
+        for surface, x, y in self.ticks[counter]:
+            screen.blit(surface, (ox + x, oy + y))
@@ -1,6 +1,38 @@
 import pygame
-import random
 import math
+import numpy as np
+from src.engine.scene import Scene
+
+# Stat used by each move: 0=Energy, 1=Crunch, 2=Ability (-1 = outclassed, no attack)
+MOVE_STATS = ("energy", "crunch", "ability")
+
+# Scanned 3-bit patterns with a fixed move; any other pattern picks at random
+SCAN_MOVES = {(1, 0, 1): 1, (1, 1, 0): 2, (1, 1, 1): 0, (1, 0, 0): 1}
+
+# BEATS[a, b]: move a beats move b (2 > 1 > 0 > 2)
+BEATS = np.array([
+    [False, False, True],
+    [True, False, False],
+    [False, True, False],
+])
+
+# Exchange outcomes (who takes the hit)
+PLAYER_HIT = -1
+DRAW = 0
+ENEMY_HIT = 1
+
+def resolve_exchange(mine_move, enemy_move, mine_val, enemy_val):
+    """
+    Rock-paper-scissors with stat tiebreak (obj_collision_dtector).
+    Works on scalars or arrays of moves/stat values; returns PLAYER_HIT,
+    DRAW or ENEMY_HIT for each exchange.
+    """
+    mine_move = np.asarray(mine_move)
+    enemy_move = np.asarray(enemy_move)
+    outcome = np.where(BEATS[mine_move % 3, enemy_move], ENEMY_HIT, PLAYER_HIT)
+    same = mine_move == enemy_move
+    outcome = np.where(same, np.sign(np.subtract(mine_val, enemy_val)), outcome)
+    return np.where(mine_move == -1, PLAYER_HIT, outcome)
 
 class AttackManager:
     """
@@ -31,6 +63,7 @@ class AttackManager:
         self.anim_stage = 0
         self.collision_sound_played = False
         self.damage_numbers = []
+        self.scene = Scene() # Retained sprites of the attack screen
         
     def start_scan(self):
         """Start the scan phase (called from BattleManager)"""
@@ -55,12 +88,8 @@ class AttackManager:
         # [1, 0, 0] -> 1
         # Default -> Random(0, 2, 1)
         
-        self.mine_move = random.choice([0, 2, 1])
-        
-        if scan_pattern == [1, 0, 1]: self.mine_move = 1
-        elif scan_pattern == [1, 1, 0]: self.mine_move = 2
-        elif scan_pattern == [1, 1, 1]: self.mine_move = 0
-        elif scan_pattern == [1, 0, 0]: self.mine_move = 1
+        self.mine_move = self.game.rng.choice("attack", [0, 2, 1])
+        self.mine_move = SCAN_MOVES.get(tuple(scan_pattern), self.mine_move)
         
         # Level difference check
         mine_level = self.game.state.game_progress["level"]
@@ -76,7 +105,7 @@ class AttackManager:
         # Determine Enemy Move (AI)
         # GML: global.enemy_move = filter_enemy_attack_dtector(global.enemy_move);
         # For now use random choice set in BattleManager or here
-        self.enemy_move = random.choice([0, 2, 1])
+        self.enemy_move = self.game.rng.choice("enemy", [0, 2, 1])
         
         # Play launch sound
         # audio_play_sound(sound_launch_attack, 0, false);
@@ -156,6 +185,11 @@ class AttackManager:
                     
         return None
 
+    @property
+    def flashing(self):
+        """True on the inverted half of the hit flash (blinks every 5 GML frames)."""
+        return self.active and self.phase == "HIT" and self.timer % 10 < 5
+
     def _resolve_combat_step_1(self):
         # Check for Draw condition
         # If stats equal and same move type -> Draw
@@ -168,44 +202,15 @@ class AttackManager:
         mine_stats = self._get_stats(True)
         enemy_stats = self._get_stats(False)
         
-        mine_val = 0
-        enemy_val = 0
-        
         # Get relevant stat based on move
-        if self.mine_move == 0: mine_val = mine_stats["energy"]
-        elif self.mine_move == 1: mine_val = mine_stats["crunch"]
-        elif self.mine_move == 2: mine_val = mine_stats["ability"]
+        mine_val = mine_stats[MOVE_STATS[self.mine_move]] if self.mine_move >= 0 else 0
+        enemy_val = enemy_stats[MOVE_STATS[self.enemy_move]]
         
-        if self.enemy_move == 0: enemy_val = enemy_stats["energy"]
-        elif self.enemy_move == 1: enemy_val = enemy_stats["crunch"]
-        elif self.enemy_move == 2: enemy_val = enemy_stats["ability"]
-        
-        # Rock Paper Scissors
-        # 2 > 1 > 0 > 2
-        
-        if self.mine_move == -1:
-            self.is_your_digimon_hit = True
-            return "HIT"
-            
-        if self.mine_move == self.enemy_move:
-            if mine_val == enemy_val:
-                return "DRAW"
-            elif mine_val > enemy_val:
-                self.is_your_digimon_hit = False
-                return "HIT"
-            else:
-                self.is_your_digimon_hit = True
-                return "HIT"
-        
-        # Different moves
-        if (self.mine_move == 2 and self.enemy_move == 1) or \
-           (self.mine_move == 1 and self.enemy_move == 0) or \
-           (self.mine_move == 0 and self.enemy_move == 2):
-            self.is_your_digimon_hit = False
-            return "HIT"
-        else:
-            self.is_your_digimon_hit = True
-            return "HIT"
+        outcome = int(resolve_exchange(self.mine_move, self.enemy_move, mine_val, enemy_val))
+        if outcome == DRAW:
+            return "DRAW"
+        self.is_your_digimon_hit = outcome == PLAYER_HIT
+        return "HIT"
 
     def _apply_damage(self):
         mine_stats = self._get_stats(True)
@@ -214,33 +219,25 @@ class AttackManager:
         damage = 0
         if self.is_your_digimon_hit:
             # Enemy hitting Player
-            if self.enemy_move == 0: damage = enemy_stats["energy"]
-            elif self.enemy_move == 1: damage = enemy_stats["crunch"]
-            elif self.enemy_move == 2: damage = enemy_stats["ability"]
+            damage = enemy_stats[MOVE_STATS[self.enemy_move]]
             
             # Special logic (Ancient/Boss) would go here
             
             self.battle.current_mine_hp = max(0, self.battle.current_mine_hp - damage)
             # Update global HP
-            self.game.state.game_progress["current_char_hp"] = self.battle.current_mine_hp
+            self.game.history.set_progress(current_char_hp=self.battle.current_mine_hp)
             
-            # Spawn Damage Number (Player Side)
-            cx = self.game.screen.get_width() // 2 - 50
-            cy = self.game.screen.get_height() // 2
-            self.damage_numbers.append(DamageNumber(damage, cx, cy))
+            # Spawn Damage Number (Player Side, relative to screen center)
+            self.damage_numbers.append(DamageNumber(damage, -50, 0))
             
         else:
             # Player hitting Enemy
-            if self.mine_move == 0: damage = mine_stats["energy"]
-            elif self.mine_move == 1: damage = mine_stats["crunch"]
-            elif self.mine_move == 2: damage = mine_stats["ability"]
+            damage = mine_stats[MOVE_STATS[self.mine_move]]
             
             self.battle.current_enemy_hp = max(0, self.battle.current_enemy_hp - damage)
             
-            # Spawn Damage Number (Enemy Side)
-            cx = self.game.screen.get_width() // 2 + 50
-            cy = self.game.screen.get_height() // 2
-            self.damage_numbers.append(DamageNumber(damage, cx, cy))
+            # Spawn Damage Number (Enemy Side, relative to screen center)
+            self.damage_numbers.append(DamageNumber(damage, 50, 0))
 
     def _get_stats(self, is_player):
         if is_player:
@@ -275,19 +272,14 @@ class AttackManager:
         scene_x = base_x - (15 * scale)
         scene_y = base_y - (16 * scale)
         
-        # Helper to draw sprite
-        def draw_sprite(sprite, x_offset, y_offset, flip=False, alpha=255):
-            if flip: sprite = pygame.transform.flip(sprite, True, False)
-            scaled = pygame.transform.scale(sprite, 
-                (sprite.get_width() * scale, sprite.get_height() * scale))
-            
-            pos_x = scene_x + (x_offset * scale)
-            pos_y = scene_y + (y_offset * scale)
-            
+        # Helper to draw sprite: places the next node of the retained scene
+        # (rendered by DtectorGame.draw, which repaints only what changed)
+        scene = self.scene
+        scene.begin((scene_x, scene_y))
+        def draw_sprite(frames, frame, x_offset, y_offset, flip=False):
             # Adjust for centering if needed, but GML uses top-left usually.
             # If we assume sprite origin is top-left.
-            
-            screen.blit(scaled, (pos_x, pos_y))
+            scene.place(frames, frame, x_offset * scale, y_offset * scale, flip)
 
         # Get Sprites
         mine_anim = self.game.assets.get_animation(f"digimon_{self.game.state.digimon_database[self.battle.mine_digimon]['sprite']}")
@@ -306,18 +298,18 @@ class AttackManager:
         # Player Draw
         if self.phase == "ATTACK_ANIM":
             if self.anim_stage == 0:
-                draw_sprite(mine_anim[0], 3, 4)
+                draw_sprite(mine_anim, 0, 3, 4)
             elif self.anim_stage == 1:
                 # Frame 0 but maybe offset? GML: if move==-1 draw normal, else draw frame 0 at x+3+4?
                 if self.mine_move == -1:
-                     draw_sprite(mine_anim[0], 3 + 24, 4) # Wait, this is enemy pos?
+                     draw_sprite(mine_anim, 0, 3 + 24, 4) # Wait, this is enemy pos?
                      # Logic check:
                      # if is_your_digimon:
                      #   if move == -1: draw at x+3+24 (Enemy side? No, maybe retreat?)
                      #   else: draw at x+3+4 (Forward)
-                     draw_sprite(mine_anim[0], 3 + 4, 4)
+                     draw_sprite(mine_anim, 0, 3 + 4, 4)
                 else:
-                    draw_sprite(mine_anim[0], 3 + 4, 4)
+                    draw_sprite(mine_anim, 0, 3 + 4, 4)
             elif self.anim_stage >= 2:
                 # Attack Frame
                 if self.mine_move == 0: # Energy
@@ -325,31 +317,31 @@ class AttackManager:
                     # fun_calculate_energy_dtector logic: returns index based on energy value.
                     # For now use frame 0.
                     if energy_anim:
-                        draw_sprite(energy_anim[0], 3 + 4 + self.move_position, 4)
-                    draw_sprite(mine_anim[1], 3 + 4, 4)
+                        draw_sprite(energy_anim, 0, 3 + 4 + self.move_position, 4)
+                    draw_sprite(mine_anim, 1, 3 + 4, 4)
                 elif self.mine_move == 2: # Ability
-                    draw_sprite(mine_anim[3], 3 + 4 + self.move_position, 4)
-                    draw_sprite(mine_anim[1], 3 + 4, 4)
+                    draw_sprite(mine_anim, 3, 3 + 4 + self.move_position, 4)
+                    draw_sprite(mine_anim, 1, 3 + 4, 4)
                 elif self.mine_move == 1: # Crunch
-                    draw_sprite(mine_anim[2], 3 + 4, 4)
+                    draw_sprite(mine_anim, 2, 3 + 4, 4)
                     # Trail effect
                     for pos in range(0, int(self.move_position * 4) + 1, 4):
-                         draw_sprite(mine_anim[2], 3 + 4 + pos, 4)
+                         draw_sprite(mine_anim, 2, 3 + 4 + pos, 4)
 
         elif self.phase == "PROJECTILE" or self.phase == "COLLISION":
              # Similar to anim_stage 2 but moving
              # Player
              if self.mine_move == 0:
                  if energy_anim:
-                     draw_sprite(energy_anim[0], 3 + 4 + self.move_position, 4)
-                 draw_sprite(mine_anim[1], 3 + 4, 4)
+                     draw_sprite(energy_anim, 0, 3 + 4 + self.move_position, 4)
+                 draw_sprite(mine_anim, 1, 3 + 4, 4)
              elif self.mine_move == 2:
-                 draw_sprite(mine_anim[3], 3 + 4 + self.move_position, 4)
-                 draw_sprite(mine_anim[1], 3 + 4, 4)
+                 draw_sprite(mine_anim, 3, 3 + 4 + self.move_position, 4)
+                 draw_sprite(mine_anim, 1, 3 + 4, 4)
              elif self.mine_move == 1:
-                 draw_sprite(mine_anim[2], 3 + 4, 4)
+                 draw_sprite(mine_anim, 2, 3 + 4, 4)
                  # Trail logic simplified
-                 draw_sprite(mine_anim[2], 3 + 4 + self.move_position, 4)
+                 draw_sprite(mine_anim, 2, 3 + 4 + self.move_position, 4)
 
         # Enemy Draw (Mirrored logic)
         # Enemy base x is x + 3 + 24 (27)
@@ -357,56 +349,41 @@ class AttackManager:
         
         if self.phase == "ATTACK_ANIM":
             if self.anim_stage == 0:
-                draw_sprite(enemy_anim[0], 27, 4, True)
+                draw_sprite(enemy_anim, 0, 27, 4, True)
             elif self.anim_stage == 1:
-                 draw_sprite(enemy_anim[0], 27 - 4, 4, True)
+                 draw_sprite(enemy_anim, 0, 27 - 4, 4, True)
             elif self.anim_stage >= 2:
                 if self.enemy_move == 0:
                     if energy_anim:
-                        draw_sprite(energy_anim[0], 27 - 4 - self.move_position, 4, True)
-                    draw_sprite(enemy_anim[1], 27 - 4, 4, True)
+                        draw_sprite(energy_anim, 0, 27 - 4 - self.move_position, 4, True)
+                    draw_sprite(enemy_anim, 1, 27 - 4, 4, True)
                 elif self.enemy_move == 2:
-                    draw_sprite(enemy_anim[3], 27 - 4 - self.move_position, 4, True)
-                    draw_sprite(enemy_anim[1], 27 - 4, 4, True)
+                    draw_sprite(enemy_anim, 3, 27 - 4 - self.move_position, 4, True)
+                    draw_sprite(enemy_anim, 1, 27 - 4, 4, True)
                 elif self.enemy_move == 1:
-                    draw_sprite(enemy_anim[2], 27 - 4, 4, True)
-                    draw_sprite(enemy_anim[2], 27 - 4 - self.move_position, 4, True)
+                    draw_sprite(enemy_anim, 2, 27 - 4, 4, True)
+                    draw_sprite(enemy_anim, 2, 27 - 4 - self.move_position, 4, True)
 
         elif self.phase == "PROJECTILE" or self.phase == "COLLISION":
              if self.enemy_move == 0:
                  if energy_anim:
-                     draw_sprite(energy_anim[0], 27 - 4 - self.move_position, 4, True)
-                 draw_sprite(enemy_anim[1], 27 - 4, 4, True)
+                     draw_sprite(energy_anim, 0, 27 - 4 - self.move_position, 4, True)
+                 draw_sprite(enemy_anim, 1, 27 - 4, 4, True)
              elif self.enemy_move == 2:
-                 draw_sprite(enemy_anim[3], 27 - 4 - self.move_position, 4, True)
-                 draw_sprite(enemy_anim[1], 27 - 4, 4, True)
+                 draw_sprite(enemy_anim, 3, 27 - 4 - self.move_position, 4, True)
+                 draw_sprite(enemy_anim, 1, 27 - 4, 4, True)
              elif self.enemy_move == 1:
-                 draw_sprite(enemy_anim[2], 27 - 4, 4, True)
-                 draw_sprite(enemy_anim[2], 27 - 4 - self.move_position, 4, True)
+                 draw_sprite(enemy_anim, 2, 27 - 4, 4, True)
+                 draw_sprite(enemy_anim, 2, 27 - 4 - self.move_position, 4, True)
 
         # Collision Effect
         if self.phase == "COLLISION":
             if self.move_position >= 15 and self.move_position <= 16:
                 # Draw collision spark
                 if collision_anim:
-                    draw_sprite(collision_anim[0], 15, 8) # Center-ish?
+                    draw_sprite(collision_anim, 0, 15, 8) # Center-ish?
                     
-        # Hit Effect
-        if self.phase == "HIT":
-            # Draw hit animation (Flash the hit digimon)
-            if self.timer % 10 < 5: # Blink effect
-                if self.is_your_digimon_hit:
-                    # Player hit - draw Player normally? Or skip to blink?
-                    # Skip drawing player to blink
-                    pass
-                else:
-                    # Enemy hit - skip drawing enemy
-                    pass
-            else:
-                # Draw normally (already drawn above? No, we need to redraw or rely on above)
-                # The above draw logic depends on phase.
-                # We need to ensure the sprites are drawn in HIT phase too.
-                pass
+        # Hit Effect: the flash inverts the LCD (see flashing), nothing to draw
                 
         # We need to consolidate the draw calls.
         # The above logic handles ATTACK_ANIM, PROJECTILE, COLLISION.
@@ -415,17 +392,18 @@ class AttackManager:
         if self.phase == "HIT":
              # Draw Player
             if not (self.is_your_digimon_hit and self.timer % 10 < 5):
-                draw_sprite(mine_anim[0], 3 + 4, 4) # Return to idle/stand
+                draw_sprite(mine_anim, 0, 3 + 4, 4) # Return to idle/stand
             
             # Draw Enemy
             if not (not self.is_your_digimon_hit and self.timer % 10 < 5):
-                draw_sprite(enemy_anim[0], 27 - 4, 4, True) # Return to idle/stand
+                draw_sprite(enemy_anim, 0, 27 - 4, 4, True) # Return to idle/stand
 
         # Draw Damage Numbers
         for dn in self.damage_numbers:
-            # dn.x, dn.y are relative to screen center or absolute?
-            # Let's make them absolute for simplicity in draw_number
-            self.game.text_renderer.draw_number(screen, dn.value, dn.x, dn.y, scale=scale)
+            # dn.x, dn.y are offsets from the screen center
+            number = self.game.text_renderer.render_number(dn.value, scale=scale)
+            if number:
+                scene.place([number], 0, base_x + dn.x - scene_x, base_y + dn.y - scene_y, layer=1, scale=1)
 
 class DamageNumber:
     def __init__(self, value, x, y):
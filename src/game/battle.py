@@ -1,10 +1,14 @@
 import pygame
-import random
+from enum import auto
 from .battle_menu import BattleMenu
 from .attack import AttackManager
 from .spirit import SpiritManager
 from .level import LevelManager
 from .evolution import EvolutionManager
+from .attack import DamageNumber
+from src.engine.state_machine import StateEnum, StateHandler, StateMachine
+from src.engine.timeline import Draw, Stage, Timeline
+from src.utils.snapshot import capture, restore
 
 class ScanManager:
     """
@@ -183,12 +187,295 @@ class ScanManager:
             (sprite.get_width() * scale, sprite.get_height() * scale))
         screen.blit(scaled, (x - scaled.get_width()//2, y - scaled.get_height()//2))
 
+# Battle start animation (obj_battle_start_dtector Alarm_0 / Draw_0).
+# Positions are GML pixels from the top-left of the 30x32 scene.
+# "summon" is summon frame 4 for bosses, 3 otherwise.
+_SUMMON = Draw("summon", 0, 0, 0)
+_ENEMY = Draw("enemy", 0, 27, 4, flip=True)
+_ENEMY_ALT = _ENEMY._replace(frame=1)
+
+START_TIMELINE = Timeline([
+    Stage(9, 15, (_SUMMON._replace(parity=1),)), # Boss sound at 4
+    Stage(9, 15, (_ENEMY._replace(parity=1), _SUMMON._replace(parity=0))),
+    Stage(3, 15, (_ENEMY._replace(parity=1),)), # Encounter sound at 19
+    Stage(1, 15, (_ENEMY._replace(parity=1), _ENEMY_ALT._replace(parity=0))),
+    Stage(2, 30, (_ENEMY._replace(parity=1), _ENEMY_ALT._replace(parity=0))),
+    Stage(1, 60, (_ENEMY._replace(parity=1), _ENEMY_ALT._replace(parity=0))),
+])
+
+_LAST_BOSS_SUMMON = (Draw("summon", 0, 0, -16, parity=1), Draw("summon", 0, 0, 16, parity=0))
+
+LAST_BOSS_START_TIMELINE = Timeline([
+    Stage(1, 15, _LAST_BOSS_SUMMON), # Last boss sound
+    Stage(16, 10, _LAST_BOSS_SUMMON),
+    Stage(13, 20, (_ENEMY,) + _LAST_BOSS_SUMMON),
+    Stage(4, 20, (_ENEMY._replace(parity=0),)),
+    Stage(1, 20),
+    Stage(1, 60, (_ENEMY,)),
+    Stage(1, 60, (_ENEMY_ALT,)),
+    Stage(1, 60, (_ENEMY,)),
+])
+
+def start_anim_source(game, enemy, is_boss, is_last_boss):
+    """(key, build) of an enemy's battle start animation for game.frame_cache"""
+    sprite = game.state.digimon_database[enemy]['sprite']
+    summon_index = 4 if is_boss or is_last_boss else 3
+    timeline = LAST_BOSS_START_TIMELINE if is_last_boss else START_TIMELINE
+
+    def build():
+        enemy_sprite = game.assets.get_animation(f"digimon_{sprite}")
+        summon_frames = game.assets.get_animation("summon_dtector")
+        if not enemy_sprite or not summon_frames:
+            return None
+        return timeline.bind({
+            "enemy": enemy_sprite,
+            "summon": summon_frames[summon_index:summon_index + 1],
+        })
+    return ("battle_start", sprite, summon_index, is_last_boss), build
+
+# Boss per area: [primary_boss, condition_area, alternate_boss]
+BOSS_CONFIG = [
+    [131, 9, 132],   # Area 0
+    [96, -1, -1],    # Area 1
+    [133, 6, 134],   # Area 2
+    [135, 10, 136],  # Area 3
+    [137, 7, 119],   # Area 4
+    [98, -1, -1],    # Area 5
+    [133, 2, 134],   # Area 6
+    [137, 4, 138],   # Area 7
+    [97, -1, -1],    # Area 8
+    [131, 0, 132],   # Area 9
+    [135, 3, 136],   # Area 10
+    [99, -1, -1]     # Area 11
+]
+
+def regular_enemies(control):
+    """Enemies a regular battle picks from: 5-10 levels above the player"""
+    possible_enemies = []
+    player_level = min(control.game_progress["level"], 70)
+    
+    for i, digimon in enumerate(control.digimon_database):
+        # Skip spirits, bosses, and special digimon
+        if (digimon["type"] not in ["spirit", "boss", "ancient", "final_boss"] and
+            i not in [96, 97, 98, 99]):
+            
+            level_diff = digimon["level"] - player_level
+            if 5 <= level_diff <= 10:
+                possible_enemies.append(i)
+    
+    # Fallback if no enemies found
+    if not possible_enemies:
+        possible_enemies.append(32)
+    return possible_enemies
+
+def area_boss(control):
+    """Boss at the end of the current area (not the last boss)"""
+    area = control.game_progress["current_area"]
+    if 0 <= area < len(BOSS_CONFIG):
+        config = BOSS_CONFIG[area]
+        boss_id = config[0]
+        
+        # Check for alternate boss
+        if config[1] != -1:
+            if control.game_progress["area_status"][config[1]]:
+                boss_id = config[2]
+        
+        return boss_id
+    
+    return 131  # Default boss
+
+def last_boss(control):
+    """Final boss for this playthrough"""
+    if not control.game_progress["new_game"]:
+        if not control.game_progress["last_boss_unlocked"]:
+            return 120
+        else:
+            return 127
+    else:
+        if not control.game_progress["last_boss_unlocked"]:
+            return 128
+        else:
+            return 130
+
+class BattlePhase(StateEnum):
+    START_ANIM = auto()
+    MENU = auto()
+    SCAN_SEQ = auto()
+    ATTACK_SEQ = auto()
+    SPIRIT_SEQ = auto()
+    ANCIENT_SEQ = auto() # Not entered yet (no Ancient forms)
+    LEVEL_SEQ = auto()
+
+PHASE_TRANSITIONS = {
+    BattlePhase.START_ANIM: (BattlePhase.MENU,),
+    BattlePhase.MENU: (BattlePhase.SCAN_SEQ, BattlePhase.SPIRIT_SEQ),
+    BattlePhase.SCAN_SEQ: (BattlePhase.ATTACK_SEQ, BattlePhase.MENU),
+    BattlePhase.ATTACK_SEQ: (BattlePhase.MENU, BattlePhase.SPIRIT_SEQ, BattlePhase.LEVEL_SEQ),
+    BattlePhase.SPIRIT_SEQ: (BattlePhase.MENU, BattlePhase.SCAN_SEQ, BattlePhase.LEVEL_SEQ),
+    BattlePhase.ANCIENT_SEQ: (BattlePhase.MENU,),
+    BattlePhase.LEVEL_SEQ: (), # Battle ends from here
+}
+
+# Phase handlers. update()/handle_input() return True when the battle is over.
+class _Phase(StateHandler):
+    def __init__(self, battle):
+        self.battle = battle
+
+class StartAnimPhase(_Phase):
+    def update(self, delta_time):
+        battle = self.battle
+        timeline = battle._start_timeline()
+        battle.counter, battle.alarm_timer = timeline.step(battle.counter, battle.alarm_timer, delta_time)
+        if battle.counter >= timeline.length:
+            battle.phases.go(BattlePhase.MENU)
+
+    def draw(self, screen):
+        self.battle._draw_start_anim(screen)
+
+    def is_animating(self):
+        return True
+
+class MenuPhase(_Phase):
+    def handle_input(self, event):
+        battle = self.battle
+        result = battle.menu.handle_input(event)
+        if result == "scan_attack":
+            battle.phases.go(BattlePhase.SCAN_SEQ)
+        elif result == "spirit_check":
+            battle.phases.go(BattlePhase.SPIRIT_SEQ)
+            battle.spirit_manager.start_selection()
+        elif result == "escape_success":
+            return True
+
+    def draw(self, screen):
+        self.battle._draw_battle_screen(screen)
+        self.battle.menu.draw(screen)
+
+class ScanPhase(_Phase):
+    def enter(self):
+        self.battle.scan_manager.start()
+
+    def update(self, delta_time):
+        battle = self.battle
+        result = battle.scan_manager.update(delta_time)
+        if result == "SCAN_COMPLETE":
+            battle.phases.go(BattlePhase.ATTACK_SEQ)
+        elif result == "CANCEL":
+            battle.phases.go(BattlePhase.MENU)
+
+    def handle_input(self, event):
+        if self.battle.scan_manager.handle_input(event) == "CANCEL":
+            self.battle.phases.go(BattlePhase.MENU)
+
+    def draw(self, screen):
+        self.battle.scan_manager.draw(screen)
+
+class AttackPhase(_Phase):
+    def enter(self):
+        self.battle.attack_manager.start_attack(self.battle.scan_manager.current_scan)
+
+    def update(self, delta_time):
+        if self.battle.attack_manager.update(delta_time) == "BATTLE_CONTINUE":
+            self.battle._handle_turn_end()
+
+    def handle_input(self, event):
+        self.battle.attack_manager.handle_input(event)
+
+    def draw(self, screen):
+        self.battle.attack_manager.draw(screen)
+
+    def scene(self):
+        attack = self.battle.attack_manager
+        return attack.scene if attack.active else None
+
+    def lcd_inverted(self):
+        return self.battle.attack_manager.flashing
+
+    def is_animating(self):
+        return True
+
+class SpiritPhase(_Phase):
+    def update(self, delta_time):
+        battle = self.battle
+        result = battle.spirit_manager.update(delta_time)
+        # EVO_COMPLETE: stays here, the spirit manager moves on to its own menu
+        if result == "DEEVO_COMPLETE":
+            battle.phases.go(BattlePhase.MENU)
+        elif result == "ESCAPE":
+            return True
+
+    def handle_input(self, event):
+        result = self.battle.spirit_manager.handle_input(event)
+        # SPIRIT_SCAN: no separate spirit scan yet, same as an attack scan
+        if result == "SPIRIT_ATTACK" or result == "SPIRIT_SCAN":
+            self.battle.phases.go(BattlePhase.SCAN_SEQ)
+
+    def draw(self, screen):
+        self.battle.spirit_manager.draw(screen)
+
+    def is_animating(self):
+        return self.battle.spirit_manager.state in ("EVO_ANIM", "DEEVO_ANIM")
+
+class AncientPhase(_Phase):
+    def update(self, delta_time):
+        if self.battle.evolution_manager.update(delta_time) == "EVO_COMPLETE":
+            self.battle.phases.go(BattlePhase.MENU)
+
+    def draw(self, screen):
+        self.battle.evolution_manager.draw(screen)
+
+    def is_animating(self):
+        return True
+
+class LevelPhase(_Phase):
+    def update(self, delta_time):
+        return self.battle.level_manager.update(delta_time) == "TRANSITION_COMPLETE"
+
+    def draw(self, screen):
+        self.battle.level_manager.draw(screen)
+
+    def is_animating(self):
+        return True
+
 class BattleManager:
     """
     Manages battle initialization, enemy selection, and battle flow.
     Ports obj_battle_start_dtector logic.
     """
     def __init__(self, game):
+        self.game = game
+        self.control = game.state
+        
+        # Flow (BattlePhase), dispatched to the phase handlers above
+        self.phases = StateMachine(self, "state", {
+            BattlePhase.START_ANIM: StartAnimPhase(self),
+            BattlePhase.MENU: MenuPhase(self),
+            BattlePhase.SCAN_SEQ: ScanPhase(self),
+            BattlePhase.ATTACK_SEQ: AttackPhase(self),
+            BattlePhase.SPIRIT_SEQ: SpiritPhase(self),
+            BattlePhase.ANCIENT_SEQ: AncientPhase(self),
+            BattlePhase.LEVEL_SEQ: LevelPhase(self),
+        }, PHASE_TRANSITIONS, BattlePhase.START_ANIM)
+        self.counter = 0
+        
+        # Set by _select_boss / _select_last_boss
+        self.is_boss = False
+        self.is_last_boss = False
+        
+        self.enemy_digimon = self._select_enemy()
+        self.alarm_timer = self._start_timeline().durations[0]
+        self.mine_digimon = self.control.game_progress["current_char"] # Human form
+        self.control_level = self.control.game_progress["level"]
+        
+        # Spirits usable in this battle (a spirit is spent once used)
+        self.copy_spirits = list(self.control.spirits_obtained)
+        
+        self.menu = BattleMenu(game, self)
+        self.scan_manager = ScanManager(game, self)
+        self.attack_manager = AttackManager(game, self)
+        self.spirit_manager = SpiritManager(game, self)
+        self.level_manager = LevelManager(game)
+        self.evolution_manager = EvolutionManager(game, self)
         
         # Initial HP setup (if not already set)
         if game.state.game_progress["current_char_hp"] <= 0:
@@ -200,7 +487,35 @@ class BattleManager:
         self.current_enemy_hp = self.control.digimon_database[self.enemy_digimon]["hp"]
         
         # Initialize enemy AI choice
-        self.enemy_move = random.choice([2, 0, 1])
+        self.enemy_move = game.rng.choice("enemy", [2, 0, 1])
+
+    def snapshot(self):
+        """Runtime state of the battle and its sub-managers (see DtectorGame.snapshot)"""
+        return {
+            "battle": capture(self),
+            "menu": capture(self.menu),
+            "scan": capture(self.scan_manager),
+            "attack": capture(self.attack_manager),
+            "damage_numbers": [capture(dn) for dn in self.attack_manager.damage_numbers],
+            "spirit": capture(self.spirit_manager),
+            "level": capture(self.level_manager),
+            "evolution": capture(self.evolution_manager),
+        }
+        
+    def restore(self, data):
+        restore(self, data["battle"])
+        self.phases.reset(self.state)
+        restore(self.menu, data["menu"])
+        restore(self.scan_manager, data["scan"])
+        restore(self.attack_manager, data["attack"])
+        self.attack_manager.damage_numbers = []
+        for dn_data in data["damage_numbers"]:
+            dn = DamageNumber(0, 0, 0)
+            restore(dn, dn_data)
+            self.attack_manager.damage_numbers.append(dn)
+        restore(self.spirit_manager, data["spirit"])
+        restore(self.level_manager, data["level"])
+        restore(self.evolution_manager, data["evolution"])
 
     def _select_enemy(self):
         """Select appropriate enemy based on level and area"""
@@ -211,118 +526,21 @@ class BattleManager:
             else:
                 return self._select_boss()
         
-        # Regular enemy selection
-        possible_enemies = []
-        player_level = min(self.control.game_progress["level"], 70)
-        
-        for i, digimon in enumerate(self.control.digimon_database):
-            # Skip spirits, bosses, and special digimon
-            if (digimon["type"] not in ["spirit", "boss", "ancient", "final_boss"] and
-                i not in [96, 97, 98, 99]):
-                
-                level_diff = digimon["level"] - player_level
-                if 5 <= level_diff <= 10:
-                    possible_enemies.append(i)
-        
-        # Fallback if no enemies found
-        if not possible_enemies:
-            possible_enemies.append(32)
-        
-        return random.choice(possible_enemies)
+        return self.game.rng.choice("enemy", regular_enemies(self.control))
     
     def _select_boss(self):
         """Select boss for current area"""
         self.is_boss = True
-        
-        # Boss configuration: [primary_boss, condition_area, alternate_boss]
-        boss_config = [
-            [131, 9, 132],   # Area 0
-            [96, -1, -1],    # Area 1
-            [133, 6, 134],   # Area 2
-            [135, 10, 136],  # Area 3
-            [137, 7, 119],   # Area 4
-            [98, -1, -1],    # Area 5
-            [133, 2, 134],   # Area 6
-            [137, 4, 138],   # Area 7
-            [97, -1, -1],    # Area 8
-            [131, 0, 132],   # Area 9
-            [135, 3, 136],   # Area 10
-            [99, -1, -1]     # Area 11
-        ]
-        
-        area = self.control.game_progress["current_area"]
-        if 0 <= area < len(boss_config):
-            config = boss_config[area]
-            boss_id = config[0]
-            
-            # Check for alternate boss
-            if config[1] != -1:
-                if self.control.game_progress["area_status"][config[1]]:
-                    boss_id = config[2]
-            
-            return boss_id
-        
-        return 131  # Default boss
+        return area_boss(self.control)
     
     def _select_last_boss(self):
         """Select final boss"""
         self.is_last_boss = True
-        
-        if not self.control.game_progress["new_game"]:
-            if not self.control.game_progress["last_boss_unlocked"]:
-                return 120
-            else:
-                return 127
-        else:
-            if not self.control.game_progress["last_boss_unlocked"]:
-                return 128
-            else:
-                return 130
+        return last_boss(self.control)
     
     def update(self, delta_time):
-        """Update battle state"""
-        if self.state == "START_ANIM":
-            self.alarm_timer -= delta_time * 60
-            if self.alarm_timer <= 0:
-                result = self._advance_animation()
-                if result == "battle_menu":
-                    self.state = "MENU"
-        
-        elif self.state == "MENU":
-            pass
-            
-        elif self.state == "SCAN_SEQ":
-            result = self.scan_manager.update(delta_time)
-            if result == "SCAN_COMPLETE":
-                self.state = "ATTACK_SEQ"
-                self.attack_manager.start_attack(self.scan_manager.current_scan)
-            elif result == "CANCEL":
-                self.state = "MENU"
-            
-        elif self.state == "ATTACK_SEQ":
-            result = self.attack_manager.update(delta_time)
-            if result == "BATTLE_CONTINUE":
-                self._handle_turn_end()
-                    
-        elif self.state == "SPIRIT_SEQ":
-            result = self.spirit_manager.update(delta_time)
-            if result == "EVO_COMPLETE":
-                # Stay in SPIRIT_SEQ but logic handled by manager state "MENU"
-                pass
-            elif result == "DEEVO_COMPLETE":
-                self.state = "MENU"
-            elif result == "ESCAPE":
-                return "BATTLE_END"
-                
-        elif self.state == "ANCIENT_SEQ":
-            result = self.evolution_manager.update(delta_time)
-            if result == "EVO_COMPLETE":
-                self.state = "MENU"
-                
-        elif self.state == "LEVEL_SEQ":
-            result = self.level_manager.update(delta_time)
-            if result == "TRANSITION_COMPLETE":
-                return "BATTLE_END"
+        """Update battle state. Returns True once the battle is over."""
+        return self.phases.handler.update(delta_time)
 
     def _handle_turn_end(self):
         """
@@ -334,24 +552,27 @@ class BattleManager:
             # Battle won
             # If spirit, de-evolve first? GML says obj_spirit_off_dtector if battle ended
             if self._is_spirit_form():
-                self.state = "SPIRIT_SEQ"
+                self.phases.go(BattlePhase.SPIRIT_SEQ)
                 self.spirit_manager.start_deevolution(False) # False = not escape
             else:
                 # Standard win
                 # TODO: Implement win sequence (Level up, etc)
                 pass
+                
+            if self.is_boss or self.is_last_boss:
+                self._boss_defeated()
             
-            self.state = "LEVEL_SEQ"
+            self.phases.go(BattlePhase.LEVEL_SEQ)
             self.level_manager.start_level_check(True)
             return
 
         if self.current_mine_hp <= 0:
             # Battle lost
             if self._is_spirit_form():
-                self.state = "SPIRIT_SEQ"
+                self.phases.go(BattlePhase.SPIRIT_SEQ)
                 self.spirit_manager.start_deevolution(False)
             
-            self.state = "LEVEL_SEQ"
+            self.phases.go(BattlePhase.LEVEL_SEQ)
             self.level_manager.start_level_check(False)
             return
 
@@ -360,19 +581,24 @@ class BattleManager:
             cost = self._get_dpower_cost()
             if self.control.game_progress["dpower"] < cost:
                 # Forced de-evolution
-                self.state = "SPIRIT_SEQ"
+                self.phases.go(BattlePhase.SPIRIT_SEQ)
                 self.spirit_manager.start_deevolution(False)
             else:
                 # Maintain spirit form -> Spirit Menu
-                self.state = "SPIRIT_SEQ"
+                self.phases.go(BattlePhase.SPIRIT_SEQ)
                 self.spirit_manager.start_menu()
         elif self._is_ancient_form():
              # Similar maintenance for Ancient
-             self.state = "MENU" # Placeholder
+             self.phases.go(BattlePhase.MENU) # Placeholder
         else:
             # Standard menu
-            self.state = "MENU"
-            self.enemy_move = random.choice([2, 0, 1])
+            self.phases.go(BattlePhase.MENU)
+            self.enemy_move = self.game.rng.choice("enemy", [2, 0, 1])
+
+    def _boss_defeated(self):
+        """Unlocks the boss's spirit and moves on to the next area (obj_map_swap_dtector)"""
+        self.evolution_manager.unlock_spirit(self.enemy_digimon)
+        self.game.map_manager.check_progression()
 
     def _is_spirit_form(self):
         # IDs 100-111 are spirits
@@ -397,122 +623,15 @@ class BattleManager:
         else: return 1
 
     def handle_input(self, event):
-        """Handle input based on state"""
-        if self.state == "MENU":
-            result = self.menu.handle_input(event)
-            if result == "scan_attack":
-                self.state = "SCAN_SEQ"
-                self.scan_manager.start()
-            elif result == "spirit_check":
-                self.state = "SPIRIT_SEQ"
-                self.spirit_manager.start_selection()
-            elif result == "escape_success":
-                return "BATTLE_END"
-            
-        elif self.state == "SCAN_SEQ":
-            result = self.scan_manager.handle_input(event)
-            if result == "CANCEL":
-                self.state = "MENU"
-            
-        elif self.state == "ATTACK_SEQ":
-            self.attack_manager.handle_input(event)
-            
-        elif self.state == "SPIRIT_SEQ":
-            result = self.spirit_manager.handle_input(event)
-            if result == "SPIRIT_ATTACK":
-                self.state = "SCAN_SEQ"
-                self.scan_manager.start()
-            elif result == "SPIRIT_SCAN":
-                # Implement scan logic for spirit?
-                # For now map to attack scan
-                self.state = "SCAN_SEQ"
-                self.scan_manager.start()
-
-    def _advance_animation(self):
-        """
-        Advance battle start animation sequence.
-        Ported exactly from obj_battle_start_dtector_Alarm_0.gml
-        """
-        # GML runs at 60 FPS (usually). 
-        # alarm[0] = 15 -> 15 frames
-        # alarm[0] = 30 -> 30 frames
-        # alarm[0] = 60 -> 60 frames
-        
-        if not self.is_last_boss:
-            # Normal/Boss battle animation
-            if 0 <= self.counter <= 8:
-                if self.counter == 4 and self.is_boss:
-                    # Play boss encounter sound
-                    pass
-                self.alarm_timer = 15
-                self.counter += 1
-            elif 9 <= self.counter <= 17:
-                self.alarm_timer = 15
-                self.counter += 1
-            elif 18 <= self.counter <= 20:
-                if self.counter == 19 and not self.is_boss:
-                    # Play normal encounter sound
-                    pass
-                self.alarm_timer = 15
-                self.counter += 1
-            elif 21 <= self.counter <= 22:
-                self.alarm_timer = 30
-                self.counter += 1
-            elif self.counter == 23:
-                self.alarm_timer = 60
-                self.counter += 1
-            elif self.counter == 24:
-                # Transition to battle menu
-                return "battle_menu"
-        else:
-            # Last boss animation
-            if 0 <= self.counter <= 15:
-                if self.counter == 0:
-                    # Play last boss sound
-                    pass
-                self.alarm_timer = 10
-                self.counter += 1
-            elif self.counter == 16:
-                self.alarm_timer = 20
-                self.counter += 1
-            elif 17 <= self.counter <= 29:
-                self.alarm_timer = 20
-                self.counter += 1
-            elif 30 <= self.counter <= 33: # Fixed range from GML (29-33)
-                self.alarm_timer = 20
-                self.counter += 1
-            elif self.counter == 34:
-                self.alarm_timer = 60
-                self.counter += 1
-            elif self.counter == 35:
-                self.alarm_timer = 60
-                self.counter += 1
-            elif self.counter == 36:
-                self.alarm_timer = 60
-                self.counter += 1
-            elif self.counter == 37:
-                # Transition to battle menu
-                return "battle_menu"
-        
-        return None
+        """Handle input based on state. Returns True once the battle is over."""
+        return self.phases.handler.handle_input(event)
+
+    def _start_timeline(self):
+        return LAST_BOSS_START_TIMELINE if self.is_last_boss else START_TIMELINE
 
     def draw(self, screen):
         """Draw battle state"""
-        if self.state == "START_ANIM":
-            self._draw_start_anim(screen)
-        elif self.state == "MENU":
-            self._draw_battle_screen(screen)
-            self.menu.draw(screen)
-        elif self.state == "SCAN_SEQ":
-            self.scan_manager.draw(screen)
-        elif self.state == "ATTACK_SEQ":
-            self.attack_manager.draw(screen)
-        elif self.state == "SPIRIT_SEQ":
-            self.spirit_manager.draw(screen)
-        elif self.state == "ANCIENT_SEQ":
-            self.evolution_manager.draw(screen)
-        elif self.state == "LEVEL_SEQ":
-            self.level_manager.draw(screen)
+        self.phases.handler.draw(screen)
 
     def _draw_battle_screen(self, screen):
         # Draw background/enemy/player for menu state
@@ -537,114 +656,15 @@ class BattleManager:
     def _draw_start_anim(self, screen):
         """
         Draw battle start animation.
-        Ported exactly from obj_battle_start_dtector_Draw_0.gml
+        Ported exactly from obj_battle_start_dtector_Draw_0.gml (see START_TIMELINE)
         """
-        enemy_sprite = self.game.assets.get_animation(
-            f"digimon_{self.control.digimon_database[self.enemy_digimon]['sprite']}"
-        )
-        
-        summon_frames = self.game.assets.get_animation("summon_dtector")
-        
-        if not enemy_sprite or not summon_frames:
+        # Looked up per draw, not kept: the battle's state stays plain data (see snapshot)
+        start_anim = self.game.frame_cache.get(*start_anim_source(
+            self.game, self.enemy_digimon, self.is_boss, self.is_last_boss))
+        if start_anim is None:
             return
         
-        # Center coordinates (GML uses relative to object, we center on screen)
-        # GML view is roughly 30x32 scaled 10x -> 300x320
-        # We are drawing at center of screen.
-        base_x = screen.get_width() // 2
-        base_y = screen.get_height() // 2
+        # The 30x32 scene is centered on screen
         scale = 6
-        
-        # GML offsets: x + 3 + 24, y + 4 for enemy
-        # We need to adjust for our centering logic.
-        # Let's assume base_x/y corresponds to 'x,y' in GML (top-left of the 30x32 area?)
-        # Actually, in GML 'x,y' is the object position.
-        # For now, we'll keep our centering but apply the RELATIVE offsets from GML.
-        
-        # Enemy draw helper
-        def draw_enemy(frame_idx, flip=True):
-            sprite = enemy_sprite[frame_idx % len(enemy_sprite)]
-            # GML: draw_sprite_ext(..., x + 27, y + 4, -1, 1, ...)
-            # -1 xscale means flip horizontal.
-            if flip:
-                sprite = pygame.transform.flip(sprite, True, False)
-            
-            scaled = pygame.transform.scale(sprite, 
-                (sprite.get_width() * scale, sprite.get_height() * scale))
-            
-            # Offset: +27 pixels * scale
-            draw_x = base_x + (27 * scale) - scaled.get_width() # Adjust anchor?
-            # Actually, let's stick to our previous centering but apply the offset relative to center
-            # if that's what GML does.
-            # In GML, x,y is likely top-left of the view or specific position.
-            # Let's try to match the visual "feel" first.
-            # Previous code used: x + 24*scale. GML uses x + 27.
-            
-            # Let's use a fixed offset from center to match GML's relative positioning
-            # Assuming 'x' in GML is roughly center-ish or left-aligned.
-            # Let's try to center the "scene" and place items relative to that.
-            scene_x = base_x - (15 * scale) # Center of 30px width
-            scene_y = base_y - (16 * scale) # Center of 32px height
-            
-            # GML: x + 27
-            pos_x = scene_x + (27 * scale) - (scaled.get_width() // 2) # Centered on that point?
-            # GML sprites are usually top-left origin unless specified.
-            # Let's assume top-left for now.
-            pos_x = scene_x + (27 * scale) - scaled.get_width() # Flip adjustment
-            pos_y = scene_y + (4 * scale)
-            
-            screen.blit(scaled, (pos_x, pos_y))
-
-        # Summon draw helper
-        def draw_summon(frame_idx, offset_y=0):
-            if frame_idx < len(summon_frames):
-                sprite = summon_frames[frame_idx]
-                scaled = pygame.transform.scale(sprite, 
-                    (sprite.get_width() * scale, sprite.get_height() * scale))
-                
-                # GML: draw_sprite(..., x, y) or (x, y-16)
-                scene_x = base_x - (15 * scale)
-                scene_y = base_y - (16 * scale)
-                
-                pos_x = scene_x
-                pos_y = scene_y + (offset_y * scale)
-                
-                screen.blit(scaled, (pos_x, pos_y))
-
-        if not self.is_last_boss:
-            summon_index = 4 if self.is_boss else 3
-            
-            if 0 <= self.counter <= 8:
-                if self.counter % 2:
-                    draw_summon(summon_index)
-            elif 9 <= self.counter <= 17:
-                if self.counter % 2:
-                    draw_enemy(0)
-                else:
-                    draw_summon(summon_index)
-            elif 18 <= self.counter <= 20:
-                if self.counter % 2:
-                    draw_enemy(0)
-            elif self.counter >= 21:
-                if self.counter % 2:
-                    draw_enemy(0)
-                else:
-                    draw_enemy(1) # Frame 1
-        else:
-            # Last Boss
-            if 0 <= self.counter <= 16:
-                offset = -16 if self.counter % 2 else 16
-                draw_summon(4, offset_y=offset)
-            elif 17 <= self.counter <= 29:
-                draw_enemy(0)
-                offset = -16 if self.counter % 2 else 16
-                draw_summon(4, offset_y=offset)
-            elif 30 <= self.counter <= 33:
-                if self.counter % 2 == 0:
-                    draw_enemy(0)
-            elif self.counter == 35:
-                draw_enemy(0)
-            elif self.counter == 36:
-                draw_enemy(1)
-            elif self.counter == 37:
-                draw_enemy(0)
+        origin = (screen.get_width() // 2 - 15 * scale, screen.get_height() // 2 - 16 * scale)
+        start_anim.draw(screen, self.counter, origin)
@@ -48,22 +48,20 @@ class BattleMenu:
     
     def _attempt_escape(self):
         """Attempt to escape from battle"""
-        import random
-        
         # Can't escape from boss battles
         if self.control.game_progress["distance"] == 0:
             escape_chance = 0
         else:
             escape_chance = 30
         
-        roll = random.randint(0, 100)
+        roll = self.game.rng.randint("escape", 0, 100)
         
         if roll < escape_chance:
             # Successful escape
             return "escape_success"
         else:
             # Failed escape - lose distance
-            self.control.game_progress["distance"] += 500
+            self.game.history.set_progress(distance=self.control.game_progress["distance"] + 500)
             return "escape_fail"
     
     def draw(self, screen):
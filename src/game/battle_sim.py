@@ -0,0 +1,150 @@
+import argparse
+import numpy as np
+from src.game.attack import MOVE_STATS, SCAN_MOVES, ENEMY_HIT, PLAYER_HIT, resolve_exchange
+
+# Move for each 3-bit scan pattern (index = bits read left to right), -1 = random
+PATTERN_MOVES = np.array([SCAN_MOVES.get(((i >> 2) & 1, (i >> 1) & 1, i & 1), -1) for i in range(8)])
+
+def _scan_probs(policy):
+    """None = uniform over the 8 patterns, [b, b, b] = always that pattern, else 8 probabilities."""
+    if policy is None:
+        return np.full(8, 1 / 8)
+    policy = np.asarray(policy, dtype=float)
+    if policy.shape == (3,):
+        probs = np.zeros(8)
+        probs[int(policy[0]) << 2 | int(policy[1]) << 1 | int(policy[2])] = 1.0
+        return probs
+    return policy / policy.sum()
+
+def _move_probs(policy):
+    """None = uniform, else 3 probabilities (Energy, Crunch, Ability)."""
+    if policy is None:
+        return np.full(3, 1 / 3)
+    policy = np.asarray(policy, dtype=float)
+    return policy / policy.sum()
+
+def _stat_row(digimon):
+    return np.array([digimon[key] for key in MOVE_STATS])
+
+def simulate_battles(mine, enemy, battles=1000000, scan_policy=None, enemy_policy=None,
+                     mine_hp=None, mine_level=None, max_turns=500, chunk_size=1000000, rng=None):
+    """
+    Resolves `battles` independent battles between two digimon_database
+    entries at once, using the same rules as AttackManager:
+    scan pattern -> player move (random for unmapped patterns), enemy move
+    from enemy_policy, resolve_exchange(), damage = the hitter's move stat.
+    Draws deal no damage; battles still going after max_turns are timeouts.
+    Returns per-battle arrays; see summarize().
+    """
+    rng = rng if rng is not None else np.random.default_rng()
+    scan_p = _scan_probs(scan_policy)
+    enemy_p = _move_probs(enemy_policy)
+    mine_stats = _stat_row(mine)
+    enemy_stats = _stat_row(enemy)
+    mine_hp = mine["hp"] if mine_hp is None else mine_hp
+    mine_level = mine["level"] if mine_level is None else mine_level
+    # Enemies more than 19 levels above can't be attacked at all
+    outclassed = enemy["level"] - mine_level > 19
+
+    chunks = []
+    for start in range(0, battles, chunk_size):
+        n = min(chunk_size, battles - start)
+        chunks.append(_simulate_chunk(rng, n, mine_stats, enemy_stats, mine_hp, enemy["hp"],
+                                      scan_p, enemy_p, outclassed, max_turns))
+    result = {key: np.concatenate([c[key] for c in chunks]) for key in chunks[0]}
+    result["max_turns"] = max_turns
+    return result
+
+def _simulate_chunk(rng, n, mine_stats, enemy_stats, mine_hp, enemy_hp, scan_p, enemy_p, outclassed, max_turns):
+    mine_left = np.full(n, mine_hp, dtype=np.int32)
+    enemy_left = np.full(n, enemy_hp, dtype=np.int32)
+    turns = np.zeros(n, dtype=np.int32)
+    dealt = np.zeros(n, dtype=np.int32)
+    taken = np.zeros(n, dtype=np.int32)
+
+    active = np.arange(n)
+    for _ in range(max_turns):
+        if active.size == 0:
+            break
+        k = active.size
+
+        if outclassed:
+            mine_move = np.full(k, -1)
+        else:
+            mine_move = PATTERN_MOVES[rng.choice(8, size=k, p=scan_p)]
+            unmapped = mine_move < 0
+            mine_move[unmapped] = rng.integers(0, 3, size=int(unmapped.sum()))
+        enemy_move = rng.choice(3, size=k, p=enemy_p)
+
+        mine_val = np.where(mine_move >= 0, mine_stats[mine_move.clip(0)], 0)
+        enemy_val = enemy_stats[enemy_move]
+        outcome = resolve_exchange(mine_move, enemy_move, mine_val, enemy_val)
+
+        # HP can't go below 0 (AttackManager._apply_damage)
+        to_enemy = np.minimum(np.where(outcome == ENEMY_HIT, mine_val, 0), enemy_left[active])
+        to_mine = np.minimum(np.where(outcome == PLAYER_HIT, enemy_val, 0), mine_left[active])
+        enemy_left[active] -= to_enemy
+        mine_left[active] -= to_mine
+        dealt[active] += to_enemy
+        taken[active] += to_mine
+        turns[active] += 1
+
+        done = (enemy_left[active] <= 0) | (mine_left[active] <= 0)
+        active = active[~done]
+
+    return {
+        "win": enemy_left <= 0,
+        "loss": mine_left <= 0,
+        "turns": turns,
+        "damage_dealt": dealt,
+        "damage_taken": taken,
+    }
+
+def summarize(result):
+    """Win rate, turn-count and damage distributions from simulate_battles()."""
+    win = result["win"]
+    loss = result["loss"]
+    turns = result["turns"]
+    return {
+        "battles": int(win.size),
+        "win_rate": float(win.mean()),
+        "loss_rate": float(loss.mean()),
+        "timeout_rate": float((~win & ~loss).mean()),
+        "turns_mean": float(turns.mean()),
+        "turns_percentiles": {p: int(v) for p, v in zip((50, 90, 99), np.percentile(turns, (50, 90, 99)))},
+        "turns_histogram": np.bincount(turns).tolist(),
+        "damage_dealt_mean": float(result["damage_dealt"].mean()),
+        "damage_taken_mean": float(result["damage_taken"].mean()),
+        "damage_taken_on_win_mean": float(result["damage_taken"][win].mean()) if win.any() else 0.0,
+    }
+
+def main():
+    from src.game.state import GameState
+
+    parser = argparse.ArgumentParser(description="Monte Carlo battle simulator")
+    parser.add_argument("mine", type=int, help="player digimon id")
+    parser.add_argument("enemy", type=int, help="enemy digimon id")
+    parser.add_argument("-n", "--battles", type=int, default=1000000)
+    parser.add_argument("--scan", help="fixed scan pattern, e.g. 111 (default: random)")
+    parser.add_argument("--enemy-policy", help="Energy,Crunch,Ability weights, e.g. 1,1,2")
+    parser.add_argument("--hp", type=int, help="player HP (default: digimon HP)")
+    parser.add_argument("--level", type=int, help="player level (default: digimon level)")
+    parser.add_argument("--seed", type=int)
+    args = parser.parse_args()
+
+    database = GameState().digimon_database
+    scan_policy = [int(bit) for bit in args.scan] if args.scan else None
+    enemy_policy = [float(w) for w in args.enemy_policy.split(",")] if args.enemy_policy else None
+    result = simulate_battles(database[args.mine], database[args.enemy], args.battles,
+                              scan_policy=scan_policy, enemy_policy=enemy_policy,
+                              mine_hp=args.hp, mine_level=args.level,
+                              rng=np.random.default_rng(args.seed))
+
+    summary = summarize(result)
+    histogram = summary.pop("turns_histogram")
+    for key, value in summary.items():
+        print(f"{key}: {value}")
+    print("turns: " + " ".join(f"{t}:{c}" for t, c in enumerate(histogram) if c))
+
+if __name__ == "__main__":
+    main()
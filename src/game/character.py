@@ -1,38 +1,72 @@
+import numpy as np
 from src.game.state import GameState
 
+# Spirit evolutions live at digimon_database[SPIRIT_BASE_ID + spirit_idx].
+# Spirit 2*c is character c's human spirit, 2*c + 1 its beast spirit.
+SPIRIT_BASE_ID = 100
+SPIRIT_COUNT = 12
+
+# Human stat feeding each spirit stat: hp <- hp, energy <- spirit,
+# crunch <- stamina, ability <- skill
+SPIRIT_STAT_KEYS = ("hp", "energy", "crunch", "ability")
+CHAR_STAT_KEYS = ("hp", "spirit", "stamina", "skill")
+
+# Per-spirit bonus added on top of the human stats (hp, energy, crunch, ability),
+# Agunimon first. Set so each character's starting stats (GameState.char_stats)
+# give its spirits their database stats (hp 100, 10 for the others); from there
+# the spirits follow their human's level ups and downs.
+SPIRIT_STAT_BONUS = np.array([
+    [94, 5, 5, 3], [94, 5, 5, 3],   # Takuya: Agunimon, BurningGreymon
+    [94, 3, 5, 5], [94, 3, 5, 5],   # Koji: Lobomon, KendoGarurumon
+    [92, 6, 2, 5], [92, 6, 2, 5],   # J.P.: Beetlemon, MetalKabuterimon
+    [95, 5, 6, 3], [95, 5, 6, 3],   # Zoe: Kazemon, Zephyrmon
+    [95, 3, 5, 6], [95, 3, 5, 6],   # Tommy: Kumamon, Korikakumon
+    [94, 5, 5, 3], [94, 5, 5, 3],   # Koichi: Loweemon, JagerLoweemon
+])
+
 class CharacterManager:
     def __init__(self, state: GameState):
         self.state = state
 
+    def mark_stats_changed(self, char_idx=None):
+        """
+        Flags a character's stats as changed (None = every character) so the
+        next calculate_spirit_stats() refreshes its spirits.
+        """
+        if char_idx is None:
+            self.state.changed_chars.update(range(len(self.state.char_stats)))
+        else:
+            self.state.changed_chars.add(char_idx)
+        self.state.mark_dirty("char_stats")
+
     def calculate_spirit_stats(self):
         """
         Updates the Digimon database stats based on the human character stats.
         Ported from gml_GlobalScript_fun_calculate_spirit_stats_dtector.gml
+        Only the spirits of characters flagged in state.changed_chars are
+        recomputed, so calling this when nothing changed is free.
         """
-        db = self.state.digimon_database
+        changed = self.state.changed_chars
+        if not changed:
+            return
+            
+        chars = np.array(sorted(c for c in changed if 0 <= c < SPIRIT_COUNT // 2))
+        changed.clear()
+        if chars.size == 0:
+            return
+            
         stats = self.state.char_stats
+        human = np.array([[stats[c][key] for key in CHAR_STAT_KEYS] for c in chars])
         
-        # Helper to safely get/set digimon stats if they exist
-        # In the full game, we'd ensure all IDs exist. For now, we check.
-        def update_spirit(spirit_id, char_idx, hp_add, spirit_add, stamina_add, skill_add):
-            # Find the digimon with the given number/ID
-            # Note: GML used array indices [100], [101] etc. 
-            # We need to map these to our list or use a dictionary for faster lookup.
-            # For now, let's assume we might not have them all populated.
-            pass 
-
-        # Since we haven't fully populated the DB, I'll implement the logic structure
-        # but comment it out or make it safe until we have the full DB.
-        # The GML code modifies specific indices of digimon_database.
-        # We need to ensure our digimon_database is large enough or use a dict keyed by ID.
+        # Each character feeds its human and beast spirit
+        spirits = np.stack([chars * 2, chars * 2 + 1], axis=1).ravel()
+        values = np.repeat(human, 2, axis=0) + SPIRIT_STAT_BONUS[spirits]
         
-        # Example implementation for Takuya (Index 0) -> Agunimon (ID 100 approx?)
-        # The GML uses hardcoded indices like 100, 101. We need to know what those map to.
-        # Assuming 100 is Agunimon, 101 is BurningGreymon, etc.
-        
-        # For this port, we will implement a simplified version that updates
-        # the current active spirit if applicable.
-        pass
+        db = self.state.digimon_database
+        for spirit_idx, row in zip(spirits.tolist(), values.tolist()):
+            digimon = db[SPIRIT_BASE_ID + spirit_idx]
+            for key, value in zip(SPIRIT_STAT_KEYS, row):
+                digimon[key] = value
 
     def get_current_character_name(self):
         idx = self.state.game_progress["current_char"]
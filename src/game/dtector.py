@@ -1,17 +1,240 @@
 import pygame
 import os
+from enum import auto
 from src.game.state import GameState
 from src.game.character import CharacterManager
 from src.engine.assets import AssetManager
+from src.engine.frame_cache import FrameCache
 from src.game.menu import MenuManager
-from src.game.battle import BattleManager
+from src.game.battle import BattleManager, start_anim_source, regular_enemies, area_boss, last_boss
+from src.game.spirit import evo_anim_source
+from src.game.level import level_change_source
 from src.game.map import MapManager
 from src.game.events import EventManager
-from src.engine.graphics import TextRenderer
+from src.game.history import ProgressHistory
+from src.engine.graphics import DrawBuffer, TextRenderer
+from src.engine.state_machine import StateEnum, StateHandler, StateMachine
+from src.utils.rng import RandomStreams
+from src.utils.save_system import SaveSystem
+from src.utils.autosave import AutoSaver
+from src.utils.journal import ProgressJournal
+from src.utils.save_slots import SaveSlots
+from src.utils.snapshot import SNAPSHOT_VERSION, capture, restore, write_snapshot, read_snapshot
+
+class GameMode(StateEnum):
+    WALKING = auto()
+    MENU = auto()
+    BATTLE = auto()
+    MAP = auto()
+    EVENT = auto()
+
+# Screens each mode can switch to
+MODE_TRANSITIONS = {
+    GameMode.WALKING: (GameMode.MENU, GameMode.BATTLE, GameMode.EVENT),
+    GameMode.MENU: (GameMode.WALKING, GameMode.MAP),
+    GameMode.BATTLE: (GameMode.WALKING,),
+    GameMode.MAP: (GameMode.WALKING,),
+    GameMode.EVENT: (GameMode.WALKING,),
+}
+
+class WalkingMode(StateHandler):
+    def __init__(self, game):
+        self.game = game
+        self.warmed = False # Frame cache queued for the next encounter
+
+    def enter(self):
+        self.warmed = False
+
+    def handle_input(self, event):
+        if event.type == pygame.KEYDOWN:
+            # Menu access
+            if event.key == pygame.K_DOWN:
+                self.game.modes.go(GameMode.MENU)
+            elif event.key == pygame.K_SPACE:
+                self.game.increment_steps()
+
+    def update(self, delta_time):
+        game = self.game
+        # Animation timer (Alarm 1 logic)
+        game.animation_timer += delta_time
+        if game.animation_timer >= game.animation_interval:
+            game.animation_timer = 0
+            game.animation_toggle = not game.animation_toggle
+            game.animation_base = game.rng.randint("idle", 0, 3)
+            
+        # Walk timer (Alarm 0 logic)
+        if game.is_walking:
+            game.walk_timer -= delta_time
+            if game.walk_timer <= 0:
+                game.is_walking = False
+        
+        # Composite upcoming animations a few frames at a time while idle
+        if not self.warmed:
+            game.warm_frame_cache()
+            self.warmed = True
+        game.frame_cache.work()
+
+    def draw(self, screen):
+        game = self.game
+        # Draw Background (Map/Walking)
+        # The walking screen should be clean (white background)
+        # spr_map_dtector is the Map UI and should not be drawn here.
+            
+        # Draw Character
+        char_name = game.character_manager.get_current_character_name().lower()
+        
+        sprite = None
+        flip_x = False
+        
+        if game.is_walking:
+            # Walking Animation
+            anim_frames = game.assets.get_animation(f"{char_name}_walk")
+            if anim_frames:
+                frame_idx = 0 if game.animation_toggle else 1
+                sprite = anim_frames[frame_idx % len(anim_frames)]
+        else:
+            # Idle Animation (Random Base)
+            anim_frames = game.assets.get_animation(f"{char_name}_idle")
+            if anim_frames:
+                # animation_base: 0=frame0, 1=frame1, 2=frame0_flip, 3=frame1_flip
+                frame_idx = game.animation_base % 2
+                flip_x = (game.animation_base >= 2)
+                sprite = anim_frames[frame_idx % len(anim_frames)]
+        
+        if sprite:
+            # Scale sprite (6x size as requested)
+            scale_factor = 6
+            scaled_size = (sprite.get_width() * scale_factor, sprite.get_height() * scale_factor)
+            sprite = pygame.transform.scale(sprite, scaled_size)
+            
+            if flip_x:
+                sprite = pygame.transform.flip(sprite, True, False)
+            
+            cx = screen.get_width() // 2 - sprite.get_width() // 2
+            cy = screen.get_height() // 2 - sprite.get_height() // 2
+            screen.blit(sprite, (cx, cy))
+        
+        # Draw UI Overlay (Steps/Dist) - Replaced with graphical numbers if possible
+        # For now, just remove the ugly debug text.
+        # If we want to show steps, we should use spr_numbers_white
+        
+        if game.state.game_progress["battle_start"]:
+            # Draw Battle Alert
+            alert_anim = game.assets.get_animation("battle_call") # Or similar
+            if alert_anim:
+                 # Draw alert
+                 pass
+            
+        if game.state.game_progress["event_start"]:
+            # Draw Event Alert
+            pass
+
+class MenuMode(StateHandler):
+    def __init__(self, game):
+        self.game = game
+
+    def enter(self):
+        menu = self.game.menu_manager
+        menu.current_menu = "main"
+        menu.current_index = 0
+
+    def handle_input(self, event):
+        game = self.game
+        game.menu_manager.handle_input(event)
+        # Closed, unless an option already left for another screen (e.g. the map)
+        if game.menu_manager.current_menu is None and game.current_state == GameMode.MENU:
+            game.modes.go(GameMode.WALKING)
+
+    def update(self, delta_time):
+        self.game.menu_manager.update(delta_time)
+
+    def draw(self, screen):
+        self.game.menu_manager.draw(screen)
+
+class BattleMode(StateHandler):
+    def __init__(self, game):
+        self.game = game
+
+    def enter(self):
+        game = self.game
+        game.character_manager.calculate_spirit_stats() # No-op unless stats changed
+        game.battle_manager = BattleManager(game) # Create new battle instance
+
+    def handle_input(self, event):
+        if self.game.battle_manager.handle_input(event):
+            self.game.switch_to_walking()
+
+    def update(self, delta_time):
+        if self.game.battle_manager.update(delta_time):
+            self.game.switch_to_walking()
+
+    def draw(self, screen):
+        self.game.battle_manager.draw(screen)
+
+    def is_animating(self):
+        return self.game.battle_manager.phases.handler.is_animating()
+
+    def scene(self):
+        return self.game.battle_manager.phases.handler.scene()
+
+    def lcd_inverted(self):
+        return self.game.battle_manager.phases.handler.lcd_inverted()
+
+class MapMode(StateHandler):
+    def __init__(self, game):
+        self.game = game
+
+    def enter(self):
+        self.game.map_manager._init_map_from_area() # Refresh map state
+
+    def handle_input(self, event):
+        map_manager = self.game.map_manager
+        result = map_manager.handle_input(event)
+        if result == "MAP_SELECTED":
+            self.game.switch_to_walking()
+        elif event.type == pygame.KEYDOWN and event.key == pygame.K_LEFT and map_manager.change == 0:
+            # Exit map
+            self.game.switch_to_walking()
+
+    def update(self, delta_time):
+        self.game.map_manager.update(delta_time)
+
+    def draw(self, screen):
+        self.game.map_manager.draw(screen)
+
+    def is_animating(self):
+        return self.game.map_manager.state == "SWAP_ANIM"
+
+class EventMode(StateHandler):
+    def __init__(self, game):
+        self.game = game
+
+    def enter(self):
+        self.game.event_manager.start_event()
+
+    def update(self, delta_time):
+        if self.game.event_manager.update(delta_time) == "EVENT_COMPLETE":
+            self.game.switch_to_walking()
+
+    def draw(self, screen):
+        self.game.event_manager.draw(screen)
+
+    def is_animating(self):
+        return True
 
 class DtectorGame:
-    def __init__(self):
+    def __init__(self, seed=None, autosave=True):
         self.state = GameState()
+        self.rng = RandomStreams(seed) # Per-subsystem random streams
+        self.history = ProgressHistory(self.state) # All progress changes go through here
+        
+        # Persistence (see open_slot)
+        self.autosave = None
+        self.journal = None
+        self.slots = None
+        if autosave:
+            self.slots = SaveSlots()
+            self.open_slot(0)
         self.character_manager = CharacterManager(self.state)
         self.assets = AssetManager(os.getcwd()) # Assuming running from root
         self.assets.load_all_character_sprites()
@@ -24,6 +247,9 @@ class DtectorGame:
         
         self.font = pygame.font.SysFont("Arial", 16)
         self.text_renderer = TextRenderer(self.assets)
+        self.draw_buffer = DrawBuffer() # Blits queued by the managers, flushed once per frame
+        self.scene_on_screen = None # Retained Scene whose last render the screen still shows
+        self.frame_cache = FrameCache() # Composited battle start / evolution / level frames
         
         # Managers
         self.menu_manager = MenuManager(self)
@@ -31,8 +257,14 @@ class DtectorGame:
         self.map_manager = MapManager(self)
         self.event_manager = EventManager(self)
         
-        # Game State: "WALKING", "MENU", "BATTLE", "MAP", "EVENT"
-        self.current_state = "WALKING"
+        # Game state (GameMode), dispatched to the mode handlers above
+        self.modes = StateMachine(self, "current_state", {
+            GameMode.WALKING: WalkingMode(self),
+            GameMode.MENU: MenuMode(self),
+            GameMode.BATTLE: BattleMode(self),
+            GameMode.MAP: MapMode(self),
+            GameMode.EVENT: EventMode(self),
+        }, MODE_TRANSITIONS, GameMode.WALKING)
         
         # Animation state
         self.animation_timer = 0
@@ -44,59 +276,133 @@ class DtectorGame:
         self.walk_timer = 0
         self.walk_duration = 0.2 # How long to show walk anim after a step
         
+        # Pick up where a suspended session left off
+        if autosave:
+            self.resume()
+        
+    def open_slot(self, slot):
+        """
+        Saves and closes the active slot, then loads `slot` into the current
+        state: last save + progress journal replay, then compact.
+        Steps go to the journal; full snapshots are written in the background.
+        """
+        self.shutdown()
+        self.slots.activate(slot)
+        
+        # Reset in place (managers keep references to this state)
+        self.state.from_dict(GameState().to_dict())
+        SaveSystem.load_game(self.state)
+        self.journal = ProgressJournal(self.state, SaveSystem.JOURNAL_FILE)
+        if self.journal.replay():
+            SaveSystem.save_game(self.state)
+            self.slots.update_summary(slot, self.state.to_dict())
+        self.journal.truncate_through(self.state.game_progress["journal_seq"])
+        self.history.journal = self.journal
+        self.history.reset()
+        self.slots.summaries() # Index loaded (or rebuilt) here, not on the autosave thread
+        self.autosave = AutoSaver(self.state, interval=30.0, on_written=self._on_autosave)
+
+    def snapshot(self):
+        """
+        Complete runtime state as plain data: progress, RNG streams, the
+        current screen, open menus and any battle in progress.
+        """
+        return {
+            "version": SNAPSHOT_VERSION,
+            "state": self.state.snapshot(),
+            "rng": self.rng.get_state(),
+            "game": capture(self, skip=("autosave", "journal", "slots", "battle_manager", "history")),
+            "menu": self.menu_manager.snapshot(),
+            "map": capture(self.map_manager),
+            "event": capture(self.event_manager),
+            "battle": self.battle_manager.snapshot() if self.battle_manager else None,
+        }
+        
+    def restore(self, snapshot):
+        """Restores a snapshot() exactly, including a battle in progress."""
+        # Keep the journal sequence moving forward: records already written
+        # after the snapshot was taken must not be replayed on top of it.
+        journal_seq = self.state.game_progress["journal_seq"]
+        self.state.from_dict(snapshot["state"])
+        progress = self.state.game_progress
+        progress["journal_seq"] = max(progress.get("journal_seq", 0), journal_seq)
+        
+        restore(self, snapshot["game"])
+        self.modes.reset(self.current_state)
+        self.menu_manager.restore(snapshot["menu"])
+        restore(self.map_manager, snapshot["map"])
+        restore(self.event_manager, snapshot["event"])
+        
+        self.battle_manager = None
+        if snapshot["battle"] is not None:
+            self.battle_manager = BattleManager(self)
+            self.battle_manager.restore(snapshot["battle"])
+            
+        # Last, so draws made while rebuilding the battle don't count
+        self.rng.set_state(snapshot["rng"])
+        self.history.reset()
+        
+        if self.autosave:
+            self.autosave.request()
+            
+    def _suspend_path(self):
+        return os.path.splitext(SaveSystem.SAVE_FILE)[0] + ".sus"
+        
+    def suspend(self):
+        """Writes a snapshot of the running session for resume()."""
+        write_snapshot(self._suspend_path(), self.snapshot())
+        
+    def resume(self):
+        """
+        Restores and removes the suspended session, if any. Returns True if
+        resumed. A snapshot older than the loaded save + journal (by
+        journal_seq) is stale and only removed.
+        """
+        path = self._suspend_path()
+        snapshot = read_snapshot(path)
+        self.discard_suspend() # Resume once; progress carries on in the save
+        if snapshot is None:
+            return False
+        if snapshot["state"]["game_progress"].get("journal_seq", 0) < self.state.game_progress["journal_seq"]:
+            return False
+        self.restore(snapshot)
+        return True
+        
+    def discard_suspend(self):
+        """Removes the suspended session (the app is running again, so the save is newer)."""
+        path = self._suspend_path()
+        if os.path.exists(path):
+            os.remove(path)
+
+    def shutdown(self):
+        if self.journal:
+            self.journal.flush()
+        if self.autosave:
+            # The journal only has progress: write the other changed sections (config...)
+            self.autosave.request()
+            self.autosave.stop()
+            
+    def _on_autosave(self, data):
+        # Journal records up to the snapshot's journal_seq are now redundant
+        progress = data.get("game_progress")
+        if progress is not None:
+            self.journal.truncate_through(progress.get("journal_seq", 0))
+            self.slots.update_summary(self.slots.active, data)
+        
     def switch_to_map(self):
-        self.current_state = "MAP"
-        self.map_manager._init_map_from_area() # Refresh map state
+        self.modes.go(GameMode.MAP)
         
     def switch_to_battle(self):
-        self.current_state = "BATTLE"
-        self.battle_manager = BattleManager(self) # Create new battle instance
+        self.modes.go(GameMode.BATTLE)
         
     def switch_to_walking(self):
-        self.current_state = "WALKING"
+        self.modes.go(GameMode.WALKING)
         
     def switch_to_event(self):
-        self.current_state = "EVENT"
-        self.event_manager.start_event()
+        self.modes.go(GameMode.EVENT)
 
     def handle_input(self, event):
-        if self.current_state == "MENU":
-            # Pass input to menu manager
-            if self.menu_manager.handle_input(event):
-                return
-            # If menu returns false (e.g. closed), check if we should go back to walking
-            if self.menu_manager.current_menu is None:
-                self.current_state = "WALKING"
-                
-        elif self.current_state == "BATTLE":
-            if self.battle_manager:
-                result = self.battle_manager.handle_input(event)
-                if result == "VICTORY" or result == "GAME_OVER" or result == "BATTLE_END":
-                    self.switch_to_walking()
-                    
-        elif self.current_state == "MAP":
-            result = self.map_manager.handle_input(event)
-            if result == "MAP_SELECTED":
-                self.switch_to_walking()
-            elif event.type == pygame.KEYDOWN and event.key == pygame.K_LEFT and self.map_manager.change == 0:
-                # Exit map
-                self.switch_to_walking()
-                
-        elif self.current_state == "EVENT":
-            # Event input handling if needed
-            pass
-            
-        elif self.current_state == "WALKING":
-            # Menu access
-            if event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_DOWN:
-                    self.current_state = "MENU"
-                    self.menu_manager.current_menu = "main"
-                    self.menu_manager.current_index = 0
-                    return
-
-                if event.key == pygame.K_SPACE:
-                    self.increment_steps()
+        self.modes.handler.handle_input(event)
 
     def increment_steps(self):
         # Trigger walk animation
@@ -104,150 +410,102 @@ class DtectorGame:
         self.walk_timer = self.walk_duration
         
         progress = self.state.game_progress
-        
-        progress["steps"] += 1
-        if progress["steps"] > 999999:
-            progress["steps"] = 0
+        dpower = progress["dpower"]
+        self.history.steps(1)
             
-        if progress["distance"] > 0:
-            progress["distance"] -= 1
-            
-        # D-Power increase every 100 steps
-        if progress["steps"] % 100 == 0 and progress["dpower"] < 99:
-            progress["dpower"] += 1
+        if progress["dpower"] != dpower:
             print(f"D-Power increased to: {progress['dpower']}")
             
         # Encounter logic
-        import random
-        
         if progress["distance"] == 0:
-            progress["battle_start"] = True
+            self.history.set_progress(battle_start=True)
             print("Boss Battle Triggered!")
             self.switch_to_battle()
         elif progress["steps"] % 100 == 0: # Reduced for testing, was 500
             # 2/3 chance for battle, 1/3 for event
-            is_battle = random.choice([True, True, False])
+            is_battle = self.rng.choice("encounter", [True, True, False])
             
             if not progress["last_encounter_is_battle"]:
                 is_battle = True
                 
             if is_battle:
-                progress["battle_start"] = True
+                self.history.set_progress(battle_start=True)
                 print(f"Battle started at step {progress['steps']}!")
                 self.switch_to_battle()
             else:
-                progress["event_start"] = True
+                self.history.set_progress(event_start=True)
                 print(f"Event started at step {progress['steps']}!")
                 self.switch_to_event()
                 
-            progress["last_encounter_is_battle"] = is_battle
-
-    def update(self, delta_time):
-        import random
-        
-        if self.current_state == "MENU":
-            self.menu_manager.update(delta_time)
-            return
-
-        if self.current_state == "BATTLE":
-            if self.battle_manager:
-                result = self.battle_manager.update(delta_time)
-                if result == "VICTORY" or result == "GAME_OVER" or result == "BATTLE_END":
-                    self.switch_to_walking()
-            return
-            
-        elif self.current_state == "MAP":
-            self.map_manager.update(delta_time)
-            return
-            
-        elif self.current_state == "EVENT":
-            result = self.event_manager.update(delta_time)
-            if result == "EVENT_COMPLETE":
-                self.switch_to_walking()
-            return
-            
-        # Animation timer (Alarm 1 logic)
-        self.animation_timer += delta_time
-        if self.animation_timer >= self.animation_interval:
-            self.animation_timer = 0
-            self.animation_toggle = not self.animation_toggle
-            self.animation_base = random.randint(0, 3)
-            
-        # Walk timer (Alarm 0 logic)
-        if self.is_walking:
-            self.walk_timer -= delta_time
-            if self.walk_timer <= 0:
-                self.is_walking = False
-        
-    def draw(self, screen):
-        screen.fill((255, 255, 255)) # Clear screen to white
-        
-        if self.current_state == "MENU":
-            self.menu_manager.draw(screen)
-            return
-            
-        elif self.current_state == "BATTLE":
-            if self.battle_manager:
-                self.battle_manager.draw(screen)
-            return
-            
-        elif self.current_state == "MAP":
-            self.map_manager.draw(screen)
-            return
-            
-        elif self.current_state == "EVENT":
-            self.event_manager.draw(screen)
-            return
+            self.history.set_progress(last_encounter_is_battle=is_battle)
             
-        # Draw Background (Map/Walking)
-        # The walking screen should be clean (white background)
-        # spr_map_dtector is the Map UI and should not be drawn here.
-            
-        # Draw Character (WALKING state)
-        char_name = self.character_manager.get_current_character_name().lower()
+        if self.autosave:
+            self.autosave.request()
+
+    def warm_frame_cache(self):
+        """
+        Queues the animations the next battle can play in frame_cache, least
+        likely first so they are the first dropped if the cache fills up.
+        """
+        progress = self.state.game_progress
+        cache = self.frame_cache
         
-        sprite = None
-        flip_x = False
+        # Evolutions with the spirits the party can use
+        for spirit, obtained in enumerate(self.state.spirits_obtained):
+            if obtained and self.state.char_party[spirit // 2]:
+                cache.warm(*evo_anim_source(self, progress["current_char"], spirit))
+        for is_level_up in (0, 1):
+            cache.warm(*level_change_source(self, is_level_up))
         
-        if self.is_walking:
-            # Walking Animation
-            anim_frames = self.assets.get_animation(f"{char_name}_walk")
-            if anim_frames:
-                frame_idx = 0 if self.animation_toggle else 1
-                sprite = anim_frames[frame_idx % len(anim_frames)]
+        for enemy in regular_enemies(self.state):
+            cache.warm(*start_anim_source(self, enemy, False, False))
+        if progress["current_area"] == 12:
+            cache.warm(*start_anim_source(self, last_boss(self.state), False, True))
         else:
-            # Idle Animation (Random Base)
-            anim_frames = self.assets.get_animation(f"{char_name}_idle")
-            if anim_frames:
-                # animation_base: 0=frame0, 1=frame1, 2=frame0_flip, 3=frame1_flip
-                frame_idx = self.animation_base % 2
-                flip_x = (self.animation_base >= 2)
-                sprite = anim_frames[frame_idx % len(anim_frames)]
-        
-        if sprite:
-            # Scale sprite (6x size as requested)
-            scale_factor = 6
-            scaled_size = (sprite.get_width() * scale_factor, sprite.get_height() * scale_factor)
-            sprite = pygame.transform.scale(sprite, scaled_size)
-            
-            if flip_x:
-                sprite = pygame.transform.flip(sprite, True, False)
-            
-            cx = screen.get_width() // 2 - sprite.get_width() // 2
-            cy = screen.get_height() // 2 - sprite.get_height() // 2
-            screen.blit(sprite, (cx, cy))
+            cache.warm(*start_anim_source(self, area_boss(self.state), True, False))
+
+    def lcd_theme(self):
+        """
+        (colors, inverted) for LcdDisplay.show: the current character's
+        D-Tector colors from config["colors"], inverted during hit flashes.
+        """
+        colors = self.state.config["colors"]
+        char = self.state.game_progress["current_char"]
+        return tuple(colors[char % len(colors)]), self.modes.handler.lcd_inverted()
+
+    def is_animating(self):
+        """True while a sequence plays that doesn't wait for input (battle start, attack, evolution...)"""
+        return self.modes.handler.is_animating()
+
+    def update(self, delta_time):
+        self.modes.handler.update(delta_time)
         
-        # Draw UI Overlay (Steps/Dist) - Replaced with graphical numbers if possible
-        # For now, just remove the ugly debug text.
-        # If we want to show steps, we should use spr_numbers_white
+    def draw(self, screen):
+        """
+        Draws the current screen. Returns the screen rects that changed (for
+        pygame.display.update), or None if the whole screen was redrawn.
+        """
+        handler = self.modes.handler
+        scene = handler.scene()
+        # Everything the managers draw is queued and submitted in one blits call
+        buffer = self.draw_buffer
+        buffer.begin(screen)
+        if scene is None:
+            self.scene_on_screen = None
+            screen.fill((255, 255, 255)) # Clear screen to white
+            handler.draw(buffer)
+            buffer.flush(screen)
+            return None
         
-        if self.state.game_progress["battle_start"]:
-            # Draw Battle Alert
-            alert_anim = self.assets.get_animation("battle_call") # Or similar
-            if alert_anim:
-                 # Draw alert
-                 pass
-            
-        if self.state.game_progress["event_start"]:
-            # Draw Event Alert
-            pass
+        # Retained screens only repaint what changed since their last render
+        if scene is not self.scene_on_screen:
+            scene.invalidate()
+            self.scene_on_screen = scene
+        handler.draw(buffer)
+        dirty = scene.render(screen)
+        buffer.flush(screen)
+        if buffer.frame_commands:
+            # Something drew over the scene
+            scene.invalidate()
+            return None
+        return dirty
@@ -1,5 +1,28 @@
 import pygame
-import random
+from src.engine.timeline import Draw, Stage, Timeline
+
+# Ancient evolution (obj_ancient_evo_dtector Draw), one tick every 3 frames.
+# Each spirit rises into the D-Tector, then the cover opens on the Ancient.
+_ANCIENT_BLINK = (Draw("ancient", 0, 0, 0, parity=1), Draw("ancient", 1, 0, 0, parity=0))
+_CHAR = Draw("char", 0, 3, 4)
+
+def _spirit_stages(role):
+    return [
+        Stage(29, 3, (Draw(role, 0, 3, 32, dy=-1),)),
+        Stage(7, 3, (Draw(role, 0, 3, 4), Draw("summon", 5, 0, 0, parity=1))),
+        Stage(29, 3, (Draw(role, 0, 3, 4, dy=-1),)),
+    ]
+
+ANCIENT_TIMELINE = Timeline(_spirit_stages("first_spirit") + _spirit_stages("second_spirit") + [
+    Stage(7, 3, _ANCIENT_BLINK + (Draw("cover", 0, 0, 0),)),
+    Stage(1, 3, (_CHAR,)),
+    Stage(7, 3, _ANCIENT_BLINK + (Draw("cover", 0, 0, 0),)),
+    Stage(2, 3, (_CHAR,)), # Spirit form of char? Using idle for now
+] + [Stage(2, 3, _ANCIENT_BLINK + (Draw("cover", frame, 0, 0),)) for frame in range(4)] + [
+    Stage(7, 3, (Draw("cover", 3, 0, 0, parity=1),)),
+    Stage(5, 3, (Draw("digimon", 0, 3, 4, parity=1),)),
+    Stage(4, 3, (Draw("digimon", 0, 3, 4),)),
+])
 
 class EvolutionManager:
     """
@@ -27,7 +50,7 @@ class EvolutionManager:
         """Start Ancient Evolution Animation"""
         self.state = "ANCIENT_ANIM"
         self.counter = 0
-        self.alarm_timer = 3
+        self.alarm_timer = ANCIENT_TIMELINE.durations[0]
         self.ancient_digimon_id = self.battle.mine_digimon
         self.current_char = self.control.game_progress["current_char"]
         
@@ -42,14 +65,10 @@ class EvolutionManager:
 
     def update(self, delta_time):
         if self.state == "ANCIENT_ANIM":
-            self.alarm_timer -= delta_time * 60
-            if self.alarm_timer <= 0:
-                self.counter += 1
-                self.alarm_timer = 3
-                
-                if self.counter > 170: # End of animation
-                    self.state = "IDLE"
-                    return "EVO_COMPLETE"
+            self.counter, self.alarm_timer = ANCIENT_TIMELINE.step(self.counter, self.alarm_timer, delta_time)
+            if self.counter >= ANCIENT_TIMELINE.length: # End of animation
+                self.state = "IDLE"
+                return "EVO_COMPLETE"
                     
         return None
 
@@ -58,82 +77,38 @@ class EvolutionManager:
             self._draw_ancient_anim(screen)
 
     def _draw_ancient_anim(self, screen):
-        # Logic from obj_ancient_evo_dtector Draw
-        x = screen.get_width() // 2 - 24 # Center (approx sprite width 48)
-        y = screen.get_height() // 2 - 16 # Center (approx sprite height 32)
-        scale = 6
-        
-        # Get Sprites
-        spirits = self.game.assets.get_animation("spirits_dtector")
-        summon = self.game.assets.get_animation("summon_dtector")
-        ancient = self.game.assets.get_animation("ancient_dtector")
-        cover = self.game.assets.get_animation("ancient_cover_dtector")
-        
-        # Character sprites
-        char_name = self.game.character_manager.get_character_name(self.current_char).lower()
-        char_idle = self.game.assets.get_animation(f"{char_name}_idle")
-        
-        # Digimon sprite
-        digimon_name = self.control.digimon_database[self.ancient_digimon_id]["name"] if self.ancient_digimon_id < len(self.control.digimon_database) else "agumon"
-        digimon_sprite = self.game.assets.get_digimon_sprite(digimon_name)
-        
-        if not (spirits and summon and ancient and cover):
+        # Logic from obj_ancient_evo_dtector Draw (see ANCIENT_TIMELINE)
+        ancient_anim = self.game.frame_cache.get(
+            ("ancient_evo", tuple(self.required_spirits), self.current_char, self.ancient_digimon_id),
+            self._bind_ancient_anim)
+        if ancient_anim is None:
             return
+        origin = (screen.get_width() // 2 - 24, screen.get_height() // 2 - 16) # Center (approx sprite size 48x32)
+        ancient_anim.draw(screen, self.counter, origin)
 
-        cnt = self.counter
+    def _bind_ancient_anim(self):
+        assets = self.game.assets
+        spirits = assets.get_animation("spirits_dtector")
+        summon = assets.get_animation("summon_dtector")
+        ancient = assets.get_animation("ancient_dtector")
+        cover = assets.get_animation("ancient_cover_dtector")
+        if not (spirits and summon and ancient and cover):
+            return None
         
-        # Drawing logic based on counter ranges
-        if 0 <= cnt <= 28:
-            self._draw_sprite(screen, spirits[self.required_spirits[0]], x + 3*scale, (y + 32*scale) - cnt*scale, scale)
-        elif 29 <= cnt <= 35:
-            self._draw_sprite(screen, spirits[self.required_spirits[0]], x + 3*scale, y + 4*scale, scale)
-            if cnt % 2:
-                self._draw_sprite(screen, summon[5], x, y, scale)
-        elif 36 <= cnt <= 64:
-            self._draw_sprite(screen, spirits[self.required_spirits[0]], x + 3*scale, (y + 4*scale) - (cnt - 36)*scale, scale)
-        elif 65 <= cnt <= 93:
-            self._draw_sprite(screen, spirits[self.required_spirits[1]], x + 3*scale, (y + 32*scale) - (cnt - 65)*scale, scale)
-        elif 94 <= cnt <= 100:
-            self._draw_sprite(screen, spirits[self.required_spirits[1]], x + 3*scale, y + 4*scale, scale)
-            if cnt % 2:
-                self._draw_sprite(screen, summon[5], x, y, scale)
-        elif 101 <= cnt <= 129:
-            self._draw_sprite(screen, spirits[self.required_spirits[1]], x + 3*scale, (y + 4*scale) - (cnt - 101)*scale, scale)
-        elif 130 <= cnt <= 136:
-            idx = 0 if cnt % 2 else 1
-            self._draw_sprite(screen, ancient[idx], x, y, scale)
-            self._draw_sprite(screen, cover[0], x, y, scale)
-        elif cnt == 137:
-            if char_idle: self._draw_sprite(screen, char_idle[0], x + 3*scale, y + 4*scale, scale)
-        elif 138 <= cnt <= 144:
-            idx = 0 if cnt % 2 else 1
-            self._draw_sprite(screen, ancient[idx], x, y, scale)
-            self._draw_sprite(screen, cover[0], x, y, scale)
-        elif cnt == 145:
-            if char_idle: self._draw_sprite(screen, char_idle[0], x + 3*scale, y + 4*scale, scale)
-        elif 146:
-             # Spirit form of char? Using idle for now
-            if char_idle: self._draw_sprite(screen, char_idle[0], x + 3*scale, y + 4*scale, scale)
-        elif 147 <= cnt <= 154:
-            idx = 0 if cnt % 2 else 1
-            self._draw_sprite(screen, ancient[idx], x, y, scale)
-            cover_idx = (cnt - 147) // 2
-            if cover_idx < len(cover):
-                self._draw_sprite(screen, cover[cover_idx], x, y, scale)
-        elif 155 <= cnt <= 161:
-            if cnt % 2:
-                self._draw_sprite(screen, cover[3], x, y, scale)
-        elif 162 <= cnt <= 166:
-            if cnt % 2 and digimon_sprite:
-                self._draw_sprite(screen, digimon_sprite, x + 3*scale, y + 4*scale, scale)
-        elif cnt >= 167:
-            if digimon_sprite:
-                self._draw_sprite(screen, digimon_sprite, x + 3*scale, y + 4*scale, scale)
-
-    def _draw_sprite(self, screen, sprite, x, y, scale):
-        scaled = pygame.transform.scale(sprite, 
-            (sprite.get_width() * scale, sprite.get_height() * scale))
-        screen.blit(scaled, (x, y))
+        # Character and Digimon sprites
+        char_name = self.control.char_stats[self.current_char]["name"].lower()
+        database = self.control.digimon_database
+        digimon = database[self.ancient_digimon_id] if self.ancient_digimon_id < len(database) else None
+        
+        return ANCIENT_TIMELINE.bind({
+            "first_spirit": [spirits[self.required_spirits[0]]],
+            "second_spirit": [spirits[self.required_spirits[1]]],
+            "summon": summon,
+            "ancient": ancient,
+            "cover": cover,
+            "char": assets.get_animation(f"{char_name}_idle"),
+            "digimon": assets.get_animation(f"digimon_{digimon['sprite']}") if digimon else None,
+        })
 
     def unlock_spirit(self, boss_id):
         """
@@ -142,7 +117,7 @@ class EvolutionManager:
         """
         spirit_id = self._get_spirit_to_unlock(boss_id)
         if spirit_id != -1:
-            self.control.spirits_obtained[spirit_id] = True
+            self.game.history.set_flag("spirits_obtained", spirit_id, True)
             return spirit_id
         return -1
 
@@ -0,0 +1,160 @@
+from src.game.state import GameState, _copy_data
+
+# Progress events. An event is a (type, arg, index, value) tuple of ints,
+# the same layout as a progress journal record, so events persist as-is.
+EV_STEPS = 1     # value = number of steps walked
+EV_BATTLE = 2    # arg = 1 win / 0 loss
+EV_PROGRESS = 3  # index = PROGRESS_FIELDS index, value = new value
+EV_STAT = 4      # arg = character index, index = STAT_FIELDS index, value = new value
+EV_FLAG = 5      # arg = FLAG_LISTS index, index = list position, value = 0/1
+
+# Field tables are append-only (indexes are stored in the journal)
+PROGRESS_FIELDS = (
+    "distance", "steps", "dpower", "battles", "wins", "current_char", "level",
+    "next_level_up", "next_level_down", "current_area", "current_char_hp",
+    "battle_start", "event_start", "last_encounter_is_battle",
+)
+BOOL_FIELDS = {"battle_start", "event_start", "last_encounter_is_battle"}
+STAT_FIELDS = ("hp", "spirit", "stamina", "skill")
+FLAG_LISTS = ("area_status", "spirits_unlocked", "spirits_obtained", "char_unlocked", "char_party")
+
+def apply_event(state, event):
+    """Reducer: applies one progress event to a GameState."""
+    ev_type, arg, index, value = event
+    progress = state.game_progress
+    if ev_type == EV_STEPS:
+        state.advance_steps(value)
+    elif ev_type == EV_BATTLE:
+        progress["battles"] += 1
+        if arg:
+            progress["wins"] += 1
+        state.mark_dirty("game_progress")
+    elif ev_type == EV_PROGRESS:
+        name = PROGRESS_FIELDS[index]
+        progress[name] = bool(value) if name in BOOL_FIELDS else value
+        state.mark_dirty("game_progress")
+    elif ev_type == EV_STAT:
+        state.char_stats[arg][STAT_FIELDS[index]] = value
+        state.changed_chars.add(arg)
+        state.mark_dirty("char_stats")
+    elif ev_type == EV_FLAG:
+        name = FLAG_LISTS[arg]
+        if name == "area_status":
+            progress[name][index] = bool(value)
+            state.mark_dirty("game_progress")
+        else:
+            getattr(state, name)[index] = bool(value)
+            state.mark_dirty(name)
+
+def replay_events(data, events):
+    """
+    Applies events to a copy of to_dict() data and returns the result.
+    Works on plain data only, so it can run in a worker process.
+    """
+    state = GameState()
+    state.from_dict(_copy_data(data))
+    for event in events:
+        apply_event(state, event)
+    return state.snapshot()
+
+class ProgressHistory:
+    """
+    Event-sourced game progress.
+    Gameplay code changes progress through dispatch() (or the helpers below)
+    instead of writing to the state dicts: each event is applied by
+    apply_event(), kept in memory and forwarded to the progress journal.
+    A copy of the state is kept every `checkpoint_interval` events, so any
+    point in the history can be rebuilt by replaying at most that many events.
+    Only the last `max_checkpoints` checkpoints are kept, with the events
+    after the oldest one, so memory stays bounded over a long session; the
+    journal and saves hold everything older.
+    """
+    def __init__(self, state, journal=None, checkpoint_interval=256, max_checkpoints=16):
+        self.state = state
+        self.journal = journal
+        self.checkpoint_interval = checkpoint_interval
+        self.max_checkpoints = max_checkpoints
+        self.reset()
+
+    def reset(self):
+        """Starts a new history at the current state."""
+        self.first = 0 # Event count of the oldest checkpoint (earlier events were dropped)
+        self.events = [] # Events after `first`
+        self.checkpoints = [(0, self.state.snapshot())] # (event count, to_dict data)
+
+    def __len__(self):
+        return self.first + len(self.events)
+
+    def dispatch(self, ev_type, arg=0, index=0, value=0):
+        event = (ev_type, arg, index, value)
+        apply_event(self.state, event)
+        self.events.append(event)
+        if self.journal:
+            self.journal.record(*event)
+        count = len(self)
+        if count % self.checkpoint_interval == 0:
+            self.checkpoints.append((count, self.state.snapshot()))
+            if len(self.checkpoints) > self.max_checkpoints:
+                # Forget the oldest segment
+                del self.checkpoints[0]
+                start = self.checkpoints[0][0]
+                del self.events[:start - self.first]
+                self.first = start
+
+    def steps(self, count=1):
+        self.dispatch(EV_STEPS, value=count)
+
+    def battle(self, win):
+        self.dispatch(EV_BATTLE, arg=1 if win else 0)
+
+    def set_progress(self, **fields):
+        """set_progress(level=5, next_level_up=5): one event per field."""
+        for name, value in fields.items():
+            self.dispatch(EV_PROGRESS, index=PROGRESS_FIELDS.index(name), value=int(value))
+
+    def set_stats(self, rows):
+        """New stats per character (rows in STAT_FIELDS order); only changes are logged."""
+        for char_idx, row in enumerate(rows):
+            char = self.state.char_stats[char_idx]
+            for stat_idx, key in enumerate(STAT_FIELDS):
+                if char[key] != row[stat_idx]:
+                    self.dispatch(EV_STAT, arg=char_idx, index=stat_idx, value=int(row[stat_idx]))
+
+    def set_flag(self, list_name, index, value=True):
+        self.dispatch(EV_FLAG, arg=FLAG_LISTS.index(list_name), index=index, value=1 if value else 0)
+
+    def state_at(self, count):
+        """
+        to_dict() data as it was after the first `count` events (clamped to
+        the oldest kept checkpoint).
+        """
+        count = max(self.first, min(count, len(self)))
+        # Checkpoints sit at every multiple of checkpoint_interval from `first`
+        start, data = self.checkpoints[(count - self.first) // self.checkpoint_interval]
+        return replay_events(data, self.events[start - self.first:count - self.first])
+
+    def rewind(self, count):
+        """
+        Returns the live state to how it was after `count` events.
+        Later events are dropped; play continues from there.
+        """
+        count = max(self.first, min(count, len(self)))
+        data = self.state_at(count)
+        # journal_seq only moves forward (see DtectorGame.restore)
+        journal_seq = self.state.game_progress.get("journal_seq", 0)
+        self.state.from_dict(data)
+        progress = self.state.game_progress
+        progress["journal_seq"] = max(progress.get("journal_seq", 0), journal_seq)
+
+        del self.events[count - self.first:]
+        self.checkpoints = [cp for cp in self.checkpoints if cp[0] <= count]
+
+    def segments(self):
+        """
+        (checkpoint data, events) pairs covering the whole history. Each one
+        is independent of the others, so long histories can be analysed in
+        parallel, e.g. Pool.starmap(replay_events, history.segments()).
+        """
+        bounds = [cp[0] for cp in self.checkpoints[1:]] + [len(self)]
+        return [(data, self.events[start - self.first:end - self.first])
+                for (start, data), end in zip(self.checkpoints, bounds)]
@@ -1,5 +1,72 @@
 import pygame
-import random
+import numpy as np
+from src.engine.timeline import Draw, Stage, Timeline
+
+# Stat columns, in the order used by the tables below
+STAT_KEYS = ("hp", "spirit", "stamina", "skill")
+
+# Per-character stat caps (from GML). Rows follow GameState.char_stats order.
+STAT_CAPS = np.array([
+    [210, 175, 160, 170], # Takuya
+    [210, 160, 160, 185], # Koji
+    [240, 195, 150, 180], # JP
+    [185, 150, 190, 165], # Zoe
+    [100, 180, 140, 180], # Tommy
+    [110, 185, 160, 160], # Koichi
+])
+
+# Per-character stat change per level (inclusive range, GML: irandom_range(1, 4))
+GROWTH_MIN = np.full(STAT_CAPS.shape, 1)
+GROWTH_MAX = np.full(STAT_CAPS.shape, 4)
+
+def stats_to_array(char_stats):
+    """Packs char_stats into a (characters, STAT_KEYS) int array."""
+    return np.array([[c[key] for key in STAT_KEYS] for c in char_stats])
+
+def array_to_stats(array, char_stats):
+    """Writes a stats array back into the char_stats dicts in place."""
+    for char, row in zip(char_stats, array.tolist()):
+        for key, value in zip(STAT_KEYS, row):
+            char[key] = value
+
+def project_stats(char_stats, levels, sample=False, rng=None):
+    """
+    Projects every character's stats after `levels` level changes
+    (positive = level ups, negative = level downs) without stepping
+    level by level.
+    sample=False returns the expected stats (mean growth, clamped);
+    sample=True draws all the per-level changes in one call.
+    Caps and the 0 floor are monotonic, so clamping once at the end
+    gives the same result as clamping after every level.
+    """
+    stats = stats_to_array(char_stats)
+    count = abs(levels)
+    if count == 0:
+        return stats
+    
+    if sample:
+        rng = rng if rng is not None else np.random.default_rng()
+        delta = rng.integers(GROWTH_MIN, GROWTH_MAX + 1,
+                             size=(count,) + STAT_CAPS.shape).sum(axis=0)
+    else:
+        delta = np.rint(count * (GROWTH_MIN + GROWTH_MAX) / 2).astype(int)
+        
+    if levels > 0:
+        return np.minimum(stats + delta, STAT_CAPS)
+    return np.maximum(stats - delta, 0)
+
+def level_change_source(game, is_level_up):
+    """(key, build) of the level up (0) / level down (1) screen for game.frame_cache"""
+    def build():
+        frames = game.assets.get_animation("change_level")
+        if not frames or is_level_up >= len(frames):
+            return None
+        sprite = frames[is_level_up]
+        # One frame, centered on the origin
+        return Timeline([
+            Stage(1, 12, (Draw("change", 0, -sprite.get_width() / 2, -sprite.get_height() / 2),)),
+        ]).bind({"change": [sprite]})
+    return ("level_change", is_level_up), build
 
 class LevelManager:
     """
@@ -24,9 +91,11 @@ class LevelManager:
         self.is_level_up = 2
         
         progress = self.control.game_progress
+        history = self.game.history
         
+        history.battle(win)
         if win:
-            progress["next_level_up"] -= 1
+            history.set_progress(next_level_up=progress["next_level_up"] - 1)
             if progress["next_level_up"] <= 0 and progress["level"] < 99:
                 self._level_up()
                 self.is_level_up = 0
@@ -34,7 +103,7 @@ class LevelManager:
             else:
                 pass
         else:
-            progress["next_level_down"] -= 1
+            history.set_progress(next_level_down=progress["next_level_down"] - 1)
             if progress["next_level_down"] <= 0 and progress["level"] > 1:
                 self._level_down()
                 self.is_level_up = 1
@@ -46,61 +115,37 @@ class LevelManager:
 
     def _level_up(self):
         progress = self.control.game_progress
-        progress["level"] += 1
-        progress["next_level_up"] = 5
-        progress["next_level_down"] = 5
+        self.game.history.set_progress(level=progress["level"] + 1, next_level_up=5, next_level_down=5)
         
-        # Increase stats
-        for i, char_stats in enumerate(self.game.state.char_stats):
-            char_stats["hp"] += random.randint(1, 4)
-            char_stats["spirit"] += random.randint(1, 4)
-            char_stats["stamina"] += random.randint(1, 4)
-            char_stats["skill"] += random.randint(1, 4)
-            
-            # Caps (from GML)
-            if i == 0: # Takuya
-                char_stats["hp"] = min(char_stats["hp"], 210)
-                char_stats["spirit"] = min(char_stats["spirit"], 175)
-                char_stats["stamina"] = min(char_stats["stamina"], 160)
-                char_stats["skill"] = min(char_stats["skill"], 170)
-            elif i == 1: # Koji
-                char_stats["hp"] = min(char_stats["hp"], 210)
-                char_stats["spirit"] = min(char_stats["spirit"], 160)
-                char_stats["stamina"] = min(char_stats["stamina"], 160)
-                char_stats["skill"] = min(char_stats["skill"], 185)
-            elif i == 2: # JP
-                char_stats["hp"] = min(char_stats["hp"], 240)
-                char_stats["spirit"] = min(char_stats["spirit"], 195)
-                char_stats["stamina"] = min(char_stats["stamina"], 150)
-                char_stats["skill"] = min(char_stats["skill"], 180)
-            elif i == 3: # Zoe
-                char_stats["hp"] = min(char_stats["hp"], 185)
-                char_stats["spirit"] = min(char_stats["spirit"], 150)
-                char_stats["stamina"] = min(char_stats["stamina"], 190)
-                char_stats["skill"] = min(char_stats["skill"], 165)
-            elif i == 4: # Tommy
-                char_stats["hp"] = min(char_stats["hp"], 100)
-                char_stats["spirit"] = min(char_stats["spirit"], 180)
-                char_stats["stamina"] = min(char_stats["stamina"], 140)
-                char_stats["skill"] = min(char_stats["skill"], 180)
-            elif i == 5: # Koichi
-                char_stats["hp"] = min(char_stats["hp"], 110)
-                char_stats["spirit"] = min(char_stats["spirit"], 185)
-                char_stats["stamina"] = min(char_stats["stamina"], 160)
-                char_stats["skill"] = min(char_stats["skill"], 160)
+        # Increase stats (one draw for all characters, then per-character caps)
+        stats = stats_to_array(self.game.state.char_stats)
+        growth = self.game.rng.stream("level").integers(GROWTH_MIN, GROWTH_MAX + 1)
+        self.game.history.set_stats(np.minimum(stats + growth, STAT_CAPS).tolist())
 
     def _level_down(self):
         progress = self.control.game_progress
-        progress["level"] -= 1
-        progress["next_level_up"] = 5
-        progress["next_level_down"] = 5
+        self.game.history.set_progress(level=progress["level"] - 1, next_level_up=5, next_level_down=5)
         
         # Decrease stats
-        for char_stats in self.game.state.char_stats:
-            char_stats["hp"] = max(0, char_stats["hp"] - random.randint(1, 4))
-            char_stats["spirit"] = max(0, char_stats["spirit"] - random.randint(1, 4))
-            char_stats["stamina"] = max(0, char_stats["stamina"] - random.randint(1, 4))
-            char_stats["skill"] = max(0, char_stats["skill"] - random.randint(1, 4))
+        stats = stats_to_array(self.game.state.char_stats)
+        loss = self.game.rng.stream("level").integers(GROWTH_MIN, GROWTH_MAX + 1)
+        self.game.history.set_stats(np.maximum(stats - loss, 0).tolist())
+
+    def fast_forward(self, target_level):
+        """
+        Jump straight to target_level, sampling the stat changes of every
+        skipped level-up/level-down in a single call.
+        """
+        progress = self.control.game_progress
+        target_level = max(1, min(99, target_level))
+        steps = target_level - progress["level"]
+        if steps == 0:
+            return
+        
+        projected = project_stats(self.game.state.char_stats, steps, sample=True,
+                                  rng=self.game.rng.stream("level"))
+        self.game.history.set_stats(projected.tolist())
+        self.game.history.set_progress(level=target_level, next_level_up=5, next_level_down=5)
 
     def start_position(self, happy, sad):
         """Start position transition (walking back to map)"""
@@ -133,19 +178,10 @@ class LevelManager:
     def draw(self, screen):
         if self.state == "LEVEL_CHANGE":
             if self.is_level_up != 2:
-                frames = self.game.assets.get_animation("change_level")
-                if frames:
-                    # 0: Up, 1: Down
-                    idx = 0 if self.is_level_up == 0 else 1
-                    if idx < len(frames):
-                        sprite = frames[idx]
-                        scale = 6
-                        scaled = pygame.transform.scale(sprite, 
-                            (sprite.get_width() * scale, sprite.get_height() * scale))
-                        
-                        x = (screen.get_width() - scaled.get_width()) // 2
-                        y = (screen.get_height() - scaled.get_height()) // 2
-                        screen.blit(scaled, (x, y))
+                # 0: Up, 1: Down
+                sequence = self.game.frame_cache.get(*level_change_source(self.game, self.is_level_up))
+                if sequence:
+                    sequence.draw(screen, 0, (screen.get_width() // 2, screen.get_height() // 2))
                         
         elif self.state == "POSITION":
             # Draw walking animation
@@ -1,4 +1,23 @@
 import pygame
+from src.engine.lcd import blank_like
+
+# Maps 0-3 scroll between two frames of spr_map_dtector (obj_map_swap_dtector):
+# the strip's frames as (frame, x, y), where the map's own frame sits in the
+# strip, and the direction the view moves per swap step.
+MAP_STRIPS = {
+    0: (((0, 0, 0), (1, 0, 32)), (0, 0), (0, 1)),
+    1: (((1, 0, 0), (2, 30, 0)), (0, 0), (1, 0)),
+    2: (((3, 0, 0), (2, 0, 32)), (0, 32), (0, -1)),
+    3: (((0, 0, 0), (3, 30, 0)), (30, 0), (-1, 0)),
+}
+
+# Area indicators per map: (area, x, y) from the map's own frame
+MAP_AREAS = {
+    0: ((0, 15, 20), (1, 3, 26), (2, 23, 26)),
+    1: ((3, 11, 6), (4, 25, 8), (5, 23, 18)),
+    2: ((6, 2, 12), (7, 8, 2), (8, 20, 9)),
+    3: ((9, 24, 26), (10, 5, 23), (11, 12, 17)),
+}
 
 class MapManager:
     """
@@ -31,6 +50,7 @@ class MapManager:
         self.alarm_timer = 12
         self.blink_timer = 0
         self.swap_timer = 0
+        self.strips = {} # Composited map screens per visual state (see _strip)
         
     def _init_map_from_area(self):
         # Logic from obj_map_dtector Create
@@ -47,6 +67,20 @@ class MapManager:
         elif area >= 12: return 4 # Map 5
         return 0
 
+    def new_distance(self, area):
+        """Distance to walk after selecting `area` (shown on the confirm screen)"""
+        progress = self.control.game_progress
+        if progress["current_area"] == area:
+            return progress["distance"] # Keep the remaining distance
+        dist = self.control.area_distance[area]
+        if progress["area_status"][area]:
+            dist = dist // 2
+        return dist
+        
+    def select_area(self, area):
+        """Travel to `area` with its new distance"""
+        self.game.history.set_progress(distance=self.new_distance(area), current_area=area)
+
     def check_progression(self):
         """
         Checks if the current area is complete and handles transitions.
@@ -55,10 +89,11 @@ class MapManager:
         """
         progress = self.control.game_progress
         current_area = progress["current_area"]
+        history = self.game.history
         
         # Mark current area as complete
         if current_area < len(progress["area_status"]):
-            progress["area_status"][current_area] = True
+            history.set_flag("area_status", current_area, True)
             
         # Check if all maps are complete (0-11)
         all_maps_complete = True
@@ -72,9 +107,7 @@ class MapManager:
             # In GML this triggers obj_map5_swap_dtector animation
             # For now, we'll just transition directly or set a flag
             print("All maps complete! Unlocking Dark Area...")
-            progress["current_area"] = 12
-            # Reset distance for new area (needs area_distance array in state)
-            # progress["distance"] = self.control.area_distance[12] 
+            self.select_area(12)
             return "MAP_5_UNLOCK"
             
         # Check for map change (e.g. Map 0 -> Map 1)
@@ -83,16 +116,14 @@ class MapManager:
         if change_map["change"]:
             # Switch to new map
             print(f"Map Complete! Moving to Area {change_map['new_area']}")
-            progress["current_area"] = change_map["new_area"]
-            # progress["distance"] = self.control.area_distance[change_map['new_area']]
+            self.select_area(change_map["new_area"])
             return "MAP_CHANGE"
         else:
             # Switch to next area in current map
             new_area = self._change_area(current_area, progress["area_status"])
             if new_area != -1:
                 print(f"Area Complete! Moving to Area {new_area}")
-                progress["current_area"] = new_area
-                # progress["distance"] = self.control.area_distance[new_area]
+                self.select_area(new_area)
                 return "AREA_CHANGE"
                 
         return "NONE"
@@ -286,59 +317,58 @@ class MapManager:
         map_w = frames[0].get_width() * scale
         map_h = frames[0].get_height() * scale
         
-        # Create a viewport surface for clipping
-        viewport = pygame.Surface((map_w, map_h), pygame.SRCALPHA)
+        # One blit of the composited strip, offset by the swap scroll
+        strip, view_x, view_y = self._strip(frames, cover_frames, area_frames, scale)
+        x = (screen.get_width() - map_w) // 2
+        y = (screen.get_height() - map_h) // 2
+        screen.blit(strip, (x, y), pygame.Rect(view_x, view_y, map_w, map_h))
+
+    def _strip(self, frames, cover_frames, area_frames, scale):
+        """
+        The map screen composited once per visual state: both map frames of
+        the strip, the area indicators and any overlay, cached in self.strips.
+        Returns (strip, view_x, view_y), the viewport's offset into the strip.
+        """
+        progress = self.control.game_progress
+        confirm = self.state == "CONFIRM"
+        overlay = confirm or (self.change == 1 and area_frames)
         
-        # Draw relative to viewport (0, 0)
-        # Offsets (pos_x, pos_y) shift the map content within the viewport
+        if self.map == 4:
+            home, scroll = (0, 0), (0, 0)
+        else:
+            home, scroll = MAP_STRIPS[self.map][1:]
+        view_x = (home[0] + scroll[0] * self.pos_x) * scale
+        view_y = (home[1] + scroll[1] * self.pos_y) * scale
         
-        # Draw Map Background
-        if self.map == 0:
-            self._draw_scaled(viewport, frames[0], 0, 0 - (self.pos_y * scale), scale)
-            self._draw_scaled(viewport, frames[1], 0, (32*scale) - (self.pos_y * scale), scale)
-            
-            offset_y = self.pos_y * scale
-            self._draw_area_indicator(viewport, 0, 15*scale, 20*scale - offset_y, scale)
-            self._draw_area_indicator(viewport, 1, 3*scale, 26*scale - offset_y, scale)
-            self._draw_area_indicator(viewport, 2, 23*scale, 26*scale - offset_y, scale)
-            
-        elif self.map == 1:
-            offset_x = self.pos_x * scale
-            self._draw_scaled(viewport, frames[1], 0 - offset_x, 0, scale)
-            self._draw_scaled(viewport, frames[2], (30*scale) - offset_x, 0, scale)
-            
-            self._draw_area_indicator(viewport, 3, 11*scale - offset_x, 6*scale, scale)
-            self._draw_area_indicator(viewport, 4, 25*scale - offset_x, 8*scale, scale)
-            self._draw_area_indicator(viewport, 5, 23*scale - offset_x, 18*scale, scale)
-
-        elif self.map == 2:
-            offset_y = self.pos_y * scale
-            self._draw_scaled(viewport, frames[2], 0, 0 + offset_y, scale)
-            self._draw_scaled(viewport, frames[3], 0, (-32*scale) + offset_y, scale)
-            
-            self._draw_area_indicator(viewport, 6, 2*scale, 12*scale + offset_y, scale)
-            self._draw_area_indicator(viewport, 7, 8*scale, 2*scale + offset_y, scale)
-            self._draw_area_indicator(viewport, 8, 20*scale, 9*scale + offset_y, scale)
-            
-        elif self.map == 3:
-            offset_x = self.pos_x * scale
-            self._draw_scaled(viewport, frames[3], 0 + offset_x, 0, scale)
-            self._draw_scaled(viewport, frames[0], (-30*scale) + offset_x, 0, scale)
-            
-            self._draw_area_indicator(viewport, 9, 24*scale + offset_x, 26*scale, scale)
-            self._draw_area_indicator(viewport, 10, 5*scale + offset_x, 23*scale, scale)
-            self._draw_area_indicator(viewport, 11, 12*scale + offset_x, 17*scale, scale)
-
-        elif self.map == 4:
+        # Overlays stay put while the map scrolls, so they pin the strip to this view
+        key = (self.map, self.change, self.aux_area, self.display, self.current_menu,
+               progress["current_area"], tuple(progress["area_status"]),
+               self.new_distance(self.aux_area) if confirm else None,
+               (view_x, view_y) if overlay else None)
+        strip = self.strips.get(key)
+        if strip is not None:
+            return strip, view_x, view_y
+        
+        if self.map == 4:
             # Map 5 (Dark Area / Final)
+            strip = blank_like(frames[0], (frames[0].get_width() * scale, frames[0].get_height() * scale))
             map5_frames = self.game.assets.get_animation("map_5")
             if map5_frames:
                 frame_idx = self.current_menu + 1
                 if frame_idx < len(map5_frames):
-                    self._draw_scaled(viewport, map5_frames[frame_idx], 0, 0, scale)
+                    self._draw_scaled(strip, map5_frames[frame_idx], 0, 0, scale)
                     
                 if self.display:
-                    self._draw_scaled(viewport, cover_frames[0], 11*scale, 17*scale, scale)
+                    self._draw_scaled(strip, cover_frames[0], 11*scale, 17*scale, scale)
+        else:
+            layout = MAP_STRIPS[self.map][0]
+            width = max((x + frames[f].get_width()) * scale for f, x, _ in layout)
+            height = max((y + frames[f].get_height()) * scale for f, _, y in layout)
+            strip = blank_like(frames[0], (width, height))
+            for f, x, y in layout:
+                self._draw_scaled(strip, frames[f], x*scale, y*scale, scale)
+            for area, x, y in MAP_AREAS[self.map]:
+                self._draw_area_indicator(strip, area, (home[0] + x)*scale, (home[1] + y)*scale, scale)
 
         # Draw Area Name/Icon if confirming change
         if self.change == 1 and area_frames:
@@ -347,40 +377,28 @@ class MapManager:
                 aux_area_y = 24 * scale
             
             if self.aux_area < len(area_frames):
-                self._draw_scaled(viewport, area_frames[self.aux_area], 0, 0 + aux_area_y, scale)
+                self._draw_scaled(strip, area_frames[self.aux_area], view_x, view_y + aux_area_y, scale)
 
         # Draw Confirm Screen (Distance)
-        if self.state == "CONFIRM":
+        if confirm:
             change_frames = self.game.assets.get_animation("change_map_dtector")
             if change_frames:
                 # Draw change map background (likely covers everything)
-                self._draw_scaled(viewport, change_frames[0], 0, 0, scale)
+                self._draw_scaled(strip, change_frames[0], view_x, view_y, scale)
                 
                 # Calculate distance
-                progress = self.control.game_progress
-                dist = self.control.area_distance[self.aux_area]
-                
-                if progress["area_status"][self.aux_area]:
-                    dist = dist // 2
-                    
-                if progress["current_area"] == self.aux_area:
-                    dist = progress["distance"]
+                dist = self.new_distance(self.aux_area)
                     
                 # Draw distance number
                 # GML: draw_number_with_sprite(new_distance, x + 26, y + 24, spr_numbers);
-                # Our viewport is 30x32. x+26 is right edge.
-                # We need to draw it relative to viewport.
-                # TextRenderer draws to screen, but we want to draw to viewport?
-                # Actually TextRenderer takes a surface.
-                
-                # Position: x=26, y=24 relative to viewport (0,0)
-                # Scale is 6. So 26*6, 24*6.
-                self.game.text_renderer.draw_number(viewport, dist, 26*scale, 24*scale, align="right", scale=scale)
-
-        # Blit viewport to center of screen
-        x = (screen.get_width() - map_w) // 2
-        y = (screen.get_height() - map_h) // 2
-        screen.blit(viewport, (x, y))
+                # Position: x=26, y=24 relative to the viewport, right aligned
+                self.game.text_renderer.draw_number(strip, dist, view_x + 26*scale, view_y + 24*scale, align="right", scale=scale)
+        
+        # Blinking flips between two states; a handful covers the screen
+        if len(self.strips) >= 8:
+            self.strips.clear()
+        self.strips[key] = strip
+        return strip, view_x, view_y
 
     def handle_input(self, event):
         if self.state == "SELECT":
@@ -461,32 +479,8 @@ class MapManager:
              if event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_RIGHT:
                     # Confirm Selection
-                    progress = self.control.game_progress
-                    
-                    # Update current area
-                    progress["current_area"] = self.aux_area
-                    
-                    # Update distance
-                    dist = self.control.area_distance[self.aux_area]
-                    if progress["area_status"][self.aux_area]:
-                        dist = dist // 2
-                    
-                    # If it was already current area, keep remaining distance?
-                    # GML logic: if (control.game_progress.current_area == aux_area) new_distance = control.game_progress.distance;
-                    # But we just set current_area = aux_area above.
-                    # So we should check BEFORE setting.
-                    # Wait, if I select a NEW area, I want full distance.
-                    # If I select CURRENT area, I want remaining distance.
-                    # But I just overwrote current_area.
-                    
-                    # Let's fix logic:
-                    if progress["current_area"] != self.aux_area:
-                         progress["distance"] = dist
-                         progress["current_area"] = self.aux_area
-                    else:
-                         # Already current area, keep distance (don't reset)
-                         pass
-                         
+                    # GML: if (current_area == aux_area) new_distance = distance
+                    self.select_area(self.aux_area)
                     return "MAP_SELECTED"
                     
                 elif event.key == pygame.K_LEFT or event.key == pygame.K_UP:
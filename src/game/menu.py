@@ -1,5 +1,7 @@
 import pygame
-from src.game.submenus import StatusSelectMenu, StatusViewMenu, SpiritsMenu, PlaceholderMenu, CampMenu, DatabaseMenu
+from src.game import submenus
+from src.utils.snapshot import capture, restore
+from src.game.submenus import StatusSelectMenu, StatusViewMenu, SpiritsMenu, PlaceholderMenu, CampMenu, DatabaseMenu, SlotSelectMenu
 
 class MenuManager:
     def __init__(self, game):
@@ -22,7 +24,8 @@ class MenuManager:
             0: {"name": "Database", "action": self.action_database},
             1: {"name": "Text", "action": self.action_text},
             2: {"name": "Game", "action": self.action_game},
-            3: {"name": "TV", "action": self.action_tv}
+            3: {"name": "TV", "action": self.action_tv},
+            4: {"name": "Slots", "action": self.action_slots}
         }
         
     def push_menu(self, menu):
@@ -34,6 +37,23 @@ class MenuManager:
         if self.menu_stack:
             self.menu_stack.pop()
 
+    def snapshot(self):
+        """Menu position and the open submenus (by class name)"""
+        return {
+            "manager": capture(self),
+            "stack": [[type(menu).__name__, capture(menu)] for menu in self.menu_stack],
+        }
+        
+    def restore(self, data):
+        restore(self, data["manager"])
+        self.menu_stack = []
+        for name, fields in data["stack"]:
+            menu_class = getattr(submenus, name)
+            menu = menu_class.__new__(menu_class)
+            submenus.BaseMenu.__init__(menu, self.game, self)
+            restore(menu, fields)
+            self.menu_stack.append(menu)
+
     def update(self, delta_time):
         """Update active submenu"""
         if self.menu_stack:
@@ -134,6 +154,10 @@ class MenuManager:
     def action_tv(self):
         self.push_menu(PlaceholderMenu(self.game, self, "TV - Video Viewer"))
 
+    def action_slots(self):
+        if self.game.slots:
+            self.push_menu(SlotSelectMenu(self.game, self))
+
     def draw(self, screen):
         # If submenu is active, draw it instead
         if self.menu_stack:
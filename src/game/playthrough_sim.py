@@ -0,0 +1,168 @@
+import argparse
+import contextlib
+import os
+import time
+from multiprocessing import Pool
+import numpy as np
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy") # Headless workers
+import pygame
+from src.game.dtector import DtectorGame, GameMode
+from src.game.battle import BattlePhase
+from src.game.attack import MOVE_STATS, SCAN_MOVES
+
+AREA_COUNT = 13
+
+# Scan pattern that produces each move (first match in SCAN_MOVES)
+MOVE_PATTERNS = {}
+for pattern, move in SCAN_MOVES.items():
+    MOVE_PATTERNS.setdefault(move, list(pattern))
+
+def _scan_pattern(policy, game, battle):
+    """
+    random: any of the 8 patterns
+    best:   the pattern for the player's strongest move
+    bits:   always that pattern, e.g. "111"
+    """
+    if policy == "random":
+        return [int(bit) for bit in game.rng.stream("policy").integers(0, 2, 3)]
+    if policy == "best":
+        digimon = game.state.digimon_database[battle.mine_digimon]
+        best = max(range(len(MOVE_STATS)), key=lambda move: digimon[MOVE_STATS[move]])
+        return MOVE_PATTERNS[best]
+    return [int(bit) for bit in policy]
+
+def _fight(game, policy, heal, max_turns):
+    """Plays the current battle through AttackManager/BattleManager, skipping animations."""
+    battle = game.battle_manager
+    if heal:
+        # Rest before every battle
+        battle.current_mine_hp = game.state.digimon_database[battle.mine_digimon]["hp"]
+        game.history.set_progress(current_char_hp=battle.current_mine_hp)
+
+    attack = battle.attack_manager
+    for _ in range(max_turns):
+        battle.phases.reset(BattlePhase.ATTACK_SEQ) # Skip the start animation, menu and scan
+        attack.start_attack(_scan_pattern(policy, game, battle))
+        if attack._resolve_combat_final() == "HIT":
+            attack._apply_damage()
+        attack.active = False
+        battle._handle_turn_end() # Win/loss, level check, boss progression
+        if battle.state == BattlePhase.LEVEL_SEQ:
+            break
+    won = battle.current_enemy_hp <= 0
+    game.switch_to_walking()
+    return won
+
+def play_game(seed, game_index, policy="random", heal=True, max_steps=500000,
+              sample_every=1000, max_turns=200):
+    """
+    Plays one complete game headlessly (walking, encounters, battles, level
+    changes, area transitions) until the last boss is beaten or max_steps.
+    Each game gets its own RNG streams from (seed, game_index).
+    """
+    pygame.init()
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        game = DtectorGame(seed=seed, autosave=False)
+        game.rng = game.rng.spawn(game_index)
+        progress = game.state.game_progress
+
+        levels = []
+        area_steps = [-1] * AREA_COUNT
+        loss_streak = max_loss_streak = 0
+        steps = 0
+        while steps < max_steps and not progress["area_status"][AREA_COUNT - 1]:
+            game.increment_steps()
+            steps += 1
+
+            if game.current_state == GameMode.BATTLE:
+                if _fight(game, policy, heal, max_turns):
+                    loss_streak = 0
+                else:
+                    loss_streak += 1
+                    max_loss_streak = max(max_loss_streak, loss_streak)
+            elif game.current_state == GameMode.EVENT:
+                game.switch_to_walking()
+
+            for area, done in enumerate(progress["area_status"]):
+                if done and area_steps[area] < 0:
+                    area_steps[area] = steps
+            if steps % sample_every == 0:
+                levels.append(progress["level"])
+
+    return {
+        "finished": progress["area_status"][AREA_COUNT - 1],
+        "steps": steps,
+        "battles": progress["battles"],
+        "wins": progress["wins"],
+        "level": progress["level"],
+        "levels": levels,
+        "area_steps": area_steps,
+        "max_loss_streak": max_loss_streak,
+    }
+
+def _play_task(task):
+    return play_game(*task)
+
+def run_games(games, seed, workers=None, policy="random", heal=True, max_steps=500000, sample_every=1000):
+    """Plays `games` games on a process pool. Games share nothing, so throughput scales with workers."""
+    tasks = [(seed, index, policy, heal, max_steps, sample_every) for index in range(games)]
+    with Pool(workers) as pool:
+        results = list(pool.imap_unordered(_play_task, tasks))
+        # Let workers exit on their own: after pygame.init() SDL handles
+        # SIGTERM, so the terminate() in Pool.__exit__ would wait forever
+        pool.close()
+        pool.join()
+    return results
+
+def aggregate(results):
+    """Steps-to-finish, level curve and loss streak statistics over many games."""
+    finished = [r for r in results if r["finished"]]
+    finish_steps = np.array([r["steps"] for r in finished])
+    streaks = np.array([r["max_loss_streak"] for r in results])
+
+    # Level curve: games that stopped early keep their last level
+    length = max(len(r["levels"]) for r in results)
+    curves = np.array([r["levels"] + [r["level"]] * (length - len(r["levels"])) for r in results])
+
+    area_steps = np.array([r["area_steps"] for r in results], dtype=float)
+    area_steps[area_steps < 0] = np.nan
+
+    summary = {
+        "games": len(results),
+        "finish_rate": len(finished) / len(results),
+        "win_rate": sum(r["wins"] for r in results) / max(1, sum(r["battles"] for r in results)),
+        "max_loss_streak_mean": float(streaks.mean()),
+        "max_loss_streak_max": int(streaks.max()),
+        "level_curve": curves.mean(axis=0).round(2).tolist() if length else [],
+        # None for areas no game reached (nanmean warns on all-NaN columns)
+        "area_steps_mean": [None if np.isnan(col).all() else int(np.nanmean(col)) for col in area_steps.T],
+    }
+    if finished:
+        summary["finish_steps_mean"] = float(finish_steps.mean())
+        summary["finish_steps_percentiles"] = {p: int(v) for p, v in zip((10, 50, 90), np.percentile(finish_steps, (10, 50, 90)))}
+    return summary
+
+def main():
+    parser = argparse.ArgumentParser(description="Headless full-playthrough simulator")
+    parser.add_argument("-n", "--games", type=int, default=32)
+    parser.add_argument("-j", "--workers", type=int, help="processes (default: all cores)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--policy", default="random", help="scan policy: random, best or a pattern like 111")
+    parser.add_argument("--no-heal", action="store_true", help="don't restore HP before battles")
+    parser.add_argument("--max-steps", type=int, default=500000)
+    parser.add_argument("--sample-every", type=int, default=1000, help="steps between level curve samples")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    results = run_games(args.games, args.seed, args.workers, args.policy, not args.no_heal,
+                        args.max_steps, args.sample_every)
+    elapsed = time.perf_counter() - start
+
+    for key, value in aggregate(results).items():
+        print(f"{key}: {value}")
+    total_steps = sum(r["steps"] for r in results)
+    print(f"{elapsed:.1f}s, {total_steps / elapsed:.0f} steps/s")
+
+if __name__ == "__main__":
+    main()
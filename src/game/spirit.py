@@ -1,5 +1,66 @@
 import pygame
 import math
+from src.engine.timeline import Draw, Stage, Timeline
+
+# Spirit evolution (obj_spirit_dtector Alarm_0 / Draw), drawn from the screen
+# center. Same character: starts at 61.
+_NEW_CHAR = Draw("new_char", 0, 0, 0)
+_SUMMON_FLASH = Draw("summon", 5, 0, 0, parity=0)
+_SPIRIT_BURST = tuple(Draw("spirit", 0, 0, 0, dx, dy) for dx, dy in ((-1, 0), (1, 0), (0, -1), (0, 1)))
+_CATCH = Draw("catch", 0, 0, 32, dy=-2)
+
+EVO_TIMELINE = Timeline([
+    Stage(1, 30, (Draw("old_char", 0, 0, 0),)),
+    Stage(30, 3, (Draw("old_char", 0, 23, 0, dx=-1),)),  # Slide out old char
+    Stage(30, 3, (Draw("new_char", 0, 30, 0, dx=-1),)),  # Slide in new char
+    Stage(1, 30, (_NEW_CHAR,)),                          # Evo sound
+    Stage(7, 15, (_NEW_CHAR, _SUMMON_FLASH)),
+    Stage(4, 15, (Draw("spirit_form", 0, 0, 0), _SUMMON_FLASH)),
+    Stage(4, 15, (Draw("spirit", 0, 0, 0, parity=1),)),
+    Stage(1, 30, (Draw("spirit", 0, 0, 0, parity=1),)),
+    Stage(32, 6, _SPIRIT_BURST),
+    Stage(1, 3, tuple(d._replace(x=d.dx * 32, y=d.dy * 32) for d in _SPIRIT_BURST)),
+    Stage(32, 3, (Draw("new_char", 0, 0, 32, dy=-2),)), # Character rising
+    Stage(1, 15, (Draw("new_char", 0, 0, -32),)),
+    Stage(7, 15, (Draw("summon", 0, 0, 0, parity=1), Draw("summon", 2, 0, 0, parity=0))),
+    Stage(11, 15, (Draw("summon", 0, 0, 0), Draw("evo_flash", 0, 0, 0, parity=0))),
+    Stage(1, 60, (Draw("summon", 0, 0, 0), Draw("evo_flash", 0, 0, 0, parity=0))),
+    Stage(32, 6, (Draw("evo", 0, 0, 0), _CATCH)),
+    Stage(2, 30, (Draw("evo", 0, 0, 0), _CATCH._replace(y=-32))),
+    Stage(1, 30, (Draw("evo_alt", 0, 0, 0),)),
+    Stage(2, 30, (Draw("evo", 0, 0, 0),)),
+])
+
+def char_sprite(game, char_idx, form):
+    """Character animation, e.g. takuya_idle"""
+    return game.assets.get_animation(f"{game.state.char_stats[char_idx]['name'].lower()}_{form}")
+
+def evo_anim_source(game, old_char, spirit_idx):
+    """(key, build) of the evolution from old_char with a spirit, for game.frame_cache"""
+    new_char = spirit_idx // 2
+    evo_digimon = game.state.digimon_database[100 + spirit_idx]
+
+    def build():
+        assets = game.assets
+        old_char_sprite = char_sprite(game, old_char, "idle")
+        new_char_sprite = char_sprite(game, new_char, "idle")
+        spirit_frames = assets.get_animation("spirits_dtector")
+        evo_sprite = assets.get_animation(f"digimon_{evo_digimon['sprite']}")
+        
+        if not (old_char_sprite and new_char_sprite and spirit_frames and evo_sprite):
+            return None
+        return EVO_TIMELINE.bind({
+            "old_char": old_char_sprite,
+            "new_char": new_char_sprite,
+            "spirit_form": char_sprite(game, new_char, "spirit"),
+            "spirit": [spirit_frames[spirit_idx]],
+            "summon": assets.get_animation("summon_dtector"),
+            "catch": assets.get_animation("catch_dtector"),
+            "evo": evo_sprite,
+            "evo_flash": [evo_sprite[4] if len(evo_sprite) > 4 else evo_sprite[0]],
+            "evo_alt": [evo_sprite[1] if len(evo_sprite) > 1 else evo_sprite[0]],
+        })
+    return ("spirit_evo", old_char, spirit_idx), build
 
 class SpiritManager:
     """
@@ -110,7 +171,6 @@ class SpiritManager:
         self.state = "EVO_ANIM"
         self.selected_spirit = spirit_idx
         self.counter = 0
-        self.anim_timer = 30
         
         # Determine new char and evo ID
         # Logic from obj_spirit_dtector Alarm 0
@@ -128,37 +188,15 @@ class SpiritManager:
         # Skip animation part if same character (logic from GML)
         if self.new_char == self.control.game_progress["current_char"]:
             self.counter = 61
+        self.anim_timer = EVO_TIMELINE.durations[self.counter]
 
     def _update_evo_anim(self, delta_time):
         # Logic from obj_spirit_dtector Alarm 0
-        self.anim_timer -= delta_time * 60
-        
-        if self.anim_timer <= 0:
-            if self.counter == 61:
-                # Play evo sound
-                self.counter += 1
-                self.anim_timer = 15
-            elif self.counter == 199:
-                self.state = "MENU"
-                self.menu_index = 0
-                return "EVO_COMPLETE"
-            else:
-                self.counter += 1
-                # Set next timer based on counter ranges (simplified)
-                if 0 <= self.counter <= 60: self.anim_timer = 3
-                elif 62 <= self.counter <= 68: self.anim_timer = 15
-                elif 69 <= self.counter <= 72: self.anim_timer = 15 # 45 at 72
-                elif 73 <= self.counter <= 76: self.anim_timer = 15
-                elif self.counter == 77: self.anim_timer = 30
-                elif 78 <= self.counter <= 109: self.anim_timer = 6
-                elif self.counter == 110: self.anim_timer = 3
-                elif 111 <= self.counter <= 142: self.anim_timer = 3
-                elif 143 <= self.counter <= 161: self.anim_timer = 15
-                elif self.counter == 162: self.anim_timer = 60
-                elif 163 <= self.counter <= 194: self.anim_timer = 6
-                elif 195 <= self.counter <= 198: self.anim_timer = 30
-                else: self.anim_timer = 30
-                
+        self.counter, self.anim_timer = EVO_TIMELINE.step(self.counter, self.anim_timer, delta_time)
+        if self.counter >= EVO_TIMELINE.length:
+            self.state = "MENU"
+            self.menu_index = 0
+            return "EVO_COMPLETE"
         return None
 
     def start_menu(self):
@@ -208,7 +246,7 @@ class SpiritManager:
         if self.anim_timer <= 0:
             if self.counter == 34:
                 # Restore original character
-                self.control.game_progress["current_char"] = self.new_char
+                self.game.history.set_progress(current_char=self.new_char)
                 self.counter += 1
                 self.anim_timer = 60
             elif self.counter == 35:
@@ -252,99 +290,15 @@ class SpiritManager:
             screen.blit(hint, (10, screen.get_height() - 30))
 
     def _draw_evo_anim(self, screen):
-        # Logic from obj_spirit_dtector Draw
-        scale = 6
-        x = screen.get_width() // 2
-        y = screen.get_height() // 2
-        
-        # Get sprites
-        char_db = self.game.character_manager.characters
-        old_char_sprite = self.game.assets.get_animation(char_db[self.control.game_progress["current_char"]]["base"])
-        new_char_sprite = self.game.assets.get_animation(char_db[self.new_char]["base"])
-        new_char_spirit = self.game.assets.get_animation(char_db[self.new_char]["spirit"])
-        spirit_frames = self.game.assets.get_animation("spirits_dtector")
-        summon_frames = self.game.assets.get_animation("summon_dtector")
-        catch_frames = self.game.assets.get_animation("catch_dtector")
-        
-        evo_digimon = self.control.digimon_database[self.selected_evo]
-        evo_sprite = self.game.assets.get_animation(evo_digimon["sprite"])
-        
-        if not (old_char_sprite and new_char_sprite and spirit_frames and evo_sprite):
+        # Logic from obj_spirit_dtector Draw (see EVO_TIMELINE)
+        evo_anim = self.game.frame_cache.get(*evo_anim_source(
+            self.game, self.control.game_progress["current_char"], self.selected_spirit))
+        if evo_anim is None:
             return
+        evo_anim.draw(screen, self.counter, (screen.get_width() // 2, screen.get_height() // 2))
 
-        # Draw logic based on counter
-        if self.counter == 0:
-            self._draw_scaled(screen, old_char_sprite[0], x, y, scale)
-            
-        elif 0 <= self.counter <= 30:
-            # Slide out old char
-            offset = self.counter
-            self._draw_scaled(screen, old_char_sprite[0], x + 24*scale - offset*scale, y, scale)
-            
-        elif 31 <= self.counter <= 61:
-            # Slide in new char
-            offset = self.counter - 31
-            self._draw_scaled(screen, new_char_sprite[0], x + 30*scale - offset*scale, y, scale)
-            
-        elif 62 <= self.counter <= 68:
-            self._draw_scaled(screen, new_char_sprite[0], x, y, scale)
-            if self.counter % 2 == 0:
-                self._draw_scaled(screen, summon_frames[5], x, y, scale)
-                
-        elif 69 <= self.counter <= 72:
-            if new_char_spirit:
-                self._draw_scaled(screen, new_char_spirit[0], x, y, scale)
-            if self.counter % 2 == 0:
-                self._draw_scaled(screen, summon_frames[5], x, y, scale)
-                
-        elif 73 <= self.counter <= 77:
-            if self.counter % 2:
-                self._draw_scaled(screen, spirit_frames[self.selected_spirit], x, y, scale)
-                
-        elif 78 <= self.counter <= 110:
-            # Spirit flash effect (simplified)
-            offset = self.counter - 78
-            sprite = spirit_frames[self.selected_spirit]
-            # Draw 4 copies moving out
-            self._draw_scaled(screen, sprite, x - offset*scale, y, scale)
-            self._draw_scaled(screen, sprite, x + offset*scale, y, scale)
-            self._draw_scaled(screen, sprite, x, y - offset*scale, scale)
-            self._draw_scaled(screen, sprite, x, y + offset*scale, scale)
-            
-        elif 111 <= self.counter <= 143:
-            # Character rising
-            offset = (self.counter - 111) * 2
-            self._draw_scaled(screen, new_char_sprite[0], x, y + 32*scale - offset*scale, scale)
-            
-        elif 144 <= self.counter <= 150:
-            idx = 0 if self.counter % 2 else 2
-            self._draw_scaled(screen, summon_frames[idx], x, y, scale)
-            
-        elif 151 <= self.counter <= 162:
-            if self.counter % 2:
-                self._draw_scaled(screen, summon_frames[0], x, y, scale)
-            else:
-                self._draw_scaled(screen, summon_frames[0], x, y, scale)
-                if len(evo_sprite) > 4:
-                    self._draw_scaled(screen, evo_sprite[4], x, y, scale)
-                else:
-                    self._draw_scaled(screen, evo_sprite[0], x, y, scale)
-                    
-        elif 163 <= self.counter <= 196:
-            self._draw_scaled(screen, evo_sprite[0], x, y, scale)
-            # Catch effect
-            if catch_frames:
-                offset = (self.counter - 163) * 2
-                self._draw_scaled(screen, catch_frames[0], x, y + 32*scale - offset*scale, scale)
-                
-        elif self.counter == 197:
-            if len(evo_sprite) > 1:
-                self._draw_scaled(screen, evo_sprite[1], x, y, scale)
-            else:
-                self._draw_scaled(screen, evo_sprite[0], x, y, scale)
-                
-        elif self.counter >= 198:
-            self._draw_scaled(screen, evo_sprite[0], x, y, scale)
+    def _char_sprite(self, char_idx, form):
+        return char_sprite(self.game, char_idx, form)
 
     def _draw_menu(self, screen):
         # Draw spirit battle menu
@@ -375,8 +329,7 @@ class SpiritManager:
         x = screen.get_width() // 2
         y = screen.get_height() // 2
         
-        char_db = self.game.character_manager.characters
-        char_sprite = self.game.assets.get_animation(char_db[self.new_char]["base"])
+        char_sprite = self._char_sprite(self.new_char, "idle")
         
         if char_sprite:
             self._draw_scaled(screen, char_sprite[0], x, y, scale)
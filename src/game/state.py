@@ -1,6 +1,20 @@
 import json
 from datetime import datetime
 
+# Top-level sections of to_dict(), tracked individually for saving
+SAVE_SECTIONS = (
+    "config", "game_progress", "char_stats",
+    "spirits_unlocked", "spirits_obtained", "char_unlocked", "char_party",
+)
+
+def _copy_data(value):
+    # Copies nested dicts/lists of plain values (much cheaper than deepcopy)
+    if isinstance(value, dict):
+        return {k: _copy_data(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_copy_data(v) for v in value]
+    return value
+
 class GameState:
     def __init__(self):
         self.default_colors = [
@@ -48,7 +62,8 @@ class GameState:
             "finish_battle_event": False,
             "last_boss_unlocked": False,
             "current_char_digimon": 0, # Default to first digimon (Agumon)
-            "current_char_hp": 100     # Default HP
+            "current_char_hp": 100,    # Default HP
+            "journal_seq": 0           # Last progress journal record included
         }
         
         self.area_distance = [6000, 8000, 7000, 9000, 10000, 11000, 9000, 7000, 10000, 11000, 10000, 10000, 12000]
@@ -67,6 +82,12 @@ class GameState:
         self.char_unlocked = [True, True, True, True, True, False]
         self.char_party = [True, True, True, True, True, False]
         
+        # Characters whose stats changed since spirit stats were last calculated
+        self.changed_chars = set(range(len(self.char_stats)))
+        
+        # Sections changed since the last save (everything until the first one)
+        self.dirty_sections = set(SAVE_SECTIONS)
+        
         # Simplified Digimon Database (Porting a few examples)
         # Simplified Digimon Database (Porting a few examples)
         self.digimon_database = []
@@ -117,10 +138,49 @@ class GameState:
             "char_party": self.char_party
         }
 
+    def advance_steps(self, count=1):
+        """Walks `count` steps: step counter, remaining distance and D-Power."""
+        progress = self.game_progress
+        for _ in range(count):
+            progress["steps"] += 1
+            if progress["steps"] > 999999:
+                progress["steps"] = 0
+                
+            if progress["distance"] > 0:
+                progress["distance"] -= 1
+                
+            # D-Power increase every 100 steps
+            if progress["steps"] % 100 == 0 and progress["dpower"] < 99:
+                progress["dpower"] += 1
+        self.mark_dirty("game_progress")
+
+    def mark_dirty(self, *sections):
+        """Flags to_dict() sections as changed since the last save."""
+        self.dirty_sections.update(sections)
+
+    def take_dirty(self):
+        """Returns the changed sections and resets tracking."""
+        dirty = self.dirty_sections
+        self.dirty_sections = set()
+        return dirty
+
+    def snapshot(self, sections=None):
+        """
+        Detached copy of to_dict() (optionally only some sections), safe to
+        hand to another thread while the game keeps mutating the live state.
+        """
+        data = self.to_dict()
+        if sections is not None:
+            data = {k: v for k, v in data.items() if k in sections}
+        return _copy_data(data)
+
     def from_dict(self, data):
+        self.dirty_sections.update(k for k in data if k in SAVE_SECTIONS)
         if "config" in data: self.config = data["config"]
         if "game_progress" in data: self.game_progress = data["game_progress"]
-        if "char_stats" in data: self.char_stats = data["char_stats"]
+        if "char_stats" in data:
+            self.char_stats = data["char_stats"]
+            self.changed_chars.update(range(len(self.char_stats)))
         if "spirits_unlocked" in data: self.spirits_unlocked = data["spirits_unlocked"]
         if "spirits_obtained" in data: self.spirits_obtained = data["spirits_obtained"]
         if "char_unlocked" in data: self.char_unlocked = data["char_unlocked"]
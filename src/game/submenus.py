@@ -102,12 +102,17 @@ class StatusViewMenu(BaseMenu):
         self.current_page = 0 # 0: HP/Lvl, 1: Spirit, 2: Stamina, 3: Skill
         self.scroll_offset = 0
         self.scroll_timer = 0
+        self.marquee = None # Name marquee (ScrollingText.marquee), started on first draw
+        self.name_offset = 0
         
     def update(self, delta_time):
         self.scroll_timer += delta_time
         # Update scroll offset
         # Slower speed: 15 * 4 (was 30 * 4)
-        self.scroll_offset += delta_time * 15 * 4 
+        pixels = delta_time * 15 * 4
+        self.scroll_offset += pixels
+        if self.marquee:
+            self.name_offset = self.marquee.send(pixels)
                 
     def handle_input(self, event):
         if event.type == pygame.KEYDOWN:
@@ -150,27 +155,14 @@ class StatusViewMenu(BaseMenu):
         box_width = sprite.get_width() * scale_factor
         box_height = 20 * scale_factor
         
-        # Calculate total width of text
-        # Now that spacing is stride, width is len * spacing * scale
-        text_pixel_width = len(char_stats['name']) * spacing * text_scale
-        
-        # Loop limit: Text width + Box width (so it fully scrolls out)
-        # We start drawing at box_width (Right edge)
-        start_pos = box_width
-        
-        # We want it to scroll until it's fully gone to the left.
-        # It's gone when (start_pos - offset) + text_width < 0
-        # So offset > start_pos + text_width
-        
-        limit = start_pos + text_pixel_width + (box_width * 0.5) # Add buffer
-        
-        current_scroll = int(self.scroll_offset) % limit
-        final_offset = current_scroll - start_pos
-        
-        name_x = x
-        name_y = y
-        
-        self.game.text_renderer.draw_text_scrolling(screen, char_stats['name'], name_x, name_y, box_width, box_height, final_offset, scale=text_scale, spacing=6)
+        # The name is rendered once; the marquee enters at the right edge of
+        # the box and scrolls until it's fully gone to the left (plus a buffer)
+        name = self.game.text_renderer.scrolling_text(char_stats['name'], scale=text_scale, spacing=spacing)
+        if name:
+            if self.marquee is None:
+                self.marquee = name.marquee(box_width, scroll=self.scroll_offset)
+                self.name_offset = next(self.marquee)
+            name.draw(screen, x, y, box_width, box_height, self.name_offset)
         
         # Draw specific stat based on page
         stat_x = x + 24 * scale_factor
@@ -556,3 +548,51 @@ class DatabaseViewMenu(BaseMenu):
         
         hint = font.render("LEFT/RIGHT: Navigate | UP: Back", True, (50, 50, 50))
         screen.blit(hint, (10, screen.get_height() - 30))
+
+class SlotSelectMenu(BaseMenu):
+    """Save slot selection. Reads only the slot index; the slot loads on select."""
+    def __init__(self, game, menu_manager):
+        super().__init__(game, menu_manager)
+        self.current_slot = game.slots.active
+        
+    def handle_input(self, event):
+        if event.type == pygame.KEYDOWN:
+            if event.key == pygame.K_UP:
+                self.menu_manager.pop_menu()
+                return True
+            elif event.key == pygame.K_LEFT:
+                self.current_slot = (self.current_slot - 1) % self.game.slots.count
+                return True
+            elif event.key == pygame.K_RIGHT:
+                self.current_slot = (self.current_slot + 1) % self.game.slots.count
+                return True
+            elif event.key == pygame.K_DOWN:
+                if self.current_slot != self.game.slots.active:
+                    self.game.open_slot(self.current_slot)
+                self.menu_manager.pop_menu()
+                return True
+        return False
+        
+    def draw(self, screen):
+        screen.fill((255, 255, 255))
+        
+        renderer = self.game.text_renderer
+        renderer.draw_text(screen, "slot", 10, 10, scale=3)
+        renderer.draw_number(screen, self.current_slot + 1, 100, 10, scale=3)
+        
+        summary = self.game.slots.summaries()[self.current_slot]
+        if summary is None:
+            renderer.draw_text(screen, "empty", 10, 50, scale=3)
+        else:
+            char_stats = self.game.state.char_stats
+            char_idx = summary["current_char"]
+            if char_idx < len(char_stats):
+                renderer.draw_text(screen, char_stats[char_idx]["name"], 10, 50, scale=3)
+            renderer.draw_text(screen, "lv", 10, 80, scale=3)
+            renderer.draw_number(screen, summary["level"], 60, 80, scale=3)
+            renderer.draw_text(screen, "area", 10, 110, scale=3)
+            renderer.draw_number(screen, summary["current_area"] + 1, 100, 110, scale=3)
+            renderer.draw_number(screen, summary["steps"], 10, 140, scale=3)
+            
+        hint = self.game.font.render("LEFT/RIGHT: Slot | DOWN: Load | UP: Back", True, (50, 50, 50))
+        screen.blit(hint, (10, screen.get_height() - 30))
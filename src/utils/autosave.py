@@ -0,0 +1,95 @@
+import threading
+import time
+from src.utils.save_system import SaveSystem
+
+class AutoSaver:
+    """
+    Background autosave.
+    request() only snapshots the sections changed since the last request
+    (GameState.dirty_sections) on the calling thread; encoding and the
+    atomic file write happen on a worker thread, which never reads the live
+    state. Requests arriving within `interval` seconds of the last write are
+    coalesced into one write of the newest data for every changed section.
+    A failed write is retried with the next one.
+    """
+    def __init__(self, state, interval=2.0, on_written=None):
+        self.state = state
+        self.path = SaveSystem.SAVE_FILE # Fixed for the saver's lifetime
+        self.interval = interval
+        self.on_written = on_written # Called with the written data (worker thread)
+        self.writes = 0
+        
+        self._pending = None
+        self._last_write = 0.0
+        self._running = True
+        self._cond = threading.Condition()
+        self._thread = threading.Thread(target=self._run, name="autosave", daemon=True)
+        self._thread.start()
+
+    def request(self):
+        """Queue a save of the changed sections. Cheap enough to call every step."""
+        dirty = self.state.take_dirty()
+        if not dirty:
+            return
+        # Plus whatever the file has no encoded block for yet (first save after
+        # a load): the worker writes exactly what it's handed
+        snapshot = self.state.snapshot(dirty | SaveSystem.uncached_sections(self.path))
+        with self._cond:
+            if self._pending is None:
+                self._pending = snapshot
+            else:
+                self._pending.update(snapshot)
+            self._cond.notify()
+
+    def flush(self):
+        """Write any pending snapshot now, on the calling thread (after a write in progress)."""
+        self._write_pending()
+
+    def stop(self):
+        """Stop the worker and write whatever is still pending."""
+        with self._cond:
+            self._running = False
+            self._cond.notify()
+        self._thread.join()
+        self.flush()
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while self._running and self._pending is None:
+                    self._cond.wait()
+                if not self._running:
+                    return
+                    
+                # Coalesce: wait out the rest of the interval, keep the newest snapshot
+                delay = self._last_write + self.interval - time.monotonic()
+                if delay > 0:
+                    self._cond.wait(delay)
+                    continue
+                    
+            self._write_pending()
+
+    def _write_pending(self):
+        # The snapshot is taken under the save lock, so flush(), the worker and
+        # the game thread's own saves write one at a time, in request order
+        with SaveSystem.write_lock:
+            with self._cond:
+                data = self._pending
+                self._pending = None
+            if data is None:
+                return
+            try:
+                SaveSystem.write_save(data, self.path)
+            except Exception as e:
+                print(f"Failed to autosave, retrying with the next write: {e}")
+                # take_dirty() already forgot these sections: keep them pending
+                # (anything requested since is newer)
+                with self._cond:
+                    if self._pending is not None:
+                        data.update(self._pending)
+                    self._pending = data
+            else:
+                self.writes += 1
+                if self.on_written:
+                    self.on_written(data)
+            self._last_write = time.monotonic()
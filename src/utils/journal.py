@@ -0,0 +1,121 @@
+import os
+import struct
+import threading
+import time
+import zlib
+from src.game.history import EV_STEPS, apply_event
+
+# Fixed-size journal record (little-endian, 16 bytes):
+#   seq (I), type (B), arg (b), index (h), value (i), CRC32 of the first 12 bytes (I)
+# type/arg/index/value are a progress event (see src/game/history.py).
+# seq increases by one per event (by the step count for steps, so a steps
+# record covers seqs seq-count+1..seq) and is mirrored in
+# game_progress["journal_seq"], so a snapshot knows which events it
+# already contains and replay only applies newer ones.
+RECORD = struct.Struct("<IBbhi")
+CRC = struct.Struct("<I")
+RECORD_SIZE = RECORD.size + CRC.size
+
+class ProgressJournal:
+    """
+    Append-only write-ahead log of progress events (steps, battle results,
+    level changes...), which change too often to rewrite the whole save.
+    Records are buffered and flushed in batches (every `batch_size` records or
+    `flush_interval` seconds). On startup replay() applies the records newer
+    than the loaded snapshot; truncate_through() drops records once a
+    snapshot containing them is on disk.
+    """
+    def __init__(self, state, path, batch_size=32, flush_interval=1.0):
+        self.state = state
+        self.path = path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        
+        self._buffer = []
+        self._last_flush = time.monotonic()
+        self._flushed_seq = 0
+        self._lock = threading.Lock()
+
+    def record(self, ev_type, arg=0, index=0, value=0):
+        """Logs an event that has already been applied to the state."""
+        progress = self.state.game_progress
+        progress["journal_seq"] = progress.get("journal_seq", 0) + (value if ev_type == EV_STEPS else 1)
+        last = self._buffer[-1] if self._buffer else None
+        if ev_type == EV_STEPS and last is not None and last[1] == EV_STEPS:
+            # Consecutive steps collapse into one record
+            last[0] = progress["journal_seq"]
+            last[4] += value
+        else:
+            self._buffer.append([progress["journal_seq"], ev_type, arg, index, value])
+        self._maybe_flush()
+
+    def _maybe_flush(self):
+        if (len(self._buffer) >= self.batch_size or
+                time.monotonic() - self._last_flush >= self.flush_interval):
+            self.flush()
+
+    def flush(self):
+        """Append buffered records to the log and fsync."""
+        self._last_flush = time.monotonic()
+        if not self._buffer:
+            return
+            
+        chunks = []
+        for rec in self._buffer:
+            body = RECORD.pack(*rec)
+            chunks.append(body + CRC.pack(zlib.crc32(body)))
+        last_seq = self._buffer[-1][0]
+        self._buffer = []
+        
+        with self._lock:
+            with open(self.path, "ab") as f:
+                f.write(b"".join(chunks))
+                f.flush()
+                os.fsync(f.fileno())
+            self._flushed_seq = last_seq
+
+    def truncate_through(self, seq):
+        """
+        Called once a snapshot containing every record up to `seq` is on disk.
+        Empties the log if nothing newer has been flushed since.
+        """
+        with self._lock:
+            if self._flushed_seq <= seq and os.path.exists(self.path):
+                with open(self.path, "wb") as f:
+                    os.fsync(f.fileno())
+
+    def replay(self):
+        """
+        Applies logged records newer than the state's journal_seq.
+        Stops at the first torn or corrupt record. Returns the number applied.
+        """
+        if not os.path.exists(self.path):
+            return 0
+            
+        with open(self.path, "rb") as f:
+            data = f.read()
+            
+        state = self.state
+        progress = state.game_progress
+        applied = 0
+        for pos in range(0, len(data) - RECORD_SIZE + 1, RECORD_SIZE):
+            body = data[pos:pos + RECORD.size]
+            checksum, = CRC.unpack_from(data, pos + RECORD.size)
+            if zlib.crc32(body) != checksum:
+                break
+                
+            seq, ev_type, arg, index, value = RECORD.unpack(body)
+            journal_seq = progress.get("journal_seq", 0)
+            if seq <= journal_seq:
+                continue
+            if ev_type == EV_STEPS:
+                # A snapshot may have been taken part way through a steps record
+                value = min(value, seq - journal_seq)
+                
+            apply_event(state, (ev_type, arg, index, value))
+            progress["journal_seq"] = seq
+            state.mark_dirty("game_progress")
+            applied += 1
+            
+        self._flushed_seq = progress.get("journal_seq", 0)
+        return applied
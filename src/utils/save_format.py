@@ -0,0 +1,262 @@
+import json
+import struct
+import zlib
+
+# Binary save layout (little-endian).
+# Version 2 (written):
+#   header  : magic "DTSV", version (H), flags (H), section count (I)
+#   per section: id (B), payload length (I), CRC32 of plain payload (I),
+#                payload XOR-obfuscated with the save key (see SaveSystem._xor_bytes)
+# Every GameState.to_dict() key is its own section, so a save only has to
+# re-encode the sections that changed (see encode_section/join_sections).
+#
+# Version 1 (read only): one payload with the same field encodings in this
+# order: progress, config, char_stats, bool lists, then one extra JSON block.
+#   header  : magic, version, flags, payload length (I)
+#   trailer : CRC32 of the plain payload (I)
+
+MAGIC = b"DTSV"
+VERSION = 2
+
+HEADER = struct.Struct("<4sHHI")
+TRAILER = struct.Struct("<I")
+SECTION_HEADER = struct.Struct("<BII")
+
+# Section ids are part of the file format: append only
+SECTIONS = (
+    "config", "game_progress", "char_stats",
+    "spirits_unlocked", "spirits_obtained", "char_unlocked", "char_party",
+)
+SECTION_IDS = {name: i for i, name in enumerate(SECTIONS)}
+
+PROGRESS_INTS = (
+    ("distance", "I"),
+    ("steps", "I"),
+    ("dpower", "B"),
+    ("battles", "I"),
+    ("wins", "I"),
+    ("current_char", "B"),
+    ("level", "B"),
+    ("next_level_up", "B"),
+    ("next_level_down", "B"),
+    ("current_area", "B"),
+    ("current_char_digimon", "H"),
+    ("current_char_hp", "i"),
+)
+PROGRESS_FLAGS = (
+    "new_game", "defeat", "battle_start", "event_start",
+    "last_encounter_is_battle", "finish_battle_event", "last_boss_unlocked",
+)
+CONFIG_FLAGS = (
+    "start_game", "enable_logs", "debug", "enable_touch", "enable_shake",
+    "scan", "sound_enabled", "shake_sound", "grid_enabled", "autorun",
+)
+CHAR_STATS = ("hp", "spirit", "stamina", "skill")
+BOOL_LISTS = ("spirits_unlocked", "spirits_obtained", "char_unlocked", "char_party")
+
+PROGRESS_FIXED = {name for name, _ in PROGRESS_INTS} | set(PROGRESS_FLAGS) | {"area_status", "docks"}
+CONFIG_FIXED = set(CONFIG_FLAGS) | {"resolution", "colors"}
+
+PROGRESS_STRUCT = struct.Struct("<" + "".join(fmt for _, fmt in PROGRESS_INTS))
+DOCKS_STRUCT = struct.Struct("<4h")
+CHAR_STRUCT = struct.Struct("<4H")
+
+class SaveFormatError(ValueError):
+    pass
+
+def is_binary_save(blob):
+    return blob[:len(MAGIC)] == MAGIC
+
+def _pack_flags(values, names):
+    bits = 0
+    for i, name in enumerate(names):
+        if values.get(name):
+            bits |= 1 << i
+    return bits
+
+def _unpack_flags(bits, names):
+    return {name: bool(bits >> i & 1) for i, name in enumerate(names)}
+
+def _pack_bits(flags):
+    bits = 0
+    for i, flag in enumerate(flags):
+        if flag:
+            bits |= 1 << i
+    return struct.pack("<B", len(flags)) + bits.to_bytes((len(flags) + 7) // 8, "little")
+
+def _pack_json(values):
+    # Keys the fixed layout doesn't know about survive as JSON
+    blob = json.dumps(values, separators=(",", ":")).encode("utf-8") if values else b""
+    return struct.pack("<I", len(blob)) + blob
+
+class _Reader:
+    def __init__(self, data):
+        self.data = data
+        self.pos = 0
+
+    def read(self, size):
+        if self.pos + size > len(self.data):
+            raise SaveFormatError("Truncated save payload")
+        chunk = self.data[self.pos:self.pos + size]
+        self.pos += size
+        return chunk
+
+    def unpack(self, fmt):
+        if isinstance(fmt, str):
+            fmt = struct.Struct(fmt)
+        return fmt.unpack(self.read(fmt.size))
+
+    def bits(self):
+        count, = self.unpack("<B")
+        bits = int.from_bytes(self.read((count + 7) // 8), "little")
+        return [bool(bits >> i & 1) for i in range(count)]
+
+    def json(self):
+        length, = self.unpack("<I")
+        return json.loads(self.read(length).decode("utf-8")) if length else {}
+
+def _write_progress(progress):
+    return b"".join((
+        PROGRESS_STRUCT.pack(*(progress[name] for name, _ in PROGRESS_INTS)),
+        struct.pack("<B", _pack_flags(progress, PROGRESS_FLAGS)),
+        _pack_bits(progress["area_status"]),
+        DOCKS_STRUCT.pack(*progress["docks"]),
+    ))
+
+def _read_progress(reader):
+    progress = dict(zip((name for name, _ in PROGRESS_INTS), reader.unpack(PROGRESS_STRUCT)))
+    progress.update(_unpack_flags(reader.unpack("<B")[0], PROGRESS_FLAGS))
+    progress["area_status"] = reader.bits()
+    progress["docks"] = list(reader.unpack(DOCKS_STRUCT))
+    return progress
+
+def _write_config(config):
+    out = [struct.pack("<HB", _pack_flags(config, CONFIG_FLAGS), config["resolution"])]
+    out.append(struct.pack("<B", len(config["colors"])))
+    for palette in config["colors"]:
+        out.append(struct.pack("<3I", *palette))
+    return b"".join(out)
+
+def _read_config(reader):
+    config_bits, resolution = reader.unpack("<HB")
+    config = _unpack_flags(config_bits, CONFIG_FLAGS)
+    config["resolution"] = resolution
+    color_count, = reader.unpack("<B")
+    config["colors"] = [list(reader.unpack("<3I")) for _ in range(color_count)]
+    return config
+
+def _write_char_stats(stats):
+    out = [struct.pack("<B", len(stats))]
+    for char in stats:
+        name = char["name"].encode("utf-8")
+        out.append(CHAR_STRUCT.pack(*(char[key] for key in CHAR_STATS)))
+        out.append(struct.pack("<B", len(name)) + name)
+    return b"".join(out)
+
+def _read_char_stats(reader):
+    char_count, = reader.unpack("<B")
+    char_stats = []
+    for _ in range(char_count):
+        char = dict(zip(CHAR_STATS, reader.unpack(CHAR_STRUCT)))
+        name_len, = reader.unpack("<B")
+        char["name"] = reader.read(name_len).decode("utf-8")
+        char_stats.append(char)
+    return char_stats
+
+def encode_section(name, value, obfuscate):
+    """
+    Encodes one to_dict() section into a self-contained block
+    (id, length, CRC32, obfuscated payload).
+    """
+    if name == "game_progress":
+        payload = _write_progress(value) + _pack_json(
+            {k: v for k, v in value.items() if k not in PROGRESS_FIXED})
+    elif name == "config":
+        payload = _write_config(value) + _pack_json(
+            {k: v for k, v in value.items() if k not in CONFIG_FIXED})
+    elif name == "char_stats":
+        payload = _write_char_stats(value)
+    elif name in BOOL_LISTS:
+        payload = _pack_bits(value)
+    else:
+        raise SaveFormatError(f"Unknown save section: {name}")
+        
+    return SECTION_HEADER.pack(SECTION_IDS[name], len(payload), zlib.crc32(payload)) + obfuscate(payload)
+
+def join_sections(blocks):
+    """Builds a save file from encoded section blocks."""
+    return HEADER.pack(MAGIC, VERSION, 0, len(blocks)) + b"".join(blocks)
+
+def encode(data, obfuscate):
+    """Packs a GameState.to_dict() mapping into the binary layout."""
+    return join_sections([encode_section(name, data[name], obfuscate)
+                          for name in SECTIONS if name in data])
+
+def _decode_section(name, payload):
+    reader = _Reader(payload)
+    if name == "game_progress":
+        value = _read_progress(reader)
+        value.update(reader.json())
+    elif name == "config":
+        value = _read_config(reader)
+        value.update(reader.json())
+    elif name == "char_stats":
+        value = _read_char_stats(reader)
+    else:
+        value = reader.bits()
+    return value
+
+def decode(blob, deobfuscate):
+    """Unpacks a binary save into a GameState.from_dict() mapping."""
+    if len(blob) < HEADER.size:
+        raise SaveFormatError("Save file too short")
+        
+    magic, version, _flags, count = HEADER.unpack_from(blob)
+    if magic != MAGIC:
+        raise SaveFormatError("Not a binary save")
+    if version == 1:
+        return _decode_v1(blob, deobfuscate)
+    if version > VERSION:
+        raise SaveFormatError(f"Save version {version} is newer than supported ({VERSION})")
+        
+    data = {}
+    pos = HEADER.size
+    for _ in range(count):
+        if pos + SECTION_HEADER.size > len(blob):
+            raise SaveFormatError("Truncated save section")
+        section_id, length, checksum = SECTION_HEADER.unpack_from(blob, pos)
+        pos += SECTION_HEADER.size
+        if pos + length > len(blob):
+            raise SaveFormatError("Truncated save section")
+        payload = deobfuscate(blob[pos:pos + length])
+        pos += length
+        if zlib.crc32(payload) != checksum:
+            raise SaveFormatError("Save checksum mismatch")
+        if section_id < len(SECTIONS):
+            name = SECTIONS[section_id]
+            data[name] = _decode_section(name, payload)
+            
+    return data
+
+def _decode_v1(blob, deobfuscate):
+    _magic, _version, _flags, length = HEADER.unpack_from(blob)
+    if len(blob) != HEADER.size + length + TRAILER.size:
+        raise SaveFormatError("Save length mismatch")
+        
+    payload = deobfuscate(blob[HEADER.size:HEADER.size + length])
+    checksum, = TRAILER.unpack_from(blob, HEADER.size + length)
+    if zlib.crc32(payload) != checksum:
+        raise SaveFormatError("Save checksum mismatch")
+        
+    reader = _Reader(payload)
+    data = {
+        "game_progress": _read_progress(reader),
+        "config": _read_config(reader),
+        "char_stats": _read_char_stats(reader),
+    }
+    for key in BOOL_LISTS:
+        data[key] = reader.bits()
+    for section, values in reader.json().items():
+        data[section].update(values)
+        
+    return data
@@ -0,0 +1,144 @@
+import os
+import struct
+import time
+from src.utils import save_format
+from src.utils.save_system import SaveSystem
+
+# Index file layout (little-endian):
+#   header : magic "DTIX", version (H), slot count (B)
+#   entry  : used (B), current_char (B), level (B), current_area (B),
+#            steps (I), timestamp (q, unix seconds)
+INDEX_MAGIC = b"DTIX"
+INDEX_VERSION = 1
+INDEX_HEADER = struct.Struct("<4sHB")
+INDEX_ENTRY = struct.Struct("<BBBBIq")
+
+class SaveSlots:
+    """
+    N save slots plus a small index of per-slot summaries, so a slot list can
+    be shown without opening any slot file. Slot files are only read when a
+    slot is activated. Slot 0 keeps the original dtector_eu.dat/.log names.
+    """
+    INDEX_FILE = "dtector_eu.idx"
+    
+    def __init__(self, directory=".", count=4):
+        self.directory = directory
+        self.count = count
+        self.active = 0
+        self._summaries = None
+
+    def slot_paths(self, slot):
+        """(save file, journal file) for a slot."""
+        base = "dtector_eu" if slot == 0 else f"dtector_eu_slot{slot}"
+        return (os.path.join(self.directory, base + ".dat"),
+                os.path.join(self.directory, base + ".log"))
+
+    def activate(self, slot):
+        """Points SaveSystem at a slot's files. Doesn't load anything."""
+        if not 0 <= slot < self.count:
+            raise ValueError(f"Invalid save slot: {slot}")
+        self.active = slot
+        SaveSystem.SAVE_FILE, SaveSystem.JOURNAL_FILE = self.slot_paths(slot)
+
+    def summaries(self):
+        """
+        Per-slot summary dicts (None for empty slots), read from the index only.
+        The index is rebuilt from the slot files if it's missing or unreadable.
+        """
+        if self._summaries is None:
+            self._summaries = self._read_index()
+            if self._summaries is None:
+                self._summaries = self._rebuild_index()
+        return self._summaries
+
+    def update_summary(self, slot, data):
+        """
+        Refreshes a slot's index entry from saved to_dict() data. Safe on the
+        autosave thread: it never rebuilds the index; if the index isn't
+        loaded, the next summaries() rebuilds it from the (saved) slot files.
+        """
+        progress = data.get("game_progress")
+        summaries = self._summaries
+        if progress is None or summaries is None:
+            return
+        summaries[slot] = {
+            "current_char": progress["current_char"],
+            "level": progress["level"],
+            "current_area": progress["current_area"],
+            "steps": progress["steps"],
+            "timestamp": int(time.time()),
+        }
+        self._write_index()
+
+    def _index_path(self):
+        return os.path.join(self.directory, self.INDEX_FILE)
+
+    def _read_index(self):
+        path = self._index_path()
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path, "rb") as f:
+                blob = f.read()
+            magic, version, count = INDEX_HEADER.unpack_from(blob)
+            if magic != INDEX_MAGIC or version != INDEX_VERSION:
+                return None
+                
+            summaries = [None] * self.count
+            for slot in range(min(count, self.count)):
+                used, char, level, area, steps, timestamp = INDEX_ENTRY.unpack_from(
+                    blob, INDEX_HEADER.size + slot * INDEX_ENTRY.size)
+                if used:
+                    summaries[slot] = {
+                        "current_char": char, "level": level, "current_area": area,
+                        "steps": steps, "timestamp": timestamp,
+                    }
+            return summaries
+        except (OSError, struct.error) as e:
+            print(f"Failed to read save index: {e}")
+            return None
+
+    def _rebuild_index(self):
+        # Decodes the slot files directly: no SaveSystem state is touched
+        summaries = [None] * self.count
+        for slot in range(self.count):
+            path, _ = self.slot_paths(slot)
+            if not os.path.exists(path):
+                continue
+            try:
+                with open(path, "rb") as f:
+                    blob = f.read()
+                if save_format.is_binary_save(blob):
+                    progress = save_format.decode(blob, SaveSystem._xor_bytes)["game_progress"]
+                else:
+                    progress = SaveSystem._decode_legacy(blob)["game_progress"]
+                summaries[slot] = {
+                    "current_char": progress["current_char"],
+                    "level": progress["level"],
+                    "current_area": progress["current_area"],
+                    "steps": progress["steps"],
+                    "timestamp": int(os.path.getmtime(path)),
+                }
+            except Exception as e:
+                print(f"Failed to read save slot {slot}: {e}")
+        self._summaries = summaries
+        self._write_index()
+        return summaries
+
+    def _write_index(self):
+        chunks = [INDEX_HEADER.pack(INDEX_MAGIC, INDEX_VERSION, self.count)]
+        for summary in self._summaries:
+            if summary is None:
+                chunks.append(INDEX_ENTRY.pack(0, 0, 0, 0, 0, 0))
+            else:
+                chunks.append(INDEX_ENTRY.pack(
+                    1, summary["current_char"], summary["level"], summary["current_area"],
+                    summary["steps"], summary["timestamp"]))
+                    
+        path = self._index_path()
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(b"".join(chunks))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
@@ -1,33 +1,72 @@
 import json
 import os
+import threading
 from src.game.state import GameState
+from src.utils import save_format
 
 class SaveSystem:
     SAVE_FILE = "dtector_eu.dat"
+    JOURNAL_FILE = "dtector_eu.log"
     KEY = "D1g1W0rld_S4v3_K3y_2025"
     
+    KEY_BYTES = KEY.encode("ascii")
+    
+    # Decimal text of every byte value, for joining the encrypted output
+    _BYTE_TEXT = tuple(str(i) for i in range(256))
+    _TEXT_BYTE = {text: i for i, text in enumerate(_BYTE_TEXT)}
+    
+    @staticmethod
+    def _xor_bytes(data):
+        """
+        XORs data with the repeating key in a single big-int operation.
+        Same result as XORing byte by byte, without a Python-level loop.
+        """
+        length = len(data)
+        key = SaveSystem.KEY_BYTES
+        stream = (key * (length // len(key) + 1))[:length]
+        value = int.from_bytes(data, "little") ^ int.from_bytes(stream, "little")
+        return value.to_bytes(length, "little")
+
     @staticmethod
     def encrypt_value(value_str):
-        key_length = len(SaveSystem.KEY)
-        str_length = len(value_str)
-        
-        if str_length == 0:
+        if len(value_str) == 0:
             return ""
             
-        result = []
-        for i in range(str_length):
-            char_code = ord(value_str[i])
-            key_char_code = ord(SaveSystem.KEY[i % key_length])
-            encrypted_char = char_code ^ key_char_code
-            result.append(str(encrypted_char))
+        try:
+            data = value_str.encode("latin-1")
+        except UnicodeEncodeError:
+            # Code points above 255 don't fit in a byte; keep the per-char path
+            return SaveSystem._encrypt_chars(value_str)
             
-        return "-".join(result)
+        encrypted = SaveSystem._xor_bytes(data)
+        return "-".join(map(SaveSystem._BYTE_TEXT.__getitem__, encrypted))
 
     @staticmethod
     def decrypt_value(encrypted_str):
         if not encrypted_str:
             return ""
             
+        try:
+            data = bytes(map(SaveSystem._TEXT_BYTE.__getitem__, encrypted_str.split("-")))
+        except KeyError:
+            # Malformed parts or values above 255; the per-char path skips them
+            return SaveSystem._decrypt_chars(encrypted_str)
+            
+        return SaveSystem._xor_bytes(data).decode("latin-1")
+
+    @staticmethod
+    def _encrypt_chars(value_str):
+        key_length = len(SaveSystem.KEY)
+        result = []
+        for i in range(len(value_str)):
+            char_code = ord(value_str[i])
+            key_char_code = ord(SaveSystem.KEY[i % key_length])
+            result.append(str(char_code ^ key_char_code))
+            
+        return "-".join(result)
+
+    @staticmethod
+    def _decrypt_chars(encrypted_str):
         parts = encrypted_str.split("-")
         key_length = len(SaveSystem.KEY)
         result = []
@@ -43,11 +82,64 @@ class SaveSystem:
                 
         return "".join(result)
 
+    # Encoded blocks of the sections last written to each save file
+    # (path -> {section: block}), reused for unchanged sections
+    _section_blocks = {}
+    
+    # Held while writing a save or touching _section_blocks: the game thread
+    # (save_game, load_game) and the autosave worker share both
+    write_lock = threading.RLock()
+    
     @staticmethod
     def save_game(state: GameState):
+        state.take_dirty()
+        SaveSystem.write_save(state.to_dict())
+
+    @staticmethod
+    def uncached_sections(path=None):
+        """Sections write_save() has no block for at `path` (default SAVE_FILE)."""
+        with SaveSystem.write_lock:
+            blocks = SaveSystem._section_blocks.get(path or SaveSystem.SAVE_FILE, {})
+            return {name for name in save_format.SECTIONS if name not in blocks}
+
+    @staticmethod
+    def write_save(data, path=None):
+        """
+        Writes a to_dict()/snapshot() mapping to `path` (default SAVE_FILE)
+        atomically: temp file, fsync, then rename over the save, so a crash
+        mid-write leaves the previous save intact.
+        `data` may hold only the changed sections; those are re-encoded and
+        the other sections reuse their blocks from the previous write to the
+        same path (see uncached_sections for the ones that have none).
+        """
+        path = path or SaveSystem.SAVE_FILE
+        with SaveSystem.write_lock:
+            blocks = dict(SaveSystem._section_blocks.get(path, {}))
+            missing = [name for name in save_format.SECTIONS if name not in blocks and name not in data]
+            if missing:
+                raise save_format.SaveFormatError(f"No data for save sections: {', '.join(missing)}")
+            for name, value in data.items():
+                blocks[name] = save_format.encode_section(name, value, SaveSystem._xor_bytes)
+            blob = save_format.join_sections([blocks[name] for name in save_format.SECTIONS])
+            SaveSystem._write_file(path, blob)
+            SaveSystem._section_blocks[path] = blocks
+
+    @staticmethod
+    def _write_file(path, blob):
+        # Temp file, fsync, rename: a crash mid-write leaves the old file intact
+        tmp_path = path + ".tmp"
+        with SaveSystem.write_lock:
+            with open(tmp_path, "wb") as f:
+                f.write(blob)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, path)
+
+    @staticmethod
+    def save_game_legacy(state: GameState):
+        """Writes the original JSON save (per-field XOR-encoded strings)."""
         data = state.to_dict()
         # In the original GML, individual fields are encrypted.
-        # For this port, we can replicate that or just encrypt the whole JSON.
         # Replicating GML behavior:
         
         encrypted_data = {}
@@ -55,8 +147,9 @@ class SaveSystem:
             json_str = json.dumps(value)
             encrypted_data[key] = SaveSystem.encrypt_value(json_str)
             
-        with open(SaveSystem.SAVE_FILE, "w") as f:
-            json.dump(encrypted_data, f)
+        with SaveSystem.write_lock:
+            with open(SaveSystem.SAVE_FILE, "w") as f:
+                json.dump(encrypted_data, f)
             
     @staticmethod
     def load_game(state: GameState):
@@ -64,16 +157,38 @@ class SaveSystem:
             return False
             
         try:
-            with open(SaveSystem.SAVE_FILE, "r") as f:
-                encrypted_data = json.load(f)
+            with open(SaveSystem.SAVE_FILE, "rb") as f:
+                blob = f.read()
                 
-            decrypted_data = {}
-            for key, value in encrypted_data.items():
-                decrypted_str = SaveSystem.decrypt_value(value)
-                decrypted_data[key] = json.loads(decrypted_str)
+            if save_format.is_binary_save(blob):
+                state.from_dict(save_format.decode(blob, SaveSystem._xor_bytes))
+                with SaveSystem.write_lock:
+                    SaveSystem._section_blocks.pop(SaveSystem.SAVE_FILE, None)
+                return True
                 
-            state.from_dict(decrypted_data)
-            return True
+            # Legacy JSON save
+            state.from_dict(SaveSystem._decode_legacy(blob))
         except Exception as e:
             print(f"Failed to load save: {e}")
             return False
+            
+        # Keep a copy, then rewrite in binary with save_game. The file is only
+        # replaced (atomically, by _write_file) once encoding succeeded, so if
+        # it fails the JSON save is still there (and migrated on the next load).
+        try:
+            SaveSystem._write_file(SaveSystem.SAVE_FILE + ".legacy", blob)
+            SaveSystem.save_game(state)
+        except Exception as e:
+            print(f"Failed to convert legacy save: {e}")
+        return True
+
+    @staticmethod
+    def _decode_legacy(blob):
+        encrypted_data = json.loads(blob.decode("utf-8"))
+        
+        decrypted_data = {}
+        for key, value in encrypted_data.items():
+            decrypted_str = SaveSystem.decrypt_value(value)
+            decrypted_data[key] = json.loads(decrypted_str)
+            
+        return decrypted_data
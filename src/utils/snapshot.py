@@ -0,0 +1,61 @@
+import copy
+import json
+import os
+import zlib
+
+# Bumped when the snapshot layout changes; older snapshots are ignored.
+SNAPSHOT_VERSION = 1
+
+def _is_plain(value):
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return True
+    if isinstance(value, (list, tuple)):
+        return all(_is_plain(v) for v in value)
+    if isinstance(value, dict):
+        return all(isinstance(k, str) and _is_plain(v) for k, v in value.items())
+    return False
+
+def capture(obj, skip=()):
+    """
+    Copies the plain-data attributes of a manager (numbers, strings, lists...).
+    References to other objects (game, state, sprites, sub-managers) are
+    skipped; they are rebuilt by the owner on restore. `skip` names optional
+    references that may currently be None.
+    """
+    return {name: copy.deepcopy(value) for name, value in vars(obj).items()
+            if name not in skip and _is_plain(value)}
+
+def restore(obj, data):
+    """Writes attributes captured by capture() back onto a manager."""
+    for name, value in data.items():
+        setattr(obj, name, copy.deepcopy(value))
+
+def dumps(snapshot):
+    """Snapshot dict -> compact bytes."""
+    return zlib.compress(json.dumps(snapshot, separators=(",", ":")).encode("utf-8"))
+
+def loads(blob):
+    """Bytes from dumps() -> snapshot dict. Returns None if unusable."""
+    try:
+        snapshot = json.loads(zlib.decompress(blob).decode("utf-8"))
+    except (zlib.error, ValueError):
+        return None
+    if not isinstance(snapshot, dict) or snapshot.get("version") != SNAPSHOT_VERSION:
+        return None
+    return snapshot
+
+def write_snapshot(path, snapshot):
+    """Atomically writes a snapshot file (tmp + fsync + rename)."""
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(dumps(snapshot))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+def read_snapshot(path):
+    """Reads a snapshot file. Returns None if missing or unusable."""
+    if not os.path.exists(path):
+        return None
+    with open(path, "rb") as f:
+        return loads(f.read())
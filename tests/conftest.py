@@ -0,0 +1,39 @@
+import os
+import random
+from types import SimpleNamespace
+import numpy as np
+import pygame
+import pytest
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+pygame.init()
+
+from src.engine import assets
+from src.engine.lcd import LEVELS, TRANSPARENT, indexed_surface
+from src.utils.save_system import SaveSystem
+
+def placeholder_sprite(path):
+    """Grey level noise standing in for a sprite file (the same for the same name)."""
+    rnd = random.Random(os.path.basename(path))
+    size = (30, 32) if "map" in path else (rnd.choice((8, 12, 16, 30)), rnd.choice((8, 16, 32)))
+    indices = np.array([rnd.choice((0, LEVELS - 1, LEVELS // 2, TRANSPARENT)) for _ in range(size[0] * size[1])],
+                       dtype=np.uint8).reshape(size)
+    sprite = indexed_surface(size)
+    pygame.surfarray.blit_array(sprite, indices)
+    return sprite
+
+@pytest.fixture
+def game_dir(tmp_path, monkeypatch):
+    """
+    Runs the game from tmp_path, so its save files land there, with a
+    placeholder for every sprite (the Sprites directory isn't in the repo).
+    """
+    monkeypatch.chdir(tmp_path)
+    # Save paths are relative: blocks cached by another test would be reused
+    monkeypatch.setattr(SaveSystem, "_section_blocks", {})
+    monkeypatch.setattr(SaveSystem, "SAVE_FILE", SaveSystem.SAVE_FILE)
+    monkeypatch.setattr(SaveSystem, "JOURNAL_FILE", SaveSystem.JOURNAL_FILE)
+    sprites = SimpleNamespace(join=os.path.join, exists=lambda path: True)
+    monkeypatch.setattr(assets, "os", SimpleNamespace(path=sprites))
+    monkeypatch.setattr(assets.AssetManager, "_load_image", lambda self, path: placeholder_sprite(path))
+    return tmp_path
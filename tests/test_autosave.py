@@ -0,0 +1,38 @@
+from src.game.dtector import DtectorGame
+from src.game.state import GameState
+from src.utils import save_format
+from src.utils.autosave import AutoSaver
+from src.utils.save_system import SaveSystem
+
+def read_save(path):
+    with open(path, "rb") as f:
+        return save_format.decode(f.read(), SaveSystem._xor_bytes)
+
+def test_failed_write_is_retried(game_dir, monkeypatch):
+    state = GameState()
+    saver = AutoSaver(state, interval=60.0)
+    write_save = SaveSystem.write_save
+    def fail_once(data, path=None):
+        monkeypatch.setattr(SaveSystem, "write_save", write_save)
+        raise OSError("disk full")
+    monkeypatch.setattr(SaveSystem, "write_save", fail_once)
+    
+    state.game_progress["steps"] = 7
+    saver.request()
+    saver.flush() # Fails
+    state.config["resolution"] = 2
+    state.mark_dirty("config")
+    saver.request()
+    saver.stop() # Writes both changes
+    
+    saved = read_save(saver.path)
+    assert saver.writes == 1
+    assert saved["game_progress"]["steps"] == 7
+    assert saved["config"]["resolution"] == 2
+
+def test_shutdown_writes_changed_sections(game_dir):
+    game = DtectorGame(seed=1)
+    game.state.config["grid_enabled"] = not game.state.config["grid_enabled"]
+    game.state.mark_dirty("config")
+    game.shutdown()
+    assert read_save(SaveSystem.SAVE_FILE)["config"] == game.state.config
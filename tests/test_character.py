@@ -0,0 +1,34 @@
+from src.game.character import CharacterManager, SPIRIT_BASE_ID
+from src.game.state import GameState
+
+def spirit_stats(state, spirit_idx):
+    digimon = state.digimon_database[SPIRIT_BASE_ID + spirit_idx]
+    return (digimon["hp"], digimon["energy"], digimon["crunch"], digimon["ability"])
+
+def test_starting_stats_give_database_stats():
+    state = GameState()
+    CharacterManager(state).calculate_spirit_stats()
+    assert [spirit_stats(state, s) for s in range(12)] == [(100, 10, 10, 10)] * 12
+    assert not state.changed_chars
+
+def test_only_changed_characters_are_recomputed():
+    state = GameState()
+    manager = CharacterManager(state)
+    manager.calculate_spirit_stats()
+    
+    # J.P. levels up; Kumamon's entry is edited behind the manager's back
+    jp = state.char_stats[2]
+    jp["hp"] += 2
+    jp["stamina"] += 1
+    state.digimon_database[SPIRIT_BASE_ID + 8]["hp"] = 1
+    manager.mark_stats_changed(2)
+    manager.calculate_spirit_stats()
+    
+    assert spirit_stats(state, 4) == (102, 10, 11, 10) # Beetlemon
+    assert spirit_stats(state, 5) == (102, 10, 11, 10) # MetalKabuterimon
+    assert spirit_stats(state, 8) == (1, 10, 10, 10)   # Not J.P.'s: left alone
+    
+    # Nothing flagged: nothing recomputed
+    state.digimon_database[SPIRIT_BASE_ID + 4]["hp"] = 1
+    manager.calculate_spirit_stats()
+    assert spirit_stats(state, 4) == (1, 10, 11, 10)
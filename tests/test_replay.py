@@ -0,0 +1,68 @@
+import random
+import pygame
+from src.engine.core import Engine
+from src.engine.recorder import InputRecorder, InputReplay
+from src.engine.resolution import NATIVE_SIZE
+
+TICK = 0.016 # Recordings keep frame times in whole milliseconds
+
+def press(key):
+    return [pygame.event.Event(pygame.KEYDOWN, key=key, mod=0),
+            pygame.event.Event(pygame.KEYUP, key=key, mod=0)]
+
+def record(path, inputs, autosave=False):
+    """
+    Plays `inputs` (the events of each tick) the way main.py does, drawing
+    every frame, and saves the recording. Returns the engine.
+    """
+    engine = Engine(pygame.Surface(NATIVE_SIZE), seed=5, autosave=autosave)
+    recorder = InputRecorder(engine.game)
+    for events in inputs:
+        for event in events:
+            recorder.record_event(event)
+            engine.handle_input(event)
+        engine.update(TICK)
+        recorder.record_frame(TICK)
+        engine.draw()
+    recorder.save(path, engine.game)
+    return engine
+
+def replay_fast(path):
+    """Plays a recording back like main.py --replay --fast: no draws, no autosave."""
+    recording = InputReplay(path)
+    engine = Engine(pygame.Surface(NATIVE_SIZE), autosave=False)
+    recording.start_game(engine.game)
+    for delta_time, events in recording.frames():
+        for event in events:
+            engine.handle_input(event)
+        engine.update(delta_time)
+    return recording, engine
+
+def walk_to_battle(engine_ticks=120):
+    """Inputs stepping until the first encounter (a battle), then watching its start animation."""
+    return [press(pygame.K_SPACE) if tick % 2 == 0 else [] for tick in range(200)] + [[]] * engine_ticks
+
+def test_fast_replay_through_battle_start(game_dir):
+    path = str(game_dir / "battle.rec")
+    live = record(path, walk_to_battle())
+    assert live.game.battle_manager is not None
+    recording, replayed = replay_fast(path)
+    
+    # Drawing the start animation must not leave anything in the battle's state
+    assert replayed.game.snapshot()["battle"] == live.game.snapshot()["battle"]
+    assert recording.matches(replayed.game)
+
+def wander(ticks=6000):
+    """Inputs of a player mashing the D-Tector's keys: menus, the map, walking and battles."""
+    rnd = random.Random(1)
+    keys = (pygame.K_LEFT, pygame.K_RIGHT, pygame.K_UP, pygame.K_DOWN) + (pygame.K_SPACE,) * 8
+    return [press(rnd.choice(keys)) if rnd.random() < 0.2 else [] for _ in range(ticks)]
+
+def test_replay_matches_recorded_session(game_dir):
+    path = str(game_dir / "session.rec")
+    # With autosave, like a real session: the journal only advances while recording
+    live = record(path, wander(), autosave=True)
+    live.shutdown()
+    assert live.game.battle_manager is not None # Ends mid-battle, after the map and menus
+    recording, replayed = replay_fast(path)
+    assert recording.matches(replayed.game)